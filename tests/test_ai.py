@@ -0,0 +1,59 @@
+"""컴퓨터 플레이어: 시간 예산을 지키고, 언제나 둘 수 있는 행동 중 하나를 고른다."""
+import random
+import time
+
+import pytest
+
+from yutnori.ai import YutAI
+from yutnori.fastsim import FastGame
+
+BUDGET = 0.03
+
+
+def midgame(seed):
+    """무작위로 몇 턴 둔 뒤 차례인 플레이어에게 둘 수 있는 행동이 있는 국면."""
+    rng = random.Random(seed)
+    game = FastGame()
+    moves = rng.randrange(4, 40)
+    while True:
+        if not any(game.pending) and not game.throw(rng):
+            game.pending[:] = (0, 0, 0, 0, 0, 0)
+            game.player = 1 - game.player
+            continue
+        n = game.legal_actions()
+        if n and moves <= 0:
+            return game
+        if not n:
+            game.pending[:] = (0, 0, 0, 0, 0, 0)
+            game.player = 1 - game.player
+            continue
+        moves -= 1
+        snapshot = game.copy()
+        result = game.apply(game.actions[rng.randrange(n)])
+        if result == 2:
+            return snapshot  # 끝나기 직전 국면을 쓴다
+        if result == 1:
+            game.throw(rng)
+        elif not any(game.pending):
+            game.player = 1 - game.player
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('max_depth', [4, 0])  # 0: 바로 MCTS
+def test_choose_returns_a_legal_action_within_budget(seed, max_depth):
+    game = midgame(seed)
+    before = (game.pos[:], game.grp[:], game.pending[:], game.player)
+    legal = game.actions[:game.legal_actions()]
+    ai = YutAI(budget=BUDGET, max_depth=max_depth, seed=seed)
+    t0 = time.perf_counter()
+    action = ai.choose(game)
+    elapsed = time.perf_counter() - t0
+    assert action in legal
+    assert elapsed < BUDGET + 0.05, ai.last_info
+    assert (game.pos, game.grp, game.pending, game.player) == before  # 탐색은 복사본에서만
+
+
+def test_no_legal_action_is_a_clear_error():
+    game = FastGame()  # 던지기 전: 남은 결과가 없다
+    with pytest.raises(ValueError, match='행동'):
+        YutAI(budget=BUDGET, max_depth=0).choose(game)
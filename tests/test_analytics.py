@@ -0,0 +1,96 @@
+"""게임 통계: merge 는 순서와 묶음에 상관없고, to_dict/from_dict 는 왕복하며, 판 수를 나눠 읽어도 같게 센다."""
+import random
+
+import pytest
+
+from yutnori.analytics import GameStats, HyperLogLog, analyze_record, simulated_events
+from yutnori.record import MOVE, PASS, START, THROW, RecordWriter
+
+
+def stats_of(n_games, seed):
+    stats = GameStats()
+    stats.consume(simulated_events(n_games, random.Random(seed)))
+    return stats
+
+
+def copy(stats):
+    return GameStats.from_dict(stats.to_dict())
+
+
+@pytest.fixture(scope='module')
+def parts():
+    return [stats_of(n, seed) for n, seed in ((6, 1), (4, 2), (5, 3))]
+
+
+def test_merge_is_associative_and_commutative(parts):
+    a, b, c = parts
+    left = copy(a).merge(copy(b)).merge(copy(c)).to_dict()
+    right = copy(a).merge(copy(b).merge(copy(c))).to_dict()
+    assert left == right
+    assert copy(a).merge(copy(b)).to_dict() == copy(b).merge(copy(a)).to_dict()
+    assert copy(c).merge(copy(a)).merge(copy(b)).to_dict() == left
+    assert left['games'] == 15
+
+
+def test_to_dict_round_trip(parts):
+    stats = parts[0]
+    again = GameStats.from_dict(stats.to_dict())
+    assert again.to_dict() == stats.to_dict()
+    assert again.summary() == stats.summary()
+    again.merge(copy(stats))
+    assert again.to_dict() != stats.to_dict()  # 복사본을 합쳐도 원래 집계는 그대로
+    assert again.games == 2 * stats.games
+
+
+def test_from_dict_accepts_only_declared_fields(parts):
+    raw = parts[0].to_dict()
+    for name in ('merge', 'summary', 'surprise'):
+        with pytest.raises(ValueError, match=name):
+            GameStats.from_dict(dict(raw, **{name: 1}))
+    assert GameStats.from_dict({'games': 3}).games == 3  # 빠진 이름은 빈 값
+
+
+@pytest.mark.parametrize('n', [500, 20000])
+def test_hyperloglog_within_error_bound(n):
+    hll = HyperLogLog()
+    for i in range(n):
+        hll.add(i.to_bytes(4, 'little'))
+        hll.add(i.to_bytes(4, 'little'))  # 같은 값은 한 번만 센다
+    bound = 1.04 / len(hll.registers) ** 0.5
+    assert abs(hll.estimate() - n) <= 4 * bound * n
+
+
+def write(rec, events):
+    for kind, a, b in events:
+        if kind == START:
+            rec.begin_game(a, b)
+        elif kind == THROW:
+            rec.throw(a)
+        elif kind == MOVE:
+            rec.move(a, b)
+        elif kind == PASS:
+            rec.pass_turn()
+        else:
+            rec.end_game(a)
+
+
+def test_unfinished_game_at_chunk_boundary(tmp_path):
+    # 판 0, 2 는 끝나고 판 1 은 END 없이 끊겼다 (다음 START 가 바로 온다)
+    events = list(simulated_events(2, random.Random(5)))
+    second = [i for i, e in enumerate(events) if e[0] == START][1]
+    path = str(tmp_path / 'cut.yut')
+    with RecordWriter(path) as rec:
+        write(rec, events[:second])
+        write(rec, events[:5])
+        write(rec, events[second:])
+    for chunk in (1, 2, 3):
+        stats = analyze_record(path, workers=1, chunk=chunk)
+        assert (stats.games, stats.unfinished) == (2, 1), chunk
+
+    # max_games 판째에서 멈추면 다음 판의 START 는 읽지 않은 것으로 본다
+    stats = GameStats()
+    assert stats.consume(events[:second] + events[:5] + events[second:], max_games=2) == 2
+    assert (stats.games, stats.unfinished) == (1, 1)
+    stats = GameStats()
+    assert stats.consume(events[:second] + events[:5], max_games=2) == 2
+    assert (stats.games, stats.unfinished) == (1, 1)
@@ -0,0 +1,114 @@
+"""애니메이션 스케줄러를 가짜 시계 / 가짜 after() / 가짜 캔버스로 시험한다 (화면 없이)."""
+import pytest
+
+from yutnori.animation import FPS, Animation, Animator, PathTween, Pulse
+
+FRAME = 1 / FPS
+
+
+class Clock:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+class Widget:
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id)
+
+    def run_one(self):
+        (after_id, callback), = self.pending.items()
+        del self.pending[after_id]
+        callback()
+
+
+class Canvas:
+    def __init__(self):
+        self.moved = [0.0, 0.0]
+        self.boxes = []
+        self.config = {}
+
+    def move(self, tag, dx, dy):
+        self.moved[0] += dx
+        self.moved[1] += dy
+
+    def coords(self, item, *xy):
+        self.boxes.append(xy)
+
+    def itemconfigure(self, item, **kw):
+        self.config.update(kw)
+
+    def tag_raise(self, item):
+        pass
+
+
+def test_path_tween_passes_each_point_and_ends_on_the_last():
+    canvas, done = Canvas(), []
+    tween = PathTween(canvas, 'p', (0, 0), [(10, 0), (10, 10)], step_ms=100, on_done=lambda: done.append(1))
+    tween.start = 0.0
+    assert tween.step(0.1)
+    assert canvas.moved == pytest.approx([10, 0])
+    assert tween.step(0.15)
+    assert canvas.moved == pytest.approx([10, 5])  # smoothstep 의 가운데
+    assert not tween.step(0.5)
+    assert canvas.moved == pytest.approx([10, 10]) and done == [1]
+
+
+def test_pulse_grows_from_r0_to_r1_then_hides():
+    canvas = Canvas()
+    pulse = Pulse(canvas, 1, 50, 50, 'red', r0=10, r1=30, duration_ms=200)
+    pulse.start = 0.0
+    assert pulse.step(0.0)
+    assert canvas.boxes[-1] == (40, 40, 60, 60)
+    assert not pulse.step(0.3)
+    assert canvas.boxes[-1] == (20, 20, 80, 80)
+    assert canvas.config['state'] == 'hidden'
+
+
+def test_late_frames_are_counted_and_skipped():
+    clock, widget = Clock(), Widget()
+    animator = Animator(widget, clock=clock)
+    anim = animator.add(Animation(1000))
+    widget.run_one()
+    assert (animator.frames, animator.dropped) == (1, 0)
+    clock.t += FRAME
+    widget.run_one()
+    assert animator.dropped == 0
+    # 3.5 프레임 늦으면 3 프레임을 건너뛴 것으로 세고, 지금 시각의 모양으로 바로 간다
+    clock.t += FRAME + 3.5 * FRAME
+    widget.run_one()
+    assert animator.dropped == 3 and animator.frames == 3
+    clock.t = anim.start + 2.0
+    widget.run_one()
+    assert anim.done and not animator.busy()
+    assert widget.pending == {}  # 돌릴 것이 없으면 after 도 예약하지 않는다
+
+
+def test_over_budget_animations_are_deferred_to_the_next_frame():
+    clock, widget = Clock(), Widget()
+    animator = Animator(widget, budget_ms=8, clock=clock)
+    steps = []
+
+    class Slow(Animation):
+        def update(self, t):
+            steps.append(self)
+            clock.t += 0.010  # 혼자 예산을 넘긴다
+
+    first, second = animator.add(Slow(1000)), animator.add(Slow(1000))
+    widget.run_one()
+    assert steps == [first] and animator.deferred == 1
+    widget.run_one()
+    assert steps == [first, second]  # 미룬 것이 다음 프레임 맨 앞
+    animator.finish_all()
+    assert first.done and second.done and widget.pending == {}
@@ -0,0 +1,71 @@
+"""bench.compare 의 회귀 판정, compare 명령의 종료 코드, run 이 남기는 JSON 모양."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from yutnori import bench
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def report(commit, **medians):
+    return {'meta': {'commit': commit},
+            'results': {name: {'median': v, 'min': v, 'mean': v} for name, v in medians.items()}}
+
+
+def rows_by_name(rows):
+    return {name: (a, b, ratio, regressed) for name, a, b, ratio, regressed in rows}
+
+
+def test_compare_flags_only_slowdowns_past_the_threshold():
+    old = report('a', slower=1.0, noise=1.0, faster=1.0, gone=1.0)
+    new = report('b', slower=1.2, noise=1.05, faster=0.5, added=9.0)
+    rows = rows_by_name(bench.compare(old, new, threshold=0.10))
+    assert set(rows) == {'slower', 'noise', 'faster'}  # 한쪽에만 있는 항목은 뺀다
+    assert rows['slower'][3] is True and rows['slower'][2] == pytest.approx(1.2)
+    assert rows['noise'][3] is False
+    assert rows['faster'][3] is False
+
+
+def test_compare_zero_baseline():
+    rows = rows_by_name(bench.compare(report('a', same=0.0, grew=0.0), report('b', same=0.0, grew=1e-6)))
+    assert rows['same'][2:] == (1.0, False)
+    assert rows['grew'][2] == float('inf') and rows['grew'][3] is True
+
+
+def test_compare_uses_the_requested_stat():
+    old, new = report('a', x=1.0), report('b', x=1.0)
+    new['results']['x']['median'] = 2.0
+    assert bench.compare(old, new, stat='min')[0][4] is False
+    assert bench.compare(old, new, stat='median')[0][4] is True
+
+
+@pytest.mark.parametrize('new_median, code', [(1.0, 0), (1.5, 1)])
+def test_compare_cli_exit_code(tmp_path, new_median, code):
+    old, new = tmp_path / 'old.json', tmp_path / 'new.json'
+    old.write_text(json.dumps(report('a', x=1.0)))
+    new.write_text(json.dumps(report('b', x=new_median)))
+    out = subprocess.run([sys.executable, '-m', 'yutnori.bench', 'compare', str(old), str(new)],
+                         cwd=ROOT, capture_output=True, text=True)
+    assert out.returncode == code, out.stderr
+    assert f"{code} regression(s)" in out.stdout
+
+
+def test_quick_throw_run_writes_the_report_schema(tmp_path):
+    path = tmp_path / 'bench.json'
+    subprocess.run([sys.executable, '-m', 'yutnori.bench', 'run', '--quick', '--only', 'throw',
+                    '--out', str(path)], cwd=ROOT, capture_output=True, check=True)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert set(data) == {'meta', 'results', 'skipped'}
+    assert {'commit', 'python', 'platform', 'time', 'quick'} <= set(data['meta'])
+    assert data['meta']['quick'] is True
+    assert set(data['results']) == {'throw_yut', 'throw_batch[per throw]'}
+    for result in data['results'].values():
+        assert result['unit'] == 's/op' and result['repeat'] == 3
+        assert 0 < result['min'] <= result['median']
+        assert result['ops_per_sec'] == pytest.approx(1 / result['median'])
+    # 자기 자신과 비교하면 회귀가 없다
+    assert not [row for row in bench.compare(data, data) if row[4]]
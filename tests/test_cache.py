@@ -0,0 +1,157 @@
+"""PokemonCache: 저장/만료/깨진 기록, URL 별 분리, 경로 탈출, LRU 정리, 동시 쓰기."""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from yutnori.cache import PokemonCache
+
+URL = "http://example.test/pokemon/pikachu/"
+DATA = {'korean_name': '피카츄', 'sprite_data': b'\x89PNG fake'}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PokemonCache(str(tmp_path))
+
+
+def test_round_trip(cache):
+    cache.put('pikachu', URL, DATA)
+    assert cache.get('pikachu', URL) == DATA
+    assert cache.get('Pikachu', URL) == DATA
+
+
+def test_other_source_url_is_a_miss(cache):
+    cache.put('pikachu', URL, DATA)
+    assert cache.get('pikachu', "http://other.test/pokemon/pikachu/") is None
+
+
+def test_expired_record_only_when_stale_allowed(cache):
+    cache.put('pikachu', URL, DATA)
+    cache.ttl = -1
+    assert cache.get('pikachu', URL) is None
+    assert cache.get('pikachu', URL, allow_stale=True) == DATA
+
+
+@pytest.mark.parametrize('record', [
+    b'{not json',
+    b'[]',
+    b'"text"',
+    json.dumps({'korean_name': '피카츄'}).encode(),
+    json.dumps({'korean_name': '피카츄', 'sprite': None}).encode(),
+    json.dumps({'korean_name': None, 'sprite': None, 'fetched_at': 0}).encode(),
+    json.dumps({'korean_name': '피카츄', 'sprite': 5, 'fetched_at': 0}).encode(),
+    json.dumps({'korean_name': '피카츄', 'sprite': None, 'fetched_at': 'yesterday'}).encode(),
+])
+def test_malformed_record_is_a_miss(cache, record):
+    cache.put('pikachu', URL, DATA)
+    path = cache._record_path('pikachu', URL)
+    with open(path, 'wb') as f:
+        f.write(record)
+    assert cache.get('pikachu', URL) is None
+    assert cache.get('pikachu', URL, allow_stale=True) is None
+
+
+def test_missing_blob_is_a_miss(cache):
+    cache.put('pikachu', URL, DATA)
+    blobs = os.path.join(cache.path, 'blobs')
+    for name in os.listdir(blobs):
+        os.unlink(os.path.join(blobs, name))
+    assert cache.get('pikachu', URL) is None
+
+
+@pytest.mark.parametrize('name', ['../../escape', '/etc/passwd', 'a/b', '..', 'Mr. Mime', ''])
+def test_record_path_stays_in_pokemon_dir(cache, name):
+    path = cache._record_path(name, URL)
+    assert os.path.dirname(path) == os.path.join(cache.path, 'pokemon')
+    cache.put(name, URL, DATA)
+    assert cache.get(name, URL) == DATA
+
+
+def test_names_that_slug_alike_do_not_collide(cache):
+    cache.put('a/b', URL, DATA)
+    cache.put('a-b', URL, {'korean_name': '다른', 'sprite_data': None})
+    assert cache.get('a/b', URL) == DATA
+    assert cache.get('a-b', URL)['korean_name'] == '다른'
+
+
+def test_eviction_drops_least_recently_read_first(tmp_path):
+    cache = PokemonCache(str(tmp_path), max_bytes=1 << 30)
+    names = [f'mon{i}' for i in range(6)]
+    for i, name in enumerate(names):
+        cache.put(name, URL, {'korean_name': name, 'sprite_data': bytes([i]) * 1000})
+    # 쓴 순서와 다르게 읽은 시각을 준다: mon3, mon0 이 가장 오래 전에 읽혔다
+    now = time.time()
+    for age, name in enumerate(['mon3', 'mon0', 'mon5', 'mon1', 'mon4', 'mon2']):
+        blob = hashlib.sha256(bytes([int(name[3:])]) * 1000).hexdigest()
+        for path in (cache._record_path(name, URL), cache._blob_path(blob)):
+            os.utime(path, (now - 100 + age, now - 100 + age))
+    sizes = sum(e.stat().st_size for sub in ('pokemon', 'blobs') for e in os.scandir(tmp_path / sub))
+    cache.max_bytes = sizes - 1500  # 두 마리 분량만 넘친다
+    cache.evict()
+    assert cache.get('mon3', URL) is None and cache.get('mon0', URL) is None
+    for name in ('mon5', 'mon1', 'mon4', 'mon2'):
+        assert cache.get(name, URL)['korean_name'] == name
+
+
+class Loader:
+    """PokemonLoader 대신: 받은 척하고 바로 cache.put 한다."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def load_all(self, names):
+        out = {}
+        for name in names:
+            self.cache.put(name, URL, {'korean_name': name, 'sprite_data': None})
+            out[name] = Future()
+            out[name].set_result(None)
+        return out
+
+
+def test_warm_evicts_once_per_batch(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(cache, 'evict', lambda: calls.append(1))
+    cache.warm([f'mon{i}' for i in range(20)], loader=Loader(cache))
+    assert len(calls) == 1
+    cache.put('pikachu', URL, DATA)
+    assert len(calls) == 2
+
+
+def test_concurrent_writers_never_leave_a_partial_record(cache):
+    payloads = [{'korean_name': f'피카츄{i}' * 200, 'sprite_data': bytes([i]) * 5000} for i in range(8)]
+    stop = threading.Event()
+    seen, errors = [], []
+
+    def write(data):
+        try:
+            for _ in range(30):
+                cache.put('pikachu', URL, data)
+        except Exception as e:  # noqa: BLE001 — 스레드 안의 실패를 본 스레드로 옮긴다
+            errors.append(e)
+
+    def read():
+        while not stop.is_set():
+            got = cache.get('pikachu', URL)
+            if got is not None:
+                seen.append(got)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    writers = [threading.Thread(target=write, args=(data,)) for data in payloads]
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    stop.set()
+    reader.join()
+    assert not errors
+    # 읽은 것은 언제나 누군가 통째로 쓴 것이고, 임시 파일은 남지 않는다
+    assert seen and all(got in payloads for got in seen)
+    assert cache.get('pikachu', URL) in payloads
+    for sub in ('pokemon', 'blobs'):
+        assert not [n for n in os.listdir(os.path.join(cache.path, sub)) if n.startswith('.tmp-')]
@@ -0,0 +1,96 @@
+"""fastsim 이 YutnoriGameLogic 과 같은 규칙으로 두는지: 엔진으로 둔 무작위 게임의 매 이벤트를 따라가며 비교한다."""
+import random
+
+from yutnori.analytics import simulated_events
+from yutnori.engine import YutnoriGameLogic
+from yutnori.fastsim import BACKDO, DONE, OFF, PIECES, FastGame, from_logic, random_policy, simulate
+from yutnori.record import MOVE, PASS, START, THROW
+from yutnori.throws import THROW16, YUT, YUT_NAMES
+
+
+def groups(game):
+    # 그룹 번호는 대표 말에 따라 다를 수 있으니 어떤 말들이 함께 업혔는지로 비교한다
+    return sorted({tuple(j for j, h in enumerate(game.grp) if h == g) for g in game.grp})
+
+
+def test_moves_and_throws_match_engine():
+    logic = None
+    throws = moves = 0
+    for kind, a, b in simulated_events(300, random.Random(11)):
+        if kind == START:
+            logic = YutnoriGameLogic(a, b)
+        elif kind == THROW:
+            game = from_logic(logic)
+            ends_turn = a == BACKDO and not game.has_entered(game.player)
+            assert logic.play_throw(YUT_NAMES[a]) == ends_turn
+            throws += 1
+        elif kind == MOVE:
+            game = from_logic(logic)
+            result = game.apply((game.player * PIECES + a) * 8 + b)
+            outcome = logic.play_move(logic.get_current_player()['pieces'][a], YUT_NAMES[b])
+            after = from_logic(logic)
+            assert (game.pos, groups(game)) == (after.pos, groups(after))
+            assert result == (2 if outcome['won'] else int(outcome['captured']))
+            moves += 1
+        elif kind == PASS:
+            logic.pass_turn()
+    assert throws > 1000 and moves > 1000
+
+
+def test_finished_pieces_keep_backdo():
+    # GUI 규칙: 다 들어간 말도 판에 올라온 말로 센다 → 빽도를 쌓아 두고 턴은 이어진다 (양쪽 모두)
+    logic = YutnoriGameLogic()
+    piece = logic.players[0]['pieces'][0]
+    piece.onBoard, piece.node_id = True, -2
+    game = from_logic(logic)
+    assert game.pos[0] == DONE and game.has_entered(0)
+    assert logic.play_throw('빽도') is False
+    assert logic.current_player_index == 0 and logic.turn_moves == ['빽도']
+
+
+def test_backdo_without_pieces_drops_pending_results():
+    # 판에 말이 없으면 남은 결과가 있어도 빽도로 턴이 끝나고, 남은 결과는 다음 차례로 넘어가지 않는다
+    logic = YutnoriGameLogic()
+    logic.play_throw('윷')
+    assert logic.play_throw('빽도') is True
+    assert logic.current_player_index == 1 and logic.turn_moves == []
+    game = FastGame()
+    game.pending[YUT] = 1
+    rng = random.Random()
+    rng.getrandbits = lambda bits: THROW16.index(BACKDO)
+    assert game.throw(rng) is False
+
+
+def test_simulate_is_seeded():
+    assert simulate(200, seed=3) == simulate(200, seed=3)
+    assert sum(simulate(200, seed=3)) == 200
+
+
+def test_random_fast_path_matches_generic_loop():
+    # 양쪽 다 random_policy 면 run 은 전용 루프로 간다. 정책 호출을 거치는 일반 루프와 분포가 같아야 한다
+    def wrapped(game, actions, n, rng):
+        return random_policy(game, actions, n, rng)
+
+    def stats(policies, seed):
+        rng, game = random.Random(seed), FastGame()
+        wins = turns = 0
+        for _ in range(3000):
+            wins += game.play(policies, rng) == 0
+            turns += game.turns
+        return wins / 3000, turns / 3000
+
+    fast_wins, fast_turns = stats((random_policy, random_policy), 1)
+    slow_wins, slow_turns = stats((wrapped, wrapped), 2)
+    assert abs(fast_wins - slow_wins) < 0.05
+    assert abs(fast_turns - slow_turns) < 0.05 * slow_turns
+
+
+def test_random_fast_path_resumes_pending_results():
+    # 이미 던진 결과가 남은 상태에서 이어 두면 그것부터 쓰고, 끝나면 pending 을 비워 둔다
+    game = FastGame()
+    game.pending[YUT] = 1
+    game.pending[1] = 1
+    winner = game.run((random_policy, random_policy), random.Random(5))
+    assert winner in (0, 1)
+    assert all(game.pos[i] == DONE for i in range(winner * PIECES, winner * PIECES + PIECES))
+    assert game.pending == [0] * 6
@@ -0,0 +1,191 @@
+"""화면 배치 계산 (Tk 창 없이): 플레이어/말 수가 달라도 대기 말이 겹치지 않고, 2인 게임 배치는 그대로다.
+이동 선택 칸은 정해진 버튼 칸에 결과를 채우고, 바뀐 것만 Tk 에 보낸다. 승률은 국면마다 한 번만 계산한다."""
+import itertools
+
+import pytest
+
+pytest.importorskip('tkinter')
+
+from yutnori import gui as G
+from yutnori.engine import YutnoriGameLogic
+
+
+class Bar:
+    def __init__(self):
+        self.states = {}
+
+    def itemconfigure(self, item, state=None):
+        self.states[item] = state
+
+    def coords(self, *args):
+        pass
+
+
+class Label:
+    def config(self, **kw):
+        self.kw = kw
+
+
+class Table:
+    def __init__(self):
+        self.calls = 0
+
+    def win_probability(self, game):
+        self.calls += 1
+        return 0.25
+
+
+class Tasks:
+    """TaskRunner 대신: 일을 받아 두었다가 run() 때 돌린다."""
+
+    def __init__(self):
+        self.queue = []
+
+    def submit(self, work, on_done=None, on_error=None, deadline=None):
+        self.queue.append((work, on_done))
+        return self
+
+    def cancel(self):
+        pass
+
+    def run(self):
+        while self.queue:
+            work, on_done = self.queue.pop(0)
+            on_done(work())
+
+
+def make(n_players, n_pieces):
+    app = object.__new__(G.YutnoriGUI)
+    app.game = YutnoriGameLogic(n_players, n_pieces)
+    app.canvas_size, app.margin = G.BOARD_SIZE, 40
+    app.sprites = None
+    app.fast_compatible = G.supports(app.game)
+    app._layout_players()
+    app.tablebase, app._winner = Table(), None
+    app.tasks, app._winprob_key, app._winprob_task = Tasks(), None, None
+    app.winprob_bar, app.winprob_label = Bar(), Label()
+    app.winprob_items = list(range(n_players))
+    return app
+
+
+def views(app, mode):
+    out = []
+    for pidx, player in enumerate(app.game.players):
+        for idx, piece in enumerate(player['pieces']):
+            if mode == 'done':
+                piece.node_id, piece.onBoard = -2, True
+            view = app._piece_view(pidx, idx, piece)
+            assert view[0] == mode
+            out.append(view[1:3])
+    return out
+
+
+def test_two_player_layout_is_unchanged():
+    app = make(2, 4)
+    waiting = views(app, 'wait')
+    want = [app.norm_to_canvas((0.04 + 0.08 * i, -0.10)) for i in range(4)]
+    want += [app.norm_to_canvas((0.96 - 0.08 * i, -0.10)) for i in range(4)]
+    assert waiting == pytest.approx(want)
+    assert views(app, 'done') == [(690, 60 + p * 120 + i * 25) for p in range(2) for i in range(4)]
+    x, y = app.norm_to_canvas((1, 0))
+    assert app._node_xy(0, 0) == pytest.approx((x - 20, y))
+    assert app._node_xy(1, 0) == pytest.approx((x + 20, y))
+
+
+@pytest.mark.parametrize('n_players, n_pieces', [(2, 4), (3, 5), (4, 6), (4, 9), (6, 3)])
+def test_pieces_never_overlap(n_players, n_pieces):
+    app = make(n_players, n_pieces)
+    for mode, gap in (('wait', 0.08 * G.BOARD_SIZE - 1), ('done', 25)):
+        spots = views(app, mode)
+        for a, b in itertools.combinations(spots, 2):
+            assert max(abs(a[0] - b[0]), abs(a[1] - b[1])) >= gap, (mode, a, b)
+    offsets = {app._node_xy(p, 7) for p in range(n_players)}
+    assert len(offsets) == n_players
+
+
+def test_win_bar_hidden_for_games_the_tablebase_cannot_read():
+    app = make(4, 6)
+    app.update_win_probability()  # from_logic 를 부르면 ValueError
+    assert set(app.winprob_bar.states.values()) == {G.tk.HIDDEN}
+    app = make(2, 4)
+    app.update_win_probability()
+    assert set(app.winprob_bar.states.values()) == {G.tk.NORMAL}
+
+
+def test_win_probability_is_computed_once_per_position_off_the_tk_thread():
+    app = make(2, 4)
+    app.game.turn_moves = ['도', '개']
+    app.update_win_probability()
+    assert app.tablebase.calls == 0 and len(app.tasks.queue) == 1  # 턴 그래프는 러너에서
+    app.tasks.run()
+    assert app.tablebase.calls == 1
+    assert set(app.winprob_bar.states.values()) == {G.tk.NORMAL}
+    for _ in range(5):
+        app.update_win_probability()
+    assert app.tablebase.calls == 1 and not app.tasks.queue
+    app.game.turn_moves = ['개']
+    app.update_win_probability()
+    app.tasks.run()
+    assert app.tablebase.calls == 2
+
+
+class Button:
+    def __init__(self):
+        self.text, self.state, self.calls = "", None, 0
+
+    def config(self, text=None, state=None, **kw):
+        self.text, self.state = text, state
+        self.calls += 1
+
+    def cget(self, key):
+        return self.text
+
+
+def panel(app):
+    app.moves_status = Button()
+    app.move_buttons = [Button() for _ in range(G.MOVE_SLOTS)]
+    app.pass_button = Button()
+    app._button_bg = 'grey'
+    app._slot_moves = [None] * G.MOVE_SLOTS
+    app._slot_views = {}
+    app.widgets_created = app.last_turn_widgets = app._turn_widgets_start = 0
+    app._panel_player = None
+    return app.move_buttons, app.pass_button
+
+
+def test_move_panel_fills_fixed_slots_and_skips_unchanged():
+    app = make(2, 4)
+    buttons, pass_button = panel(app)
+    app.game.players[0]['pieces'][0].onBoard, app.game.players[0]['pieces'][0].node_id = True, 3
+    # 결과 종류가 모두 두 번씩 나와도 종류마다 버튼 하나라 MOVE_SLOTS 칸이면 된다
+    app.game.turn_moves = list(G.YUT_NAMES) * 2
+    app.update_moves_display()
+    assert [b.text for b in buttons] == [f"{n}({G.YUT_MAP[n]}) ×2" for n in G.YUT_NAMES]
+    assert pass_button.state == G.tk.DISABLED
+    calls = [b.calls for b in buttons]
+    app.update_moves_display()
+    assert [b.calls for b in buttons] == calls  # 바뀐 것이 없으면 Tk 에 보내지 않는다
+
+    app.game.players[0]['pieces'][0].onBoard = False
+    app.game.turn_moves = ['빽도']
+    app.update_moves_display()
+    assert all(b.state == G.tk.DISABLED for b in buttons)
+    assert pass_button.text == "턴 넘기기" and pass_button.state == G.tk.NORMAL
+    assert app._slot_moves == [None] * G.MOVE_SLOTS
+
+
+def test_cheat_win_clears_occupancy():
+    app = make(2, 4)
+    app.update_display = app.end_game = lambda: None
+    game = app.game
+    game.turn_moves = ['걸', '도']
+    mine = game.players[0]['pieces']
+    game.move_piece(mine[0], '걸')
+    game.move_piece(mine[1], '걸')  # 업힌 스택
+    game.move_piece(mine[2], '도')
+    app.cheat_win_p1()
+    assert game.check_win_condition()
+    assert game.occupancy == {}
+    # 상대가 그 칸에 가도 아무것도 잡지 않는다
+    game.switch_player()
+    assert game.move_piece(game.players[1]['pieces'][0], '걸') == {'captured': False}
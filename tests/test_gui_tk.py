@@ -0,0 +1,68 @@
+"""실제 Tk 창에서: 같은 화면을 여러 번 그려도 캔버스 아이템이 늘지 않고, 이동 선택 칸은 위젯을 다시 쓴다.
+
+화면(DISPLAY)이 없으면 건너뛴다. 포켓몬은 로컬 가짜 PokeAPI 에서 받는다.
+"""
+import time
+
+import pytest
+
+tk = pytest.importorskip('tkinter')
+
+from yutnori import gui as G
+from yutnori import net
+from yutnori.stubapi import StubServer
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"no display for Tk: {e}")
+    monkeypatch.setenv('YUTNORI_CACHE_DIR', str(tmp_path))
+    monkeypatch.setenv('YUTNORI_TABLEBASE', str(tmp_path / 'missing.bin'))
+    with StubServer() as stub:
+        monkeypatch.setattr(net, 'POKEAPI_URL', stub.env['YUTNORI_POKEAPI_URL'])
+        app = G.YutnoriGUI(master=root)
+        deadline = time.monotonic() + 10
+        while (app._pokemon_pending or not app.sprites_ready) and time.monotonic() < deadline:
+            root.update()
+        try:
+            yield app
+        finally:
+            root.destroy()
+
+
+def test_canvas_item_count_does_not_grow(app):
+    app.update_display()
+    app.update_idletasks()
+    items = len(app.canvas.find_all())
+    piece = app.game.players[0]['pieces'][0]
+    for i in range(40):
+        piece.node_id, piece.onBoard = i % 19 + 1, True
+        app.update_display()
+        assert app.last_frame_stats['items_created'] == 0
+    for _ in range(10):
+        app.update_display()
+        assert app.last_frame_stats == {'items_created': 0, 'pieces_updated': 0}
+    app.update_idletasks()
+    assert len(app.canvas.find_all()) == items
+
+
+def test_move_panel_reuses_its_widgets(app):
+    children = app.moves_frame.winfo_children()
+    created = app.widgets_created
+    assert len(children) == G.MOVE_SLOTS + 2
+    sizes = set()
+    for moves in (['도'], ['윷', '윷', '모', '걸'], list(G.YUT_NAMES) * 3, ['빽도'], []):
+        app.game.turn_moves = list(moves)
+        app.update_moves_display()
+        app.update_idletasks()
+        # 상태 글이 바뀌어도 칸과 상태 줄의 요청 크기는 그대로라 다시 배치할 일이 없다
+        sizes.add((app.moves_status.winfo_reqwidth(), app.moves_frame.winfo_reqwidth(),
+                   app.moves_frame.winfo_reqheight()))
+    assert len(sizes) == 1
+    app.game.switch_player()
+    app.update_moves_display()
+    assert app.moves_frame.winfo_children() == children
+    assert app.widgets_created == created and app.last_turn_widgets == 0
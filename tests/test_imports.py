@@ -0,0 +1,28 @@
+"""import 만으로 느린 모듈(bench.HEAVY_MODULES)을 불러오지 않는다. 새 인터프리터에서 확인한다.
+
+GUI 는 창(tkinter)과 TaskRunner(asyncio, 그리고 asyncio 가 부르는 ssl)만 처음부터 쓴다.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from yutnori.bench import HEAVY_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('module, allowed', [
+    ('yutnori.engine', ()),
+    ('yutnori.fastsim', ()),
+    ('yutnori.record', ()),
+    ('yutnori.gui', ('tkinter', 'asyncio', 'ssl')),
+])
+def test_import_stays_light(module, allowed):
+    if module == 'yutnori.gui':
+        pytest.importorskip('tkinter')
+    code = f"import sys, {module}; print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                         check=True).stdout.split()
+    assert set(out) <= set(allowed)
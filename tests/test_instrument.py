@@ -0,0 +1,79 @@
+"""계측: Tk 의 주기 콜백은 핸들러 지연('tk')에 섞이지 않고, HTTP 왕복은 재시도/리다이렉트가 있어도 한 번씩만 잰다."""
+import time
+
+import pytest
+
+from yutnori import instrument
+from yutnori.net import HTTPPool
+from yutnori.stubapi import StubHandler, StubServer
+from yutnori.tasks import TaskRunner
+
+
+@pytest.fixture
+def recorder():
+    instrument.RECORDER.reset()
+    yield instrument.RECORDER
+    instrument.disable()
+    instrument.RECORDER.reset()
+
+
+class Widget:
+    def after(self, ms, callback):
+        return 1
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def after_style(func):
+    # tkinter.Misc.after 가 콜백을 감싸는 모양 그대로
+    def callit():
+        func()
+    callit.__name__ = func.__name__
+    return callit
+
+
+def test_periodic_tk_callbacks_are_tagged_separately(recorder):
+    tkinter = pytest.importorskip('tkinter')
+
+    def on_click():
+        pass
+
+    runner = TaskRunner(Widget())
+    instrument.enable(targets=(), tk_handlers=True)
+    try:
+        tkinter.CallWrapper(after_style(runner._poll), None, None)()
+        tkinter.CallWrapper(on_click, None, None)()
+        tkinter.CallWrapper(after_style(on_click), None, None)()
+    finally:
+        runner.close()
+    assert recorder.stats('tk')['count'] == 2
+    assert recorder.stats('tk-bg')['count'] == 1
+    assert recorder.categories['tk:TaskRunner._poll'] == 'tk-bg'
+    assert 'tk:test_periodic_tk_callbacks_are_tagged_separately.<locals>.on_click' in recorder.totals
+
+
+class RedirectHandler(StubHandler):
+    # /old 는 /new 로 보낸다
+    def do_GET(self):
+        if self.path == '/old':
+            self.send_response(302)
+            self.send_header('Location', '/new')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        super().do_GET()
+
+
+def test_redirect_counts_each_round_trip_once(recorder):
+    instrument.enable(targets=[t for t in instrument.TARGETS if t[0] == 'yutnori.net'], tk_handlers=False)
+    pool = HTTPPool()
+    with StubServer(RedirectHandler) as stub:
+        host, port = stub.httpd.server_address
+        start = time.perf_counter_ns()
+        assert b'stub' in pool.get(f"http://{host}:{port}/old")
+        elapsed = time.perf_counter_ns() - start
+        pool.close()
+    stats = recorder.stats('net')
+    assert stats['count'] == 2  # 리다이렉트 전과 후, 왕복 두 번
+    assert stats['total_ms'] * 1e6 <= elapsed  # 겹쳐 잰 구간이 없다
@@ -0,0 +1,148 @@
+"""MOVE_TABLE 이 원래의 한 칸씩 걷는 move_piece 와 같은 결과를 내는지, 도달 가능한 모든 상태에서 확인한다."""
+import pytest
+
+from yutnori.board import (
+    BLTR_IDS, CENTER_ID, DIR_BLTR, DIR_OUTER, DIR_TLBR, ID2POS, MOVE_TABLE, NEXTS, START_ID, TL_ID,
+    TLBR_IDS, TR_ID,
+)
+from yutnori.engine import YUT_MAP, YutnoriGameLogic
+
+STEPS = (1, 2, 3, 4, 5, -1)
+
+
+def baseline_move(history, steps):
+    """테이블 이전 move_piece 를 history 하나로 옮긴 것. (도착 노드, 새 history).
+
+    history 가 비어 있으면 판 밖, 도착 노드 -1 은 판 밖, -2 는 완주.
+    """
+    history = list(history)
+    is_starting_move = not history
+    if is_starting_move:
+        history = [START_ID]
+    node = history[-1]
+    if steps == -1:
+        if node == START_ID:
+            return -1, []
+        if len(history) >= 2:
+            history.pop()
+        return history[-1], history
+    is_on_tr_tl_entrance = node in {TR_ID, TL_ID}
+    is_on_center_entrance = node == CENTER_ID
+    for i in range(steps):
+        current_node = node
+        if i == 0 and is_on_tr_tl_entrance:
+            next_node = BLTR_IDS[-2] if current_node == TR_ID else TLBR_IDS[1]
+        elif i == 0 and is_on_center_entrance:
+            next_node = TLBR_IDS[4]
+        elif current_node == CENTER_ID:
+            prev = history[-2] if len(history) >= 2 else None
+            if prev in BLTR_IDS:
+                next_node = BLTR_IDS[2]
+            else:
+                next_node = TLBR_IDS[4]
+        else:
+            options = NEXTS.get(current_node, [])
+            if not options:
+                return -2, history
+            next_node = options[0]
+        history.append(next_node)
+        node = next_node
+        if node == START_ID and not is_starting_move:
+            return -2, history
+    return node, history
+
+
+def reachable_histories():
+    seen = {()}
+    pending = [()]
+    while pending:
+        history = pending.pop()
+        for steps in STEPS:
+            if steps == -1 and not history:
+                continue
+            dest, new_history = baseline_move(history, steps)
+            new_history = tuple(new_history)
+            if dest != -2 and new_history not in seen:
+                seen.add(new_history)
+                pending.append(new_history)
+    return seen
+
+
+HISTORIES = sorted(reachable_histories(), key=lambda h: (len(h), h))
+
+
+def direction_of(history):
+    # 대각선 입구 바로 다음 칸을 지났는지로 진행 방향이 정해진다
+    if BLTR_IDS[-2] in history:
+        return DIR_BLTR
+    if TLBR_IDS[1] in history:
+        return DIR_TLBR
+    return DIR_OUTER
+
+
+def test_every_node_is_reachable():
+    assert {h[-1] for h in HISTORIES if h} == set(range(len(ID2POS)))
+
+
+@pytest.mark.parametrize('steps', STEPS)
+def test_table_matches_baseline_walk(steps):
+    checked = 0
+    for history in HISTORIES:
+        if steps == -1 and not history:
+            continue
+        node = history[-1] if history else -1
+        dest, direction, finished, path = MOVE_TABLE[node, direction_of(history), steps]
+        want_dest, want_history = baseline_move(history, steps)
+        assert (dest, finished) == (want_dest, want_dest == -2), (history, steps)
+        if steps == -1:
+            assert path == ()
+        elif history:
+            assert path == tuple(want_history[len(history):]), (history, steps)
+        else:
+            assert path == tuple(want_history), (history, steps)
+        if dest >= 0:
+            assert direction == direction_of(want_history), (history, steps)
+        checked += 1
+    assert checked >= len(ID2POS)
+
+
+def test_backdo_from_every_node():
+    # 빽도는 history 한 칸 뒤로. 같은 (노드, 방향)이면 어느 길로 왔든 같은 칸으로 돌아간다
+    back = {}
+    for history in HISTORIES:
+        if not history:
+            continue
+        key = (history[-1], direction_of(history))
+        back.setdefault(key, set()).add(baseline_move(history, -1)[0])
+    assert {node for node, _ in back} == set(range(len(ID2POS)))
+    for key, dests in back.items():
+        assert dests == {MOVE_TABLE[key + (-1,)][0]}, key
+
+
+def test_engine_follows_table_over_random_games():
+    import random
+
+    rng = random.Random(0)
+    for _ in range(200):
+        logic = YutnoriGameLogic()
+        histories = {id(p): [] for player in logic.players for p in player['pieces']}
+        for _ in range(300):
+            player = logic.get_current_player()
+            pieces = [p for p in player['pieces'] if not p.is_finished()]
+            if not pieces:
+                break
+            piece = rng.choice(pieces)
+            name = rng.choice(list(YUT_MAP))
+            if name == '빽도' and piece.is_waiting():
+                continue
+            dest, history = baseline_move(histories[id(piece)], YUT_MAP[name])
+            logic.turn_moves = [name]
+            logic.play_move(piece, name)
+            assert piece.node_id == dest
+            for p in (p for pl in logic.players for p in pl['pieces']):
+                # 같이 간(업힌) 말과 잡혀서 나간 말의 history 도 맞춘다
+                if p.node_id == dest and dest >= 0:
+                    histories[id(p)] = list(history)
+                elif p.is_waiting():
+                    histories[id(p)] = []
+            logic.current_player_index = rng.randrange(2)
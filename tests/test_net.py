@@ -0,0 +1,140 @@
+"""PokemonLoader / HTTPPool 을 로컬 가짜 PokeAPI(stubapi.StubServer)에 붙여 시험한다."""
+import json
+import threading
+
+import pytest
+
+from yutnori import net
+from yutnori.stubapi import StubHandler, StubServer
+
+
+class CountingHandler(StubHandler):
+    paths = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.paths.append(self.path)
+        super().do_GET()
+
+
+class ClosingHandler(CountingHandler):
+    # keep-alive 라고 해 놓고 응답 뒤에 연결을 닫는다 → 다음 요청은 죽은 연결에 간다
+    def do_GET(self):
+        super().do_GET()
+        self.close_connection = True
+
+
+class BrokenSpeciesHandler(StubHandler):
+    def do_GET(self):
+        if self.path.startswith('/species/'):
+            body = json.dumps({'names': 'not a list'}).encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            super().do_GET()
+
+
+@pytest.fixture
+def stub(monkeypatch, request):
+    handler = getattr(request, 'param', CountingHandler)
+    handler.paths = []
+    with StubServer(handler) as server:
+        monkeypatch.setattr(net, 'POKEAPI_URL', server.env['YUTNORI_POKEAPI_URL'])
+        server.base = server.env['YUTNORI_POKEAPI_URL'].split('/pokemon/')[0]
+        yield server
+
+
+def test_load_all_fills_names_and_sprites(stub):
+    loader = net.PokemonLoader(max_workers=4)
+    try:
+        results = {name: f.result(timeout=10) for name, f in loader.load_all(['pikachu', 'mudkip']).items()}
+    finally:
+        loader.close()
+    assert results['pikachu']['korean_name'] == 'PIKACHU'
+    assert results['mudkip']['sprite_data'].startswith(b'\x89PNG')
+
+
+def test_same_name_and_url_are_requested_once(stub):
+    loader = net.PokemonLoader(max_workers=4)
+    try:
+        futures = loader.load_all(['pikachu', 'pikachu', 'mudkip', 'pikachu'])
+        assert list(futures) == ['pikachu', 'mudkip']
+        for f in futures.values():
+            f.result(timeout=10)
+        assert loader.fetch(f"{stub.base}/sprite/pikachu.png") is loader.fetch(f"{stub.base}/sprite/pikachu.png")
+    finally:
+        loader.close()
+    # 포켓몬마다 본문 / species / 스프라이트 한 번씩
+    assert sorted(CountingHandler.paths) == sorted(
+        f"/{kind}/{name}{suffix}" for name in ('pikachu', 'mudkip')
+        for kind, suffix in (('pokemon', '/'), ('species', '/'), ('sprite', '.png')))
+
+
+def test_keep_alive_connection_is_reused(stub):
+    pool = net.HTTPPool()
+    try:
+        for _ in range(5):
+            pool.get(f"{stub.base}/advice")
+    finally:
+        pool.close()
+    assert pool.connections_opened == 1
+    assert len(CountingHandler.paths) == 5
+
+
+@pytest.mark.parametrize('stub', [ClosingHandler], indirect=True)
+def test_stale_connection_is_retried_once(stub):
+    pool = net.HTTPPool()
+    try:
+        first = pool.get(f"{stub.base}/advice")
+        second = pool.get(f"{stub.base}/advice")
+    finally:
+        pool.close()
+    assert first == second
+    assert pool.connections_opened == 2
+    assert len(ClosingHandler.paths) == 2
+
+
+@pytest.mark.parametrize('stub', [BrokenSpeciesHandler], indirect=True)
+def test_malformed_payload_resolves_with_fallback(stub):
+    loader = net.PokemonLoader(max_workers=2)
+    try:
+        data = loader.load('pikachu').result(timeout=10)
+    finally:
+        loader.close()
+    assert data == {'korean_name': 'Pikachu', 'sprite_data': None}
+
+
+def test_cache_errors_do_not_leave_future_pending(stub):
+    class BrokenCache:
+        def get(self, name, url, allow_stale=False):
+            return None
+
+        def put(self, name, url, data):
+            raise TypeError("cannot store")
+
+    loader = net.PokemonLoader(max_workers=2, cache=BrokenCache())
+    try:
+        data = loader.load('pikachu').result(timeout=10)
+    finally:
+        loader.close()
+    assert data['korean_name'] == 'PIKACHU'
+
+
+def test_cached_result_is_used_offline(stub, tmp_path):
+    from yutnori.cache import PokemonCache
+
+    cache = PokemonCache(str(tmp_path))
+    loader = net.PokemonLoader(max_workers=2, cache=cache)
+    try:
+        fetched = loader.load('eevee').result(timeout=10)
+    finally:
+        loader.close()
+    offline = net.PokemonLoader(cache=cache, offline=True)
+    try:
+        assert offline.load('eevee').result(timeout=10) == fetched
+    finally:
+        offline.close()
+    assert cache.get('eevee', net.pokemon_url('eevee')) == fetched
@@ -0,0 +1,164 @@
+"""게임 기록: 쓰기 → 읽기 왕복, 규칙에 어긋난 기록은 다시 두기에서 거절, 깨진 파일에서는 RecordError 만 나오는지 (퍼징)."""
+import random
+
+import pytest
+
+from yutnori.analytics import simulated_events
+from yutnori.record import (
+    END, HEADER_SIZE, MOVE, OFFSET, PASS, START, THROW, RecordError, RecordWriter, build_index,
+    Game, count_games, game_offset, index_path, iter_games, read_events, read_game, replay,
+)
+
+N_GAMES = 20
+
+
+def write_games(path, n_games, seed=0, n_players=2, n_pieces=4):
+    events = list(simulated_events(n_games, random.Random(seed), n_players, n_pieces))
+    with RecordWriter(path) as rec:
+        for kind, a, b in events:
+            if kind == START:
+                rec.begin_game(a, b)
+            elif kind == THROW:
+                rec.throw(a)
+            elif kind == MOVE:
+                rec.move(a, b)
+            elif kind == PASS:
+                rec.pass_turn()
+            else:
+                rec.end_game(a)
+    return events
+
+
+@pytest.fixture(scope='module')
+def record(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('rec') / 'games.yut')
+    return path, write_games(path, N_GAMES)
+
+
+def test_round_trip(record):
+    path, events = record
+    assert list(read_events(path)) == events
+    games = list(iter_games(path))
+    assert len(games) == count_games(path) == N_GAMES
+    for game in games:
+        logic = replay(game)
+        assert logic.check_win_condition() and logic.current_player_index == game.winner
+
+
+def test_random_access_matches_sequential(record):
+    path, _ = record
+    games = list(iter_games(path))
+    for k in (0, 7, N_GAMES - 1):
+        game = read_game(path, k)
+        assert (game.events, game.winner) == (games[k].events, games[k].winner)
+    with pytest.raises(IndexError):
+        game_offset(path, N_GAMES)
+
+
+def test_long_piece_numbers_and_appending(tmp_path):
+    # 말이 30개 이상이면 긴 이동 이벤트를 쓴다. 이어 쓰면 게임이 뒤에 붙는다
+    path = str(tmp_path / 'big.yut')
+    first = write_games(path, 2, seed=1, n_players=2, n_pieces=40)
+    second = write_games(path, 1, seed=2)
+    assert list(read_events(path)) == first + second
+    assert [g.n_pieces for g in iter_games(path)] == [40, 40, 4]
+    for game in iter_games(path):
+        replay(game)
+
+
+def test_unfinished_game_has_no_winner(tmp_path):
+    path = str(tmp_path / 'cut.yut')
+    with RecordWriter(path) as rec:
+        rec.begin_game(2, 4)
+        rec.throw(2)
+    (game,) = iter_games(path)
+    assert game.winner is None and game.events == [(THROW, 2, None)]
+
+
+def game_of(*events):
+    game = Game(2, 4)
+    game.events = list(events)
+    return game
+
+
+def test_extra_throw_only_after_yut_or_mo():
+    replay(game_of((THROW, 4, None), (THROW, 1, None), (MOVE, 0, 4)))  # 윷 다음에는 한 번 더
+    with pytest.raises(RecordError, match='throw'):
+        replay(game_of((THROW, 1, None), (THROW, 2, None)))
+    with pytest.raises(RecordError, match='throw'):
+        # 윷으로 얻은 던지기는 이미 썼다: 도를 먼저 두어도 윷이 남아 있으면 던질 수 없다
+        replay(game_of((THROW, 4, None), (THROW, 1, None), (MOVE, 0, 1), (THROW, 3, None)))
+
+
+@pytest.mark.parametrize('events', [
+    [(PASS, None, None)],                    # 던지기 전
+    [(THROW, 1, None), (PASS, None, None)],  # 도를 쓸 수 있는데 넘기기
+])
+def test_pass_only_when_no_result_is_usable(events):
+    with pytest.raises(RecordError, match='pass'):
+        replay(game_of(*events))
+
+
+def consume(path, k=None):
+    if k is None:
+        for game in iter_games(path):
+            replay(game)
+    else:
+        replay(read_game(path, k))
+
+
+def test_fuzz_corruption_only_raises_record_error(record, tmp_path):
+    path, _ = record
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(index_path(path), 'rb') as f:
+        index = f.read()
+    rng = random.Random(2024)
+    target = str(tmp_path / 'fuzz.yut')
+    outcomes = {'ok': 0, 'error': 0}
+    for trial in range(1500):
+        broken, broken_index = bytearray(data), bytearray(index)
+        kind = trial % 4
+        if kind == 0:    # 잘라내기
+            del broken[rng.randrange(len(broken)):]
+        elif kind == 1:  # 바이트 몇 개 뒤집기
+            for _ in range(rng.randint(1, 4)):
+                broken[rng.randrange(len(broken))] ^= 1 << rng.randrange(8)
+        elif kind == 2:  # 아무 바이트로 덮기 (머리 포함)
+            for _ in range(rng.randint(1, 3)):
+                broken[rng.randrange(len(broken))] = rng.randrange(256)
+        else:            # 색인이 틀림: 오프셋을 바꾸거나 자르거나 머리를 깨뜨림
+            choice = rng.randrange(3)
+            if choice == 0:
+                pos = HEADER_SIZE + OFFSET.size * rng.randrange(N_GAMES)
+                broken_index[pos:pos + OFFSET.size] = OFFSET.pack(rng.choice(
+                    [0, rng.randrange(len(data) * 2), rng.randrange(1 << 64)]))
+            elif choice == 1:
+                del broken_index[rng.randrange(len(broken_index)):]
+            else:
+                broken_index[rng.randrange(HEADER_SIZE)] ^= 0xFF
+        with open(target, 'wb') as f:
+            f.write(broken)
+        with open(index_path(target), 'wb') as f:
+            f.write(broken_index)
+        try:
+            consume(target, rng.randrange(N_GAMES) if kind == 3 else None)
+            outcomes['ok'] += 1
+        except RecordError:
+            outcomes['error'] += 1
+        except IndexError:
+            # 색인이 잘려서 그 번호의 게임이 없다고 나오는 경우만 허용
+            assert kind == 3
+            outcomes['error'] += 1
+    assert outcomes['error'] > 500
+
+
+def test_rebuilt_index_matches_writer(record, tmp_path):
+    path, _ = record
+    with open(index_path(path), 'rb') as f:
+        written = f.read()
+    copy = tmp_path / 'copy.yut'
+    with open(path, 'rb') as f:
+        copy.write_bytes(f.read())
+    assert build_index(str(copy)) == N_GAMES
+    assert (tmp_path / 'copy.yut.idx').read_bytes() == written
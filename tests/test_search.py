@@ -0,0 +1,81 @@
+"""탐색용 수 생성 / 두기·되돌리기: legal_moves 는 is_legal 과 같은 수를 내고, make → unmake 는 상태를 그대로 돌려놓는다."""
+import random
+
+import pytest
+
+from yutnori.engine import YutnoriGameLogic
+from yutnori.throws import YUT_NAMES, throw_one
+
+
+def positions(seed, n_games=3):
+    """무작위로 두면서 지나간, 둘 수 있는 수가 있는 국면들 (같은 로직 객체를 계속 쓴다)."""
+    rng = random.Random(seed)
+    for _ in range(n_games):
+        logic = YutnoriGameLogic()
+        can_throw = True
+        while True:
+            moves = logic.legal_moves()
+            if moves:
+                yield logic
+                moves = logic.legal_moves()  # 검사하는 쪽이 상태를 바꾸지 않았어야 한다
+            if can_throw and not moves:
+                name, _ = throw_one(rng)
+                can_throw = logic.play_throw(name) or name in ('윷', '모')
+            elif moves:
+                move = moves[int(rng.random() * len(moves))]
+                result = logic.play_move(move.piece, move.name)
+                if result['won']:
+                    break
+                can_throw = can_throw or result['extra'] or result['turn_over']
+            else:
+                logic.pass_turn()
+                can_throw = True
+
+
+def state(logic):
+    pieces = [p for player in logic.players for p in player['pieces']]
+    return (logic.snapshot(), dict(logic.occupancy), [id(p.stacked_pieces) for p in pieces],
+            logic.turn_moves[:], logic.current_player_index)
+
+
+def move_key(logic, piece, name):
+    # legal_moves 는 스택마다 하나, 혼자 기다리는 말들은 통틀어 하나로 대표한다
+    if piece.is_waiting() and len(piece.stacked_pieces) == 1:
+        return name, 'waiting'
+    return name, id(piece.stacked_pieces)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_make_unmake_restores_everything(seed):
+    for logic in positions(seed):
+        before = state(logic)
+        for move in logic.legal_moves():
+            result, undo = logic.make(move)
+            if not result['won']:
+                # 한 수 더 깊이: 되돌리기는 가장 최근 것부터
+                for reply in logic.legal_moves():
+                    logic.unmake(logic.make(reply)[1])
+            logic.unmake(undo)
+            assert state(logic) == before, move
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_legal_moves_match_is_legal(seed):
+    for logic in positions(seed):
+        pieces = logic.get_current_player()['pieces']
+        legal = {move_key(logic, p, name) for p in pieces for name in YUT_NAMES if logic.is_legal(p, name)}
+        moves = logic.legal_moves()
+        assert {move_key(logic, m.piece, m.name) for m in moves} == legal
+        assert len(moves) == len(legal)  # 같은 수가 두 번 나오지 않는다
+        assert all(logic.is_legal(m.piece, m.name) for m in moves)
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_preview_matches_the_move(seed):
+    for logic in positions(seed):
+        for move in logic.legal_moves():
+            result, undo = logic.make(move)
+            assert move.piece.node_id == move.dest
+            assert result['captured'] == move.captured
+            assert (len(move.piece.stacked_pieces) > len(undo[0][0][4])) == move.stacked
+            logic.unmake(undo)
@@ -0,0 +1,171 @@
+"""대전 서버: 바이트 나누기(Decoder), 규칙 확인(MatchState.check), 자리/거절, 루프백으로 봇 한 판."""
+import asyncio
+import random
+
+import pytest
+
+from yutnori.server import (
+    END, GAME_OVER, ILLEGAL, MOVE, NOT_YOUR_TURN, PASS, REJECT, SEAT, START, THROW, THROW_REQUEST,
+    Decoder, GameServer, MatchState, ProtocolError, _bot, encode,
+)
+
+TIMEOUT = 10
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, TIMEOUT))
+
+
+# ============ Decoder ============
+EVENTS = [(SEAT, 1, None), (START, 2, 4), (THROW, 4, None), (MOVE, 3, 1), (MOVE, 40, 5),
+          (PASS, None, None), (THROW_REQUEST, None, None), (REJECT, NOT_YOUR_TURN, None),
+          (END, None, None), (END, 0, None)]
+
+
+def test_decoder_round_trip_in_any_split():
+    data = b''.join(encode(*event) for event in EVENTS)
+    assert Decoder().feed(data) == EVENTS
+    # 어디서 잘려 와도(인자 중간 포함) 같은 이벤트가 같은 순서로 나온다
+    for cut in range(len(data) + 1):
+        decoder = Decoder()
+        assert decoder.feed(data[:cut]) + decoder.feed(data[cut:]) == EVENTS
+    decoder = Decoder()
+    assert [e for byte in data for e in decoder.feed(bytes((byte,)))] == EVENTS
+    assert decoder.buf == b''
+
+
+def test_decoder_keeps_partial_frame():
+    decoder = Decoder()
+    assert decoder.feed(encode(THROW, 2) + encode(START, 2, 4)[:2]) == [(THROW, 2, None)]
+    assert decoder.buf == encode(START, 2, 4)[:2]
+    assert decoder.feed(b'') == []
+    assert decoder.feed(encode(START, 2, 4)[2:]) == [(START, 2, 4)]
+
+
+@pytest.mark.parametrize('data', [bytes((0x0D,)), bytes((0x0A, 1, 6)), bytes((0x10 + 6,))])
+def test_decoder_rejects_unknown_bytes(data):
+    with pytest.raises(ProtocolError):
+        Decoder().feed(data)
+
+
+# ============ MatchState.check ============
+def throw(state, name):
+    from yutnori.throws import YUT_NAMES
+
+    assert state.check(state.logic.current_player_index, THROW_REQUEST) is None
+    state.apply(THROW, YUT_NAMES.index(name))
+
+
+def test_check_rejects_out_of_turn_and_illegal_actions():
+    state = MatchState()
+    assert state.check(1, THROW_REQUEST) == NOT_YOUR_TURN
+    assert state.check(0, MOVE, 0, 1) == ILLEGAL       # 아직 던지지 않았다
+    assert state.check(0, PASS) == ILLEGAL
+    throw(state, '도')
+    assert state.check(0, THROW_REQUEST) == ILLEGAL   # 도 다음에는 더 못 던진다
+    assert state.check(0, MOVE, 0, 2) == ILLEGAL      # 개는 없다
+    assert state.check(0, MOVE, 9, 1) == ILLEGAL      # 없는 말
+    assert state.check(0, PASS) == ILLEGAL            # 도를 쓸 수 있다
+    assert state.check(1, MOVE, 0, 1) == NOT_YOUR_TURN
+    assert state.check(0, MOVE, 0, 1) is None
+    state.apply(MOVE, 0, 1)
+    assert state.logic.current_player_index == 1 and state.can_throw
+
+
+def finished_one():
+    state = MatchState()
+    piece = state.logic.players[0]['pieces'][0]
+    piece.node_id, piece.onBoard = -2, True  # 다 들어간 말이 있고 나머지는 모두 대기 중
+    return state
+
+
+def test_check_allows_pass_only_when_nothing_is_usable():
+    state = finished_one()
+    throw(state, '윷')
+    throw(state, '빽도')                       # 다 들어간 말이 있으니 빽도는 버려지지 않는다
+    assert state.check(0, PASS) == ILLEGAL    # 윷은 쓸 수 있다
+
+    state = finished_one()
+    throw(state, '빽도')
+    assert state.logic.turn_moves == ['빽도'] and not state.logic.legal_moves()
+    assert state.check(1, PASS) == NOT_YOUR_TURN
+    assert state.check(0, PASS) is None
+    state.apply(PASS)
+    assert state.logic.current_player_index == 1 and state.can_throw
+
+
+def test_left_match_rejects_everything():
+    state = MatchState()
+    state.apply(END)                                  # 누가 나가면 승자 없이 끝난다
+    assert state.over and state.winner is None
+    for seat in (0, 1):
+        for kind in (THROW_REQUEST, PASS):
+            assert state.check(seat, kind) == GAME_OVER
+
+
+# ============ 루프백 ============
+async def open_client(port):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    return reader, writer, Decoder()
+
+
+async def receive(client, n):
+    reader, _, decoder = client
+    events = []
+    while len(events) < n:
+        data = await reader.read(4096)
+        if not data:
+            break
+        events += decoder.feed(data)
+    return events
+
+
+async def serving(body):
+    server = GameServer()
+    _, port = await server.start('127.0.0.1', 0)
+    try:
+        return await body(server, port)
+    finally:
+        server.close()
+
+
+def test_seats_rejects_and_reconnect():
+    async def body(server, port):
+        first, second = await open_client(port), await open_client(port)
+        assert await receive(first, 2) == [(SEAT, 0, None), (START, 2, 4)]
+        assert await receive(second, 2) == [(SEAT, 1, None), (START, 2, 4)]
+        second[1].write(encode(THROW_REQUEST))
+        assert await receive(second, 1) == [(REJECT, NOT_YOUR_TURN, None)]
+        first[1].write(encode(MOVE, 0, 1))
+        assert await receive(first, 1) == [(REJECT, ILLEGAL, None)]
+        first[1].write(encode(THROW_REQUEST))
+        (kind, a, _), = await receive(first, 1)
+        assert kind == THROW and (kind, a, None) in await receive(second, 1)
+        assert server.stats['rejected'] == 2
+
+        # 한 쪽이 나가면 남은 쪽은 승자 없는 END 를 받고, 다시 붙으면 새 판의 자리를 받는다
+        first[1].close()
+        assert await receive(second, 1) == [(END, None, None)]
+        assert await second[0].read() == b''
+        third, fourth = await open_client(port), await open_client(port)
+        assert await receive(third, 2) == [(SEAT, 0, None), (START, 2, 4)]
+        assert await receive(fourth, 2) == [(SEAT, 1, None), (START, 2, 4)]
+        for client in (second, third, fourth):
+            client[1].close()
+        return server.stats
+
+    stats = run(serving(body))
+    assert stats['matches_started'] == 2 and stats['connections'] == 4
+
+
+def test_bots_play_one_match_to_the_end():
+    async def body(server, port):
+        latencies = {MOVE: [], THROW: [], PASS: []}
+        bots = [_bot('127.0.0.1', port, random.Random(seed), latencies) for seed in (1, 2)]
+        finished = await asyncio.gather(*bots)
+        return finished, latencies, server.stats
+
+    finished, latencies, stats = run(serving(body))
+    assert finished == [True, True]  # 둘 다 승자가 있는 END 를 받았다
+    assert stats['matches_finished'] == 1 and stats['rejected'] == 0 and stats['protocol_errors'] == 0
+    assert latencies[MOVE] and latencies[THROW]
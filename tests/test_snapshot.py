@@ -0,0 +1,66 @@
+"""압축 스냅샷: 새 YutnoriGameLogic 에 restore 해도 말 위치 / 방향 / 스택 / 점유 정보가 같다."""
+import pytest
+
+from yutnori.board import CENTER_ID, TR_ID
+from yutnori.engine import YutnoriGameLogic
+
+from tests.test_search import positions
+
+
+def pieces_of(logic):
+    return [p for player in logic.players for p in player['pieces']]
+
+
+def assert_same(restored, logic):
+    ours, theirs = pieces_of(restored), pieces_of(logic)
+    assert [(p.node_id, p.direction, p.onBoard) for p in ours] == \
+        [(p.node_id, p.direction, p.onBoard) for p in theirs]
+    # 스택은 같은 말들로, 같은 순서로 다시 만들어지고 업힌 말끼리 리스트 하나를 같이 쓴다
+    index = {id(p): i for i, p in enumerate(theirs)}
+    assert [[ours.index(sp) for sp in p.stacked_pieces] for p in ours] == \
+        [[index[id(sp)] for sp in p.stacked_pieces] for p in theirs]
+    for p in ours:
+        assert all(sp.stacked_pieces is p.stacked_pieces for sp in p.stacked_pieces)
+    assert {node: [ours.index(sp) for sp in stack] for node, stack in restored.occupancy.items()} == \
+        {node: [index[id(sp)] for sp in stack] for node, stack in logic.occupancy.items()}
+    for node, stack in restored.occupancy.items():
+        assert all(sp.node_id == node for sp in stack) and stack is stack[0].stacked_pieces
+    assert (restored.current_player_index, restored.turn_moves) == (logic.current_player_index, logic.turn_moves)
+
+
+def test_backdo_from_shortcut_nodes_round_trips():
+    logic = YutnoriGameLogic()
+    mine, theirs = logic.players[0]['pieces'], logic.players[1]['pieces']
+    logic.move_piece(mine[0], '모')
+    assert mine[0].node_id == TR_ID
+    logic.move_piece(mine[0], '걸')
+    assert mine[0].node_id == CENTER_ID
+    logic.move_piece(mine[0], '빽도')  # 가운데에서 한 칸 뒤: 들어온 대각선 방향을 기억해야 한다
+    logic.move_piece(mine[1], '모')
+    logic.move_piece(mine[1], '빽도')  # 모서리에서 빽도
+    logic.move_piece(mine[2], '도')
+    logic.move_piece(mine[3], '도')    # 업기
+    logic.switch_player()
+    logic.move_piece(theirs[0], '걸')
+    logic.move_piece(theirs[1], '걸')  # 업기
+    logic.turn_moves[:] = ['빽도', '개']
+    snap = logic.snapshot()
+
+    restored = YutnoriGameLogic()
+    restored.restore(snap)
+    assert_same(restored, logic)
+    assert restored.snapshot() == snap
+    # 다시 둔 결과도 같아야 한다: 대각선에서 빽도를 한 번 더, 업힌 말은 함께
+    for game in (logic, restored):
+        game.switch_player()
+        game.move_piece(game.players[0]['pieces'][0], '빽도')
+        game.move_piece(game.players[0]['pieces'][3], '개')
+    assert_same(restored, logic)
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_midgame_snapshots_round_trip(seed):
+    for logic in positions(seed):
+        restored = YutnoriGameLogic()
+        restored.restore(logic.snapshot())
+        assert_same(restored, logic)
@@ -0,0 +1,47 @@
+"""스프라이트 아틀라스: 배율별 크기, 겹치지 않는 배치, 캐시. 배율 고르기 (Pillow 없이도)."""
+import io
+
+import pytest
+
+from yutnori import sprites
+from yutnori.stubapi import sprite_png
+
+
+@pytest.mark.parametrize('scale, zoom', [(0.3, 0.75), (0.8, 0.75), (0.9, 1.0), (1.2, 1.0), (1.3, 1.5), (4.0, 1.5)])
+def test_nearest_zoom(scale, zoom):
+    assert sprites.nearest_zoom(scale) == zoom
+
+
+@pytest.fixture
+def Image():
+    return pytest.importorskip('PIL.Image')
+
+
+def test_layout_has_every_variant_without_overlap(Image):
+    pngs = {'small': sprite_png(inner=20), 'big': sprite_png(inner=40), 'broken': b'not a png'}
+    png, layout = sprites.build_atlas(pngs)
+    sheet = Image.open(io.BytesIO(png)).convert('RGBA')
+    assert set(layout) == {'small', 'big'}  # 깨진 PNG 는 빠진다
+
+    keys = [sprites.BADGE] + [str(float(z)) for z in sprites.ZOOMS]
+    for name, inner in (('small', 20), ('big', 40)):
+        assert sorted(layout[name]) == sorted(keys)
+        # 투명한 테두리를 잘라 낸 inner 크기에 배율을 곱한 크기
+        for zoom in sprites.ZOOMS:
+            assert layout[name][str(float(zoom))][2:] == [round(inner * zoom)] * 2
+        assert layout[name][sprites.BADGE][2:] == [sprites.BADGE_SIZE] * 2
+
+    boxes = [box for variants in layout.values() for box in variants.values()]
+    for i, (x, y, w, h) in enumerate(boxes):
+        assert x >= 0 and y >= 0 and x + w <= sheet.width and y + h <= sheet.height
+        assert sheet.getpixel((x + w // 2, y + h // 2))[3] == 255
+        for x2, y2, w2, h2 in boxes[i + 1:]:
+            assert x + w + sprites.PADDING <= x2 or x2 + w2 + sprites.PADDING <= x \
+                or y + h + sprites.PADDING <= y2 or y2 + h2 + sprites.PADDING <= y
+
+
+def test_load_or_build_reuses_cached_atlas(Image, tmp_path, monkeypatch):
+    pngs = {'pikachu': sprite_png(inner=30)}
+    built = sprites.load_or_build(pngs, cache_dir=str(tmp_path))
+    monkeypatch.setattr(sprites, 'build_atlas', lambda s: pytest.fail("cached atlas was rebuilt"))
+    assert sprites.load_or_build(pngs, cache_dir=str(tmp_path)) == built
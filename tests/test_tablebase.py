@@ -0,0 +1,181 @@
+"""Tablebase 파일 열기: 깨진 파일은 없는 것으로 본다. GUI 시작 경로에서 POSIX 전용 모듈을 쓰지 않는다.
+
+상태 전이(apply)는 fastsim 과 같아야 한다: 판 밖으로 나간 스택도 업힌 채로 둔다.
+남은 결과가 있는 국면의 승률과 최선 수는 파일에서 바로 읽고, 턴을 펼쳐 다시 계산한 값과 같아야 한다."""
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from yutnori import tablebase
+from yutnori.fastsim import BACKDO, DONE, NEXT_POS, OFF, PIECES, POS_INDEX, FastGame
+
+START = POS_INDEX[0, 0]
+DO = 1
+
+
+@pytest.fixture(scope='module')
+def table_file(tmp_path_factory):
+    values, _ = tablebase.solve(2, log=None)
+    path = str(tmp_path_factory.mktemp('tb') / tablebase.FILENAME)
+    tablebase.write(path, values, 2)
+    return path, values
+
+
+def test_write_then_lookup(table_file):
+    path, values = table_file
+    tb = tablebase.Tablebase(path)
+    try:
+        solo = (OFF,) + (DONE,) * (PIECES - 1)
+        assert tb.n_entries == len(values)
+        assert tb.lookup(solo, solo) == pytest.approx(values[tablebase.entry_key(solo, solo)][0], abs=1e-6)
+    finally:
+        tb.close()
+
+
+@pytest.mark.parametrize('cut', [0, 1, tablebase.HEADER.size - 1, tablebase.HEADER.size, -1])
+def test_truncated_file_is_treated_as_missing(table_file, tmp_path, monkeypatch, cut):
+    with open(table_file[0], 'rb') as f:
+        data = f.read()
+    broken = tmp_path / 'broken.bin'
+    broken.write_bytes(data[:cut] if cut >= 0 else data[:-3])
+    with pytest.raises(ValueError):
+        tablebase.Tablebase(str(broken))
+    monkeypatch.setenv('YUTNORI_TABLEBASE', str(broken))
+    assert tablebase.Tablebase.open_default() is None
+
+
+def test_missing_file_is_none(tmp_path, monkeypatch):
+    monkeypatch.setenv('YUTNORI_TABLEBASE', str(tmp_path / 'nope.bin'))
+    assert tablebase.Tablebase.open_default() is None
+
+
+def test_import_does_not_need_resource():
+    # Windows 에는 resource 모듈이 없다: 없는 것처럼 막아 두고 import 해 본다
+    code = ("import sys; sys.modules['resource'] = None; "
+            "import yutnori.tablebase, yutnori.ai, yutnori.gui; "
+            "yutnori.tablebase.Tablebase.open_default()")
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+
+def random_states(seed, n, finished=0):
+    """무작위로 두면서 지나간 (FastGame 복사본) 들. 남은 결과가 있는 국면만.
+
+    finished 개씩은 처음부터 다 들어간 말로 둔다 (끝내기 국면을 만들 때).
+    """
+    rng = random.Random(seed)
+
+    def new_game():
+        game = FastGame()
+        for p in range(2):
+            for i in range(p * PIECES, p * PIECES + finished):
+                game.pos[i] = DONE
+        return game
+
+    game, out = new_game(), []
+    while len(out) < n:
+        if not any(game.pending) and not game.throw(rng):
+            game.player = 1 - game.player
+            continue
+        count = game.legal_actions()
+        if not count:
+            game.pending[:] = (0, 0, 0, 0, 0, 0)
+            game.player = 1 - game.player
+            continue
+        out.append(game.copy())
+        result = game.apply(game.actions[rng.randrange(count)])
+        if result == 2:
+            game = new_game()
+        elif result == 1:
+            game.throw(rng)
+        elif not any(game.pending):
+            game.player = 1 - game.player
+    return out
+
+
+def check_apply_matches_fastsim(game):
+    mine, theirs = tablebase.sides_of(game)
+    codes = tablebase._codes(game, game.player * PIECES)
+    for action in game.actions[:game.legal_actions()]:
+        i, k = action >> 3, action & 7
+        after = game.copy()
+        result = after.apply(action)
+        m2, t2, tb_result = tablebase.apply(mine, theirs, codes[i - game.player * PIECES], k)
+        assert tb_result == result
+        if result != 2:
+            assert (m2, t2) == tablebase.sides_of(after)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_apply_matches_fastsim(seed):
+    for game in random_states(seed, 300):
+        check_apply_matches_fastsim(game)
+
+
+def test_stack_backing_off_start_stays_stacked():
+    game = FastGame()
+    a, b = 0, 1
+    game.pos[a] = game.pos[b] = START
+    game.grp[b] = a
+    game.pending[BACKDO] = 1
+    mine, theirs = tablebase.sides_of(game)
+    m2, _, _ = tablebase.apply(mine, theirs, START, BACKDO)
+    assert m2 == (OFF, OFF) + tablebase.OFF_STACKS[:1] * 2
+    game.apply(a * 8 + BACKDO)
+    assert tablebase.sides_of(game)[0] == m2
+    # 다시 들어갈 때도 둘이 함께 간다
+    game.pending[DO] = 1
+    check_apply_matches_fastsim(game)
+    m3, _, _ = tablebase.apply(m2, theirs, tablebase.OFF_STACKS[0], DO)
+    assert m3.count(NEXT_POS[OFF * 6 + DO]) == 2
+
+
+def test_decisions_are_stored_and_match_a_fresh_turn_search(table_file):
+    path, _ = table_file
+    tb = tablebase.Tablebase(path)
+    try:
+        checked = 0
+        for game in random_states(7, 300, finished=PIECES - 1):
+            mine, theirs = tablebase.sides_of(game)
+            pending = tablebase._pending_tuple(game)
+            if not tb.covers(game) or len(pending) > tablebase.MAX_PENDING:
+                continue
+            entry = tb._probe(mine, theirs, pending)
+            assert entry is not None
+            value, move = tb._turn(mine, theirs, pending)
+            assert entry[0] == pytest.approx(value, abs=1e-5)
+            assert tb.win_probability(game) == entry[0]
+            action = tb.best_action(game)
+            if entry[1] == tablebase.NO_MOVE:
+                assert action is None
+            else:
+                # 같은 값의 수가 여럿이면 다른 수를 고를 수 있으니, 고른 수의 값으로 비교한다
+                assert action in game.actions[:game.legal_actions()]
+                after = game.copy()
+                result = after.apply(action)
+                if result != 2 and any(after.pending) and result != 1:
+                    m2, t2 = tablebase.sides_of(after)
+                    assert tb.lookup(m2, t2, tablebase._pending_tuple(after)) == pytest.approx(entry[0], abs=1e-5)
+            checked += 1
+        assert checked > 100
+    finally:
+        tb.close()
+
+
+def test_long_pending_falls_back_to_turn_search(table_file):
+    path, _ = table_file
+    tb = tablebase.Tablebase(path)
+    try:
+        game = FastGame()
+        for i in range(PIECES - 1):
+            game.pos[i] = game.pos[PIECES + i] = DONE
+        game.pending[4] = tablebase.MAX_PENDING  # 윷 네 번 + 도 한 번: 테이블보다 길다
+        game.pending[DO] = 1
+        mine, theirs = tablebase.sides_of(game)
+        assert tb._probe(mine, theirs, tablebase._pending_tuple(game)) is None
+        assert 0.0 <= tb.win_probability(game) <= 1.0
+        assert tb.best_action(game) in game.actions[:game.legal_actions()]
+    finally:
+        tb.close()
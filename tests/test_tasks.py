@@ -0,0 +1,114 @@
+"""TaskRunner 를 느린 가짜 서버(stubapi.StubServer)와 가짜 after() 루프로 시험한다."""
+import time
+
+import pytest
+
+from yutnori import net
+from yutnori.stubapi import StubHandler, StubServer
+from yutnori.tasks import TaskRunner
+
+
+class SlowHandler(StubHandler):
+    # /advice?delay=초 만큼 기다렸다가 답한다
+    def do_GET(self):
+        if '?delay=' in self.path:
+            time.sleep(float(self.path.split('?delay=')[1]))
+        super().do_GET()
+
+
+class FakeWidget:
+    """after() 를 흉내 낸다. pump() 가 때가 된 콜백을 메인 스레드에서 부른다."""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+        self.longest = 0.0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = (time.monotonic() + ms / 1000, callback)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def pump(self, until, seconds=5.0):
+        deadline = time.monotonic() + seconds
+        while not until() and time.monotonic() < deadline:
+            now = time.monotonic()
+            for after_id, (due, callback) in sorted(self.pending.items(), key=lambda kv: kv[1][0]):
+                if due <= now:
+                    del self.pending[after_id]
+                    start = time.perf_counter()
+                    callback()
+                    self.longest = max(self.longest, time.perf_counter() - start)
+            time.sleep(0.002)
+        return until()
+
+
+@pytest.fixture
+def slow():
+    with StubServer(SlowHandler) as server:
+        server.advice = server.env['YUTNORI_ADVICE_URL']
+        yield server
+
+
+@pytest.fixture
+def runner():
+    widget = FakeWidget()
+    runner = TaskRunner(widget, poll_ms=5)
+    yield runner
+    runner.close()
+
+
+def fetch(url):
+    pool = net.HTTPPool()
+    try:
+        return pool.get(url)
+    finally:
+        pool.close()
+
+
+def test_slow_response_does_not_block_main_loop(slow, runner):
+    results = []
+    t0 = time.perf_counter()
+    runner.submit(lambda: fetch(slow.advice + '?delay=0.5'), on_done=results.append)
+    assert time.perf_counter() - t0 < 0.05
+    assert runner.widget.pump(lambda: results)
+    assert b'stub' in results[0]
+    assert runner.widget.longest < 0.05
+
+
+def test_deadline_ends_in_timeout(slow, runner):
+    errors = []
+    runner.submit(lambda: fetch(slow.advice + '?delay=2'), on_error=errors.append, deadline=0.2)
+    assert runner.widget.pump(lambda: errors, seconds=1.5)
+    assert isinstance(errors[0], TimeoutError)
+
+
+def test_cancelled_task_never_calls_back(slow, runner):
+    results = []
+    task = runner.submit(lambda: fetch(slow.advice + '?delay=0.2'), on_done=results.append)
+    task.cancel()
+    done = []
+    runner.submit(lambda: fetch(slow.advice + '?delay=0.4'), on_done=done.append)
+    assert runner.widget.pump(lambda: done)
+    assert results == []
+
+
+def test_raising_callback_does_not_stop_polling(slow, runner, capsys):
+    calls, results = [], []
+
+    def explode(value):
+        calls.append(value)
+        raise ValueError("boom")
+
+    runner.submit(lambda: fetch(slow.advice), on_done=explode)
+    runner.post(explode, 'posted')
+    assert runner.widget.pump(lambda: len(calls) == 2)
+    assert capsys.readouterr().err.count('ValueError: boom') == 2
+    # 그 뒤에 끝난 작업도 계속 전달된다
+    runner.submit(lambda: fetch(slow.advice + '?delay=0.1'), on_done=results.append)
+    runner.post(results.append, 'posted')
+    assert runner.widget.pump(lambda: len(results) == 2)
+    assert 'posted' in results
@@ -0,0 +1,78 @@
+"""던지기 조회표가 원래 throw_yut 과 같은 결과/모양을 내는지, throw_batch 분포가 맞는지."""
+import math
+import random
+
+import pytest
+
+from yutnori.throws import (
+    ANIMATION16, THROW16, VISUALS16, YUT_NAMES, YUT_SYMBOL, counts, throw_batch, throw_one,
+)
+
+
+def baseline_throw(sticks):
+    """조회표 이전 throw_yut 에서 난수만 뺀 것: 윷가락 4개 → (결과 이름, 모양)."""
+    flat_count = sticks.count('flat') + sticks.count('flat_x')
+    visuals = [YUT_SYMBOL[s] for s in sticks]
+    if 'flat_x' in sticks and flat_count == 1:
+        visuals[sticks.index('flat_x')] = 'X'
+    if flat_count == 0: return '모', visuals
+    if flat_count == 1: return ('빽도', visuals) if 'flat_x' in sticks else ('도', visuals)
+    if flat_count == 2: return '개', visuals
+    if flat_count == 3: return '걸', visuals
+    return '윷', visuals
+
+
+def sticks_of(bits):
+    return [('flat' if bits >> j & 1 else 'round') for j in range(3)] + ['flat_x' if bits & 8 else 'round_x']
+
+
+@pytest.mark.parametrize('bits', range(16))
+def test_combination_matches_baseline(bits):
+    name, visuals = baseline_throw(sticks_of(bits))
+    assert YUT_NAMES[THROW16[bits]] == name
+    assert list(VISUALS16[bits]) == visuals
+    assert ANIMATION16[bits] == " ".join(YUT_SYMBOL[s] for s in sticks_of(bits))
+
+
+def test_flat_x_alone_is_backdo():
+    # 표시된 윷가락만 평평하면 빽도, 일반 윷가락 하나만 평평하면 도
+    assert [YUT_NAMES[THROW16[b]] for b in (8, 1, 2, 4)] == ['빽도', '도', '도', '도']
+    assert VISUALS16[8] == ('▯', '▯', '▯', 'X')
+
+
+def test_table_distribution():
+    # 16가지 조합이 같은 확률일 때 빽도 1, 도 3, 개 6, 걸 4, 윷 1, 모 1
+    assert [THROW16.count(k) for k in range(6)] == [1, 3, 6, 4, 1, 1]
+
+
+def test_throw_one_uses_four_random_bits():
+    class Bits:
+        def __init__(self, value):
+            self.value = value
+
+        def getrandbits(self, k):
+            assert k == 4
+            return self.value
+
+    for bits in range(16):
+        name, visuals = throw_one(Bits(bits))
+        assert (name, visuals) == baseline_throw(sticks_of(bits))
+
+
+def test_throw_batch_frequencies():
+    n = 320_000
+    got = counts(throw_batch(n, rng=1234))
+    assert sum(got) == n
+    for k, c in enumerate(got):
+        p = THROW16.count(k) / 16
+        sigma = math.sqrt(n * p * (1 - p))
+        assert abs(c - n * p) < 5 * sigma, (YUT_NAMES[k], c, n * p)
+
+
+def test_throw_batch_is_seeded_and_visuals_agree():
+    assert throw_batch(1001, rng=7) == throw_batch(1001, rng=7)
+    results, visuals = throw_batch(1001, random.Random(7), visuals=True)
+    assert len(results) == len(visuals) == 1001
+    for k, v in zip(results, visuals):
+        assert v in [VISUALS16[b] for b in range(16) if THROW16[b] == k]
+    assert len(throw_batch(0)) == 0 and len(throw_batch(1)) == 1
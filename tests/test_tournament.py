@@ -0,0 +1,32 @@
+"""토너먼트: 같은 seed 면 워커 수와 상관없이 같은 보고서, 잘못된 인자는 거절."""
+import pytest
+
+from yutnori.tournament import format_report, main, make_tasks, run
+
+POLICIES = ['random', 'lead', 'capture']
+
+
+def test_report_does_not_depend_on_workers():
+    reports = []
+    for workers in (1, 2):
+        pairs, first_wins = run(POLICIES, 30, workers=workers, chunk=7, seed=5)
+        reports.append(format_report(POLICIES, pairs, first_wins))
+    assert reports[0] == reports[1]
+    assert sum(w + l for w, l in pairs.values()) == 3 * 30
+
+
+@pytest.mark.parametrize('argv', [
+    ['--chunk', '0'],
+    ['--games', '0'],
+    ['--policies', 'random'],
+    ['--policies', 'lead', 'lead'],
+])
+def test_bad_arguments_are_rejected(argv):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+
+
+def test_make_tasks_needs_two_policies():
+    with pytest.raises(ValueError):
+        make_tasks(['stack', 'stack'], 10, 5, 0)
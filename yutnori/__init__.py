@@ -0,0 +1,19 @@
+"""포켓몬 윷놀이 게임 패키지.
+
+yutnori.engine(규칙)은 tkinter/네트워크 없이 가볍게 import 된다. 화면은 yutnori.gui,
+네트워크는 yutnori.net 이고, 아래 이름들은 처음 꺼낼 때 해당 모듈을 불러온다.
+"""
+_LAZY = {
+    'Piece': 'yutnori.engine',
+    'YutnoriGameLogic': 'yutnori.engine',
+    'throw_yut': 'yutnori.engine',
+    'YutnoriGUI': 'yutnori.gui',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module 'yutnori' has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(_LAZY[name]), name)
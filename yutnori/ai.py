@@ -0,0 +1,200 @@
+"""컴퓨터 플레이어: 시간 제한 안에서 (말, 결과) 하나를 고른다.
+
+- 윷 던지기는 16가지 윷가락 조합의 정확한 확률(THROW16)을 쓰는 기회(chance) 노드로 본다.
+- 얕은 깊이는 반복 심화 expectimax 로 푼다. 깊이 1 조차 예산 절반 안에 못 끝내면
+  (윷/모가 여러 번 쌓여 가지가 많을 때) 남은 시간은 MCTS(UCB1 + 끝까지 두기)로 쓴다.
+- 트랜스포지션 테이블은 FastGame.encode() + 남은 결과 + 깊이로 키를 만들고,
+  YutAI 객체가 살아 있는 동안 턴을 넘어 계속 재사용한다. 크기가 고정된 배열이라
+  (같은 칸이면 새 값으로 덮어씀) dict 처럼 커지다가 재할당하느라 멈추는 일이 없다.
+- tablebase(yutnori.tablebase.Tablebase)를 주면 테이블이 다루는 끝내기 국면에서는
+  탐색 없이 테이블의 최선 수를 둔다.
+"""
+import math
+import random
+import time
+
+from yutnori.fastsim import (
+    BACKDO, MO, OFF, PIECES, THROW16, TO_GO, YUT, YUT_NAMES, from_logic,
+)
+from yutnori.policies import stack_policy
+
+THROW_PROBS = [(k, THROW16.count(k) / 16) for k in range(6)]
+TO_GO_SCALE = PIECES * TO_GO[OFF]
+
+
+class _Timeout(Exception):
+    pass
+
+
+class YutAI:
+    def __init__(self, budget=0.05, max_depth=4, tt_size=1 << 18, seed=None, tablebase=None):
+        self.budget = budget
+        self.tablebase = tablebase
+        self.max_depth = max_depth
+        self.tt_size = tt_size
+        self.tt_keys = [-1] * tt_size
+        self.tt_values = [0.0] * tt_size
+        self.rng = random.Random(seed)
+        self.last_info = {}
+
+    # --- 공개 API ---
+    def choose(self, game):
+        """game(FastGame, 현재 차례 플레이어에게 쓸 수 있는 결과가 있는 상태)에서 둘 행동.
+
+        둘 수 있는 행동이 없으면 ValueError.
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget
+        n = game.legal_actions()
+        if n == 0:
+            # 남은 결과가 없거나(던지기 전, 끝난 게임) 쓸 수 있는 결과가 없다. 턴 넘기기는 부르는 쪽 몫
+            raise ValueError("choose() 에는 둘 수 있는 행동이 있는 국면을 줘야 한다")
+        actions = game.actions[:n]
+        if n == 1:
+            self.last_info = {'mode': 'forced', 'depth': 0}
+            return actions[0]
+        if self.tablebase is not None:
+            action = self.tablebase.best_action(game)
+            if action is not None:
+                self.last_info = {'mode': 'tablebase', 'depth': 0,
+                                  'ms': (time.perf_counter() - start) * 1000}
+                return action
+
+        self.root = game.player
+        self.nodes = 0
+        best, depth = None, 0
+        try:
+            for d in range(1, self.max_depth + 1):
+                # 깊이 1 은 예산 절반까지만 기다리고, 나머지는 MCTS 몫으로 남긴다
+                self.deadline = start + self.budget / 2 if d == 1 else deadline
+                best, depth = self._root(game, actions, d), d
+        except _Timeout:
+            pass
+
+        if best is None:
+            best = self._mcts(game, actions, deadline)
+            self.last_info = {'mode': 'mcts', 'depth': 0, 'nodes': self.nodes}
+        else:
+            self.last_info = {'mode': 'expectimax', 'depth': depth, 'nodes': self.nodes}
+        self.last_info['ms'] = (time.perf_counter() - start) * 1000
+        return best
+
+    def choose_for_logic(self, logic):
+        """YutnoriGameLogic 기준 (말 번호(0부터), 결과 이름)."""
+        action = self.choose(from_logic(logic))
+        return (action >> 3) % PIECES, YUT_NAMES[action & 7]
+
+    def policy(self, game, actions, n, rng):
+        """fastsim 정책 형식으로 쓰기 (토너먼트 등)."""
+        return actions[:n].index(self.choose(game))
+
+    # --- expectimax ---
+    def _tick(self):
+        self.nodes += 1
+        if not self.nodes & 15 and time.perf_counter() > self.deadline:
+            raise _Timeout
+
+    def _evaluate(self, g):
+        # 상대와 나의 "완주까지 남은 칸" 차이. 승패(±1)보다 항상 작게 둔다
+        self._tick()
+        mine = other = 0
+        pos = g.pos
+        me = self.root * PIECES
+        for i in range(len(pos)):
+            if me <= i < me + PIECES:
+                mine += TO_GO[pos[i]]
+            else:
+                other += TO_GO[pos[i]]
+        return 0.9 * (other - mine) / TO_GO_SCALE
+
+    def _after(self, c, result, depth):
+        if result == 2:
+            return 1.0 if c.player == self.root else -1.0
+        if result == 1:
+            return self._throw(c, depth - 1)  # 잡으면 한 번 더
+        if any(c.pending):
+            return self._decide(c, depth)
+        return self._end_turn(c, depth)
+
+    def _root(self, game, actions, depth):
+        best, best_value = None, -2.0
+        for a in actions:
+            c = game.copy()
+            value = self._after(c, c.apply(a), depth)
+            if value > best_value:
+                best, best_value = a, value
+        return best
+
+    def _decide(self, g, depth):
+        self._tick()
+        n = g.legal_actions()
+        if not n:
+            return self._end_turn(g, depth)
+        # 정수 키: 상태 | 남은 결과(4비트씩) | 깊이 | 기준 플레이어 (튜플보다 작고 GC 대상도 아니다)
+        key = g.encode()
+        for count in g.pending:
+            key = (key << 4) | count
+        key = (((key << 4) | depth) << 1) | self.root
+        slot = key % self.tt_size
+        if self.tt_keys[slot] == key:
+            return self.tt_values[slot]
+
+        maximize = g.player == self.root
+        value = -2.0 if maximize else 2.0
+        for a in g.actions[:n]:
+            c = g.copy()
+            v = self._after(c, c.apply(a), depth)
+            value = max(value, v) if maximize else min(value, v)
+        self.tt_keys[slot] = key
+        self.tt_values[slot] = value
+        return value
+
+    def _end_turn(self, g, depth):
+        g.pending[:] = (0, 0, 0, 0, 0, 0)
+        g.player = 1 - g.player
+        return self._throw(g, depth - 1)
+
+    def _throw(self, g, depth):
+        if depth <= 0:
+            return self._evaluate(g)
+        self._tick()
+        total = 0.0
+        for k, p in THROW_PROBS:
+            c = g.copy()
+            if k == BACKDO and not c.has_entered(c.player):
+                total += p * self._end_turn(c, depth)
+                continue
+            c.pending[k] += 1
+            if k == YUT or k == MO:
+                total += p * self._throw(c, depth - 1)
+            else:
+                total += p * self._decide(c, depth)
+        return total
+
+    # --- MCTS (뿌리에서 UCB1 + 끝까지 두기) ---
+    def _mcts(self, game, actions, deadline):
+        n = len(actions)
+        visits, wins = [0] * n, [0.0] * n
+        policies = (stack_policy, stack_policy)
+        total = 0
+        while total < n or time.perf_counter() < deadline:
+            if total < n:
+                idx = total
+            else:
+                log_total = math.log(total)
+                idx = max(range(n), key=lambda i: wins[i] / visits[i] + 1.4 * math.sqrt(log_total / visits[i]))
+            c = game.copy()
+            result = c.apply(actions[idx])
+            if result == 2:
+                winner = c.player
+            else:
+                if result == 1:
+                    c.throw(self.rng)
+                elif not any(c.pending):
+                    c.player = 1 - c.player
+                winner = c.run(policies, self.rng)
+            visits[idx] += 1
+            wins[idx] += winner == self.root
+            total += 1
+            self.nodes += 1
+        return actions[max(range(n), key=lambda i: visits[i])]
@@ -0,0 +1,407 @@
+"""대량 게임 통계: 이벤트 스트림을 한 번 훑으며 고정 크기 집계에 더한다.
+
+입력은 기록 파일과 같은 (종류, a, b) 이벤트 제너레이터다 (START … END 가 게임마다 반복).
+- 기록 파일: yutnori.record.read_events(path)
+- 시뮬레이션: simulated_events(n) — 엔진으로 GUI 흐름 그대로 무작위로 둔다
+
+GameStats 는 게임 하나를 YutnoriGameLogic 으로 다시 두면서 다음을 센다.
+- 게임 길이(턴 수, 이동 수) 히스토그램. 칸 수가 정해져 있고 넘치면 마지막 칸
+- 칸(ID2POS)별 도착 / 잡기 / 업기 / 지나가기 / 빽도 출발 횟수
+- 지름길: TR_ID/TL_ID/CENTER_ID 에서 출발한 이동(지름길 진입) 대 그 칸을 지나쳐 간 이동
+- 자리별 승리 (선 플레이어 유리함), 더 많이 잡은 쪽의 승률, 윷 결과 분포
+- 서로 다른 국면 수 (HyperLogLog)
+전부 고정 크기 배열이라 게임 수와 상관없이 메모리가 일정하고, merge 로 워커들의 결과를 합친다.
+
+    python -m yutnori.analytics simulate --games 1000000 --out stats.json
+    python -m yutnori.analytics record games.yut --out stats.json
+    python -m yutnori.analytics merge a.json b.json --out all.json
+    python -m yutnori.gui --heatmap stats.json:captures      # 칸별 히트맵을 판 위에
+"""
+import copy
+import hashlib
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from yutnori.board import CENTER_ID, ID2POS, START_ID, TL_ID, TR_ID
+from yutnori.engine import YutnoriGameLogic
+from yutnori.record import END, MOVE, PASS, START, THROW, count_games, game_offset, read_events
+from yutnori.throws import YUT, YUT_NAMES, YUT_STEPS, make_rng, throw_one
+from yutnori.tournament import wilson_interval
+
+N_NODES = len(ID2POS)
+MAX_TURNS = 200   # 턴 수 히스토그램 칸 (마지막 칸 = 그 이상)
+MAX_MOVES = 200
+SHORTCUTS = {'TR': TR_ID, 'TL': TL_ID, 'CENTER': CENTER_ID}
+NODE_COUNTERS = ('landings', 'captures', 'stacks', 'traffic', 'shortcut_taken', 'backdo_from')
+HEATMAPS = ('landings', 'captures', 'stacks', 'traffic', 'capture_rate', 'backdo_from')
+HLL_BITS = 12
+CHUNK = 10000     # 워커 작업 하나의 판 수
+
+
+# ============ 스케치 ============
+class HyperLogLog:
+    """서로 다른 값 개수 추정 (2**bits 바이트, 상대 오차 약 1.04/sqrt(2**bits)). 칸별 최댓값으로 합친다."""
+
+    def __init__(self, bits=HLL_BITS, registers=None):
+        self.bits = bits
+        self.registers = bytearray(registers) if registers is not None else bytearray(1 << bits)
+
+    def add(self, data):
+        h = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+        idx = h & ((1 << self.bits) - 1)
+        rank = 64 - self.bits - (h >> self.bits).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other):
+        if other.bits != self.bits:
+            raise ValueError("HyperLogLog sizes differ")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        e = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if e <= 2.5 * m and zeros:
+            e = m * math.log(m / zeros)  # 작은 값은 선형 계수로
+        return e
+
+
+def _quantile(hist, q):
+    """히스토그램 칸 번호 중 q 분위. 비어 있으면 None."""
+    total = sum(hist)
+    if not total:
+        return None
+    target, acc = q * total, 0
+    for i, count in enumerate(hist):
+        acc += count
+        if acc >= target:
+            return i
+    return len(hist) - 1
+
+
+# ============ 입력 ============
+def simulated_events(n_games, rng=None, n_players=2, n_pieces=4):
+    """엔진으로 무작위로 둔 n_games 판을 이벤트 스트림으로.
+
+    GUI 흐름 그대로: 던질 수 있고 둘 수가 없으면 던지고, 둘 수가 있으면 무작위로 하나 두고,
+    둘 다 안 되면 턴을 넘긴다 (던지기 가능 여부는 GUI 의 던지기 버튼 규칙).
+    """
+    rng = make_rng(rng)
+    for _ in range(n_games):
+        logic = YutnoriGameLogic(n_players, n_pieces)
+        yield START, n_players, n_pieces
+        can_throw = True
+        while True:
+            moves = logic.legal_moves()
+            if can_throw and not moves:
+                name, _ = throw_one(rng)
+                k = YUT_NAMES.index(name)
+                yield THROW, k, None
+                can_throw = logic.play_throw(name) or k >= YUT
+            elif moves:
+                move = moves[int(rng.random() * len(moves))]
+                yield MOVE, logic.get_current_player()['pieces'].index(move.piece), YUT_NAMES.index(move.name)
+                result = logic.play_move(move.piece, move.name)
+                if result['won']:
+                    yield END, logic.current_player_index, None
+                    break
+                can_throw = can_throw or result['extra'] or result['turn_over']
+            else:
+                yield PASS, None, None
+                logic.pass_turn()
+                can_throw = True
+
+
+# ============ 집계 ============
+class GameStats:
+    def __init__(self):
+        self.games = 0        # END 까지 간 게임
+        self.unfinished = 0   # 승자 없이 끝났거나 END 없이 끊긴 게임
+        self.wins = []        # 자리별 승리 (0 = 선)
+        self.turns = [0] * (MAX_TURNS + 1)
+        self.moves = [0] * (MAX_MOVES + 1)
+        self.turns_total = 0
+        self.moves_total = 0
+        self.throws = [0] * len(YUT_NAMES)
+        for name in NODE_COUNTERS:
+            setattr(self, name, [0] * N_NODES)
+        self.backdo_offboard = 0     # 출발칸에서 빽도로 판 밖에 나간 이동
+        self.capture_lead_games = 0  # 한쪽이 더 많이 잡은 게임
+        self.capture_lead_won = 0    # 그중 더 많이 잡은 쪽이 이긴 게임
+        self.positions = HyperLogLog()
+
+    # --- 스트림 ---
+    def consume(self, events, max_games=None):
+        """이벤트 스트림을 끝까지(또는 max_games 판째 START 전까지) 읽는다. 읽기 시작한 판 수."""
+        logic = None
+        started = 0
+        for kind, a, b in events:
+            if kind == START:
+                if logic is not None:
+                    self.unfinished += 1
+                if started == max_games:
+                    return started
+                started += 1
+                logic = YutnoriGameLogic(a, b)
+                player = 0
+                turns, moves = 1, 0
+                caught = [0] * a
+            elif logic is None:
+                raise ValueError("event before the first game start")
+            elif kind == THROW:
+                self.throws[a] += 1
+                logic.play_throw(YUT_NAMES[a])
+            elif kind == MOVE:
+                moves += 1
+                self._move(logic, a, b, caught)
+            elif kind == PASS:
+                logic.pass_turn()
+            else:
+                self._end(a, turns, moves, caught)
+                logic = None
+                continue
+            if logic.current_player_index != player:
+                player = logic.current_player_index
+                turns += 1
+        if logic is not None:
+            self.unfinished += 1
+        return started
+
+    def _move(self, logic, a, b, caught):
+        pieces = logic.get_current_player()['pieces']
+        piece, name = pieces[a], YUT_NAMES[b]
+        node = piece.node_id
+        move = logic.preview(piece, name)
+        path = logic.path(piece, name)
+        if YUT_STEPS[b] == -1:
+            if node >= 0:
+                self.backdo_from[node] += 1
+                if move.dest == -1:
+                    self.backdo_offboard += 1
+        elif node in (TR_ID, TL_ID, CENTER_ID):
+            self.shortcut_taken[node] += 1
+        for n in path[:-1]:
+            self.traffic[n] += 1
+        dest = move.dest
+        if dest >= 0:
+            self.landings[dest] += 1
+            if move.captured:
+                self.captures[dest] += 1
+                caught[logic.current_player_index] += 1
+            elif move.stacked:
+                self.stacks[dest] += 1
+        logic.play_move(piece, name)
+        self.positions.add(logic.snapshot())
+
+    def _end(self, winner, turns, moves, caught):
+        if winner is None:
+            self.unfinished += 1
+            return
+        self.games += 1
+        if winner >= len(self.wins):
+            self.wins.extend([0] * (winner + 1 - len(self.wins)))
+        self.wins[winner] += 1
+        self.turns[min(turns, MAX_TURNS)] += 1
+        self.moves[min(moves, MAX_MOVES)] += 1
+        self.turns_total += turns
+        self.moves_total += moves
+        most = max(caught)
+        if caught.count(most) == 1:
+            self.capture_lead_games += 1
+            self.capture_lead_won += caught[winner] == most
+
+    # --- 합치기 / 저장 ---
+    def merge(self, other):
+        self.games += other.games
+        self.unfinished += other.unfinished
+        if len(other.wins) > len(self.wins):
+            self.wins.extend([0] * (len(other.wins) - len(self.wins)))
+        for i, w in enumerate(other.wins):
+            self.wins[i] += w
+        for name in ('turns', 'moves', 'throws') + NODE_COUNTERS:
+            mine = getattr(self, name)
+            for i, v in enumerate(getattr(other, name)):
+                mine[i] += v
+        for name in ('turns_total', 'moves_total', 'backdo_offboard', 'capture_lead_games', 'capture_lead_won'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.positions.merge(other.positions)
+        return self
+
+    FIELDS = ('games', 'unfinished', 'wins', 'turns', 'moves', 'turns_total', 'moves_total', 'throws',
+              'backdo_offboard', 'capture_lead_games', 'capture_lead_won') + NODE_COUNTERS
+
+    def to_dict(self):
+        # 리스트는 복사한다: 돌려준 dict 나 from_dict 로 만든 집계를 merge 해도 원래 집계가 바뀌지 않게
+        raw = {name: copy.copy(getattr(self, name)) for name in self.FIELDS}
+        raw['positions'] = self.positions.registers.hex()
+        return raw
+
+    @classmethod
+    def from_dict(cls, raw):
+        """to_dict 가 쓴 값만 받는다. 모르는 이름이 있으면 ValueError (메서드를 덮어쓰지 않게)."""
+        unknown = set(raw) - set(cls.FIELDS) - {'positions'}
+        if unknown:
+            raise ValueError(f"unknown GameStats fields: {', '.join(sorted(unknown))}")
+        stats = cls()
+        for name in cls.FIELDS:
+            if name in raw:
+                setattr(stats, name, copy.copy(raw[name]))
+        if 'positions' in raw:
+            stats.positions = HyperLogLog(registers=bytes.fromhex(raw['positions']))
+        return stats
+
+    # --- 결과 ---
+    def heatmap(self, name):
+        """칸 번호 순서의 0~1 값 (가장 많은 칸이 1). capture_rate 는 도착 대비 잡기 비율."""
+        if name == 'capture_rate':
+            values = [c / l if l else 0.0 for c, l in zip(self.captures, self.landings)]
+        else:
+            values = getattr(self, name)
+        top = max(values) or 1
+        return [v / top for v in values]
+
+    def summary(self):
+        decided = sum(self.wins)
+        first = self.wins[0] if self.wins else 0
+        lo, hi = wilson_interval(first, decided)
+        games = max(self.games, 1)
+
+        def dist(hist, total):
+            return {'mean': total / games, 'p50': _quantile(hist, 0.5), 'p90': _quantile(hist, 0.9),
+                    'p99': _quantile(hist, 0.99), 'overflow': hist[-1]}
+
+        shortcuts = {}
+        for label, node in SHORTCUTS.items():
+            taken, passed = self.shortcut_taken[node], self.traffic[node]
+            shortcuts[label] = {'taken': taken, 'passed': passed,
+                                'rate': taken / (taken + passed) if taken + passed else None}
+        return {
+            'games': self.games, 'unfinished': self.unfinished,
+            'first_player': {'wins': first, 'games': decided, 'rate': first / decided if decided else None,
+                             'ci95': [lo, hi]},
+            'wins_by_seat': self.wins,
+            'turns': dist(self.turns, self.turns_total),
+            'moves': dist(self.moves, self.moves_total),
+            'throws': dict(zip(YUT_NAMES, self.throws)),
+            'captures_per_game': sum(self.captures) / games,
+            'stacks_per_game': sum(self.stacks) / games,
+            'capture_leader_win_rate': (self.capture_lead_won / self.capture_lead_games
+                                        if self.capture_lead_games else None),
+            'shortcuts': shortcuts,
+            'backdo_at_start': self.backdo_from[START_ID],
+            'backdo_offboard': self.backdo_offboard,
+            'distinct_positions': round(self.positions.estimate()),
+            'heatmaps': {name: self.heatmap(name) for name in HEATMAPS},
+        }
+
+
+def heat_color(v):
+    """0~1 → 옅은 노랑에서 빨강까지의 #rrggbb (판 위 히트맵용)."""
+    v = min(max(v, 0.0), 1.0)
+    return f"#ff{round(235 * (1 - v)):02x}{round(120 * (1 - v)):02x}"
+
+
+def load_heatmap(spec):
+    """'stats.json[:이름]' → 칸별 0~1 값 (이름이 없으면 captures). analytics 가 쓴 JSON 을 읽는다."""
+    import json
+
+    path, sep, name = spec.rpartition(':')
+    if not sep or name not in HEATMAPS:
+        path, name = spec, 'captures'
+    with open(path, encoding='utf-8') as f:
+        return GameStats.from_dict(json.load(f)['raw']).heatmap(name)
+
+
+# ============ 병렬 ============
+def _simulate_chunk(task):
+    n_games, seed, chunk = task
+    stats = GameStats()
+    stats.consume(simulated_events(n_games, random.Random(f"{seed}:{chunk}")))
+    return stats
+
+
+def _record_chunk(task):
+    path, first, n_games = task
+    stats = GameStats()
+    stats.consume(read_events(path, game_offset(path, first)), max_games=n_games)
+    return stats
+
+
+def _run(fn, tasks, workers):
+    total = GameStats()
+    if workers == 1:
+        for stats in map(fn, tasks):
+            total.merge(stats)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(fn, tasks):
+            total.merge(stats)
+    return total
+
+
+def simulate(n_games, workers=None, chunk=CHUNK, seed=0):
+    """n_games 판을 chunk 판씩 나눠 워커들이 두고 집계를 합친다 (워커 수와 상관없이 같은 결과)."""
+    tasks = [(min(chunk, n_games - start), seed, c) for c, start in enumerate(range(0, n_games, chunk))]
+    return _run(_simulate_chunk, tasks, workers)
+
+
+def analyze_record(path, workers=None, chunk=CHUNK):
+    """기록 파일을 색인으로 chunk 판씩 나눠 워커들이 읽고 집계를 합친다."""
+    n_games = count_games(path)
+    tasks = [(path, start, min(chunk, n_games - start)) for start in range(0, n_games, chunk)]
+    return _run(_record_chunk, tasks, workers)
+
+
+if __name__ == '__main__':
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="윷놀이 대량 게임 통계")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_sim = sub.add_parser('simulate')
+    p_sim.add_argument('--games', type=int, default=100000)
+    p_sim.add_argument('--seed', type=int, default=0)
+    p_rec = sub.add_parser('record')
+    p_rec.add_argument('path')
+    p_merge = sub.add_parser('merge', help="이 모듈이 쓴 JSON 들을 합친다")
+    p_merge.add_argument('paths', nargs='+')
+    for p in (p_sim, p_rec):
+        p.add_argument('--workers', type=int, default=os.cpu_count())
+        p.add_argument('--chunk', type=int, default=CHUNK)
+    for p in (p_sim, p_rec, p_merge):
+        p.add_argument('--out', help="raw 집계와 요약을 JSON 으로 쓴다")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    if args.command == 'simulate':
+        stats = simulate(args.games, args.workers, args.chunk, args.seed)
+    elif args.command == 'record':
+        stats = analyze_record(args.path, args.workers, args.chunk)
+    else:
+        stats = GameStats()
+        for path in args.paths:
+            with open(path, encoding='utf-8') as f:
+                stats.merge(GameStats.from_dict(json.load(f)['raw']))
+    dt = time.perf_counter() - t0
+
+    summary = stats.summary()
+    fp = summary['first_player']
+    print(f"{stats.games} games ({stats.unfinished} unfinished) in {dt:.2f}s "
+          f"({stats.games / dt if dt else 0:.0f} games/s)")
+    if fp['rate'] is not None:
+        print(f"first player win rate {fp['rate']:.4f}  [{fp['ci95'][0]:.4f}, {fp['ci95'][1]:.4f}]")
+    print(f"turns mean {summary['turns']['mean']:.1f}  p50 {summary['turns']['p50']}  "
+          f"p99 {summary['turns']['p99']};  captures/game {summary['captures_per_game']:.2f}  "
+          f"stacks/game {summary['stacks_per_game']:.2f}")
+    for label, s in summary['shortcuts'].items():
+        rate = f"{s['rate']:.3f}" if s['rate'] is not None else '-'
+        print(f"shortcut {label:<6} taken {s['taken']:>10}  passed {s['passed']:>10}  rate {rate}")
+    print(f"distinct positions ~{summary['distinct_positions']}")
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump({'raw': stats.to_dict(), 'summary': summary}, f, ensure_ascii=False)
@@ -0,0 +1,198 @@
+"""애니메이션 스케줄러: after() 루프 하나로 모든 애니메이션을 정해진 프레임 속도로 돌린다.
+
+- 프레임마다 쓸 수 있는 시간(budget_ms)이 정해져 있다. 다 쓰면 남은 애니메이션은 다음 프레임에
+  먼저 돌린다. 그래서 애니메이션이 많아도 한 번의 after 콜백이 Tk 이벤트(클릭, 버튼)를 오래
+  막지 않는다.
+- 애니메이션은 프레임 수가 아니라 흐른 시간으로 진행한다. 프레임이 늦으면 놓친 프레임은 그리지
+  않고(dropped 로 센다) 지금 시각의 모양으로 바로 건너뛴다.
+- 돌릴 것이 없으면 after 도 예약하지 않는다.
+
+애니메이션은 캔버스 아이템을 새로 만들지 않고 이미 있는 아이템을 move/coords 로 옮긴다.
+
+    animator = Animator(widget)
+    animator.add(PathTween(canvas, tag, start, points, on_done=...))
+    animator.finish_all()   # 진행 중인 것을 모두 끝 모양으로 (새 입력을 처리하기 전에)
+"""
+import time
+
+FPS = 60
+BUDGET_MS = 8.0      # 한 프레임에서 애니메이션에 쓰는 최대 시간
+STEP_MS = 70         # 말이 한 칸 가는 시간
+PULSE_MS = 300       # 잡기/업기 표시 고리가 퍼지는 시간
+
+
+def _ease(t):
+    # 칸마다 천천히 출발해서 천천히 멈춘다 (smoothstep)
+    return t * t * (3 - 2 * t)
+
+
+class Animation:
+    """duration_ms 동안 update(0~1) 를 부른 뒤 on_done 을 부른다."""
+
+    def __init__(self, duration_ms, on_done=None):
+        self.duration = max(duration_ms, 1) / 1000
+        self.on_done = on_done
+        self.start = None  # Animator 가 넣을 때 정한다
+        self.done = False
+
+    def step(self, now):
+        """now 의 모양으로 고친다. 아직 진행 중이면 True."""
+        t = min(1.0, max(0.0, (now - self.start) / self.duration))
+        self.update(t)
+        if t >= 1.0:
+            self._finish()
+            return False
+        return True
+
+    def finish(self):
+        if not self.done:
+            self.update(1.0)
+            self._finish()
+
+    def _finish(self):
+        self.done = True
+        if self.on_done:
+            self.on_done()
+
+    def update(self, t):
+        pass
+
+
+class PathTween(Animation):
+    """tag 가 붙은 아이템들을 start 에서 points 를 차례로 지나 마지막 점까지 옮긴다 (칸마다 STEP_MS)."""
+
+    def __init__(self, canvas, tag, start, points, step_ms=STEP_MS, on_done=None):
+        super().__init__(step_ms * max(len(points), 1), on_done)
+        self.canvas = canvas
+        self.tag = tag
+        self.points = [start] + list(points)
+        self.pos = start
+
+    def update(self, t):
+        n = len(self.points) - 1
+        if n <= 0:
+            return
+        i, frac = divmod(t * n, 1.0)
+        i = int(i)
+        if i >= n:
+            x, y = self.points[-1]
+        else:
+            (x0, y0), (x1, y1) = self.points[i], self.points[i + 1]
+            e = _ease(frac)
+            x, y = x0 + (x1 - x0) * e, y0 + (y1 - y0) * e
+        self.canvas.move(self.tag, x - self.pos[0], y - self.pos[1])
+        self.pos = (x, y)
+
+
+class Pulse(Animation):
+    """(x, y) 에서 퍼지며 가늘어지는 고리. item 은 미리 만들어 둔 원 하나를 빌려 쓴다."""
+
+    def __init__(self, canvas, item, x, y, color, r0, r1, duration_ms=PULSE_MS, on_done=None):
+        super().__init__(duration_ms, on_done)
+        self.canvas = canvas
+        self.item = item
+        self.x, self.y, self.r0, self.r1 = x, y, r0, r1
+        canvas.itemconfigure(item, outline=color, state='normal')
+        canvas.tag_raise(item)
+
+    def update(self, t):
+        r = self.r0 + (self.r1 - self.r0) * t
+        self.canvas.coords(self.item, self.x - r, self.y - r, self.x + r, self.y + r)
+        self.canvas.itemconfigure(self.item, width=max(1.0, 5 * (1 - t)),
+                                  state='hidden' if t >= 1.0 else 'normal')
+
+
+class Ticker(Animation):
+    """duration_ms 동안 interval_ms 마다 tick() 을 부른다 (윷가락 굴리기)."""
+
+    def __init__(self, interval_ms, duration_ms, tick, on_done=None):
+        super().__init__(duration_ms, on_done)
+        self.interval = interval_ms / 1000
+        self.tick = tick
+        self.next_at = 0.0
+
+    def update(self, t):
+        if t >= 1.0:
+            return
+        elapsed = t * self.duration
+        if elapsed >= self.next_at:
+            self.tick()
+            # 늦게 불렸으면 밀린 만큼을 한꺼번에 건너뛴다
+            self.next_at = (elapsed // self.interval + 1) * self.interval
+
+
+class Animator:
+    def __init__(self, widget, fps=FPS, budget_ms=BUDGET_MS, clock=time.perf_counter):
+        self.widget = widget
+        self.frame = 1 / fps
+        self.budget = budget_ms / 1000
+        self.clock = clock
+        self.active = []
+        self._after_id = None
+        self._ticking = False
+        self._due = 0.0
+        self.frames = 0   # 그린 프레임 수
+        self.dropped = 0  # 늦어서 건너뛴 프레임 수
+        self.deferred = 0  # 예산을 넘겨 다음 프레임으로 미룬 애니메이션 수
+
+    def add(self, anim):
+        anim.start = self.clock()
+        self.active.append(anim)
+        if self._after_id is None and not self._ticking:
+            self._due = anim.start
+            self._after_id = self.widget.after(0, self._tick)
+        return anim
+
+    def busy(self):
+        return bool(self.active)
+
+    def finish_all(self):
+        """진행 중인 애니메이션을 모두 끝 모양으로 보내고 on_done 을 부른다.
+        on_done 이 새 애니메이션을 넣으면 그것도 끝낸다."""
+        while self.active:
+            active, self.active = self.active, []
+            for anim in active:
+                anim.finish()
+        self._cancel()
+
+    def cancel_all(self):
+        """on_done 없이 멈춘다 (창을 닫을 때)."""
+        self.active = []
+        self._cancel()
+
+    def _cancel(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        self._after_id = None
+        start = self.clock()
+        late = start - self._due
+        if late > self.frame:
+            self.dropped += int(late / self.frame)
+        self.frames += 1
+
+        # 앞에서부터 예산 안에서 돌리고, 못 돌린 것은 다음 프레임 맨 앞으로
+        active, self.active = self.active, []
+        still = []
+        self._ticking = True
+        try:
+            for i, anim in enumerate(active):
+                if i and self.clock() - start > self.budget:
+                    self.deferred += len(active) - i
+                    still = active[i:] + still
+                    break
+                if not anim.done and anim.step(start):
+                    still.append(anim)
+        finally:
+            self._ticking = False
+            # on_done 에서 새로 넣은 것은 self.active 에 이미 들어가 있다
+            self.active = still + self.active
+        if not self.active:
+            return
+
+        # 다음 프레임은 프레임 격자에 맞춘다. 이미 지났으면 지금 시각부터 다시 센다
+        now = self.clock()
+        self._due = max(self._due + self.frame, now)
+        self._after_id = self.widget.after(max(1, round((self._due - now) * 1000)), self._tick)
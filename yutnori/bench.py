@@ -0,0 +1,567 @@
+"""성능 벤치마크: 핫 패스 측정 → JSON, 두 JSON 비교.
+
+    python -m yutnori.bench run --out bench.json          # 전체 (--quick 이면 반복을 줄인다)
+    python -m yutnori.bench run --only move throw
+    python -m yutnori.bench compare old.json new.json --threshold 0.10
+
+항목마다 워밍업 후 repeat 번 재고, 한 번은 inner 번 실행한 평균(1회당 초)이다.
+JSON 에는 중앙값/평균/표준편차/최솟값을 남기고, compare 는 중앙값(--stat)이 threshold 보다
+느려진 항목을 회귀로 표시하고 종료 코드 1 을 돌려준다.
+
+- move: 모든 (노드, 진행 방향) 상태 × 윷 결과별 move_piece (결과별 항목 + 노드별 상세)
+- search: 중반 국면에서 legal_moves / 모든 수 make+unmake (비교용으로 deepcopy 한 번) /
+  snapshot+restore
+- game: YutnoriGameLogic 으로 끝까지 두는 게임 / fastsim 게임
+- throw: throw_yut 한 번, throw_batch 1회당
+- instrument: 계측을 끈 상태 / 켠 상태 / 다시 끈 상태의 move_piece, 꺼진 span()/count() 한 번
+- sprites: 포켓몬 8마리 스프라이트로 아틀라스 만들기 (작업 스레드 몫, Pillow 가 없으면 건너뛴다)
+- render: draw_board / draw_pieces / update_display (Tk 화면이 필요하다. DISPLAY 가 없고
+  Xvfb 가 있으면 띄워서 쓰고, 둘 다 없으면 건너뛴다)
+- startup: 새 프로세스에서 모듈 import + 포켓몬 8마리 로딩까지. 네트워크는 이 프로세스가 띄운
+  로컬 가짜 PokeAPI 로 돌리고, 빈 캐시(cold)와 채워진 캐시(warm)를 따로 잰다
+- server: 새 프로세스로 띄운 yutnori.server 에 봇 클라이언트로 루프백 부하 (판 하나당 시간 =
+  1 / 초당 끝난 판 수, 이동 지연 p99)
+- import: 새 프로세스에서 모듈 하나를 import 하는 데 드는 시간과, 그때 딸려 온 무거운 모듈
+  (tkinter, urllib.request, asyncio 등). yutnori.engine 은 이 목록이 비어 있어야 한다
+"""
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from yutnori.stubapi import StubServer, sprite_png
+
+GROUPS = ('move', 'search', 'game', 'throw', 'instrument', 'sprites', 'render', 'startup', 'server', 'import')
+DEFAULT_THRESHOLD = 0.10
+
+
+# ============ 측정 ============
+def measure(fn, inner, repeat=7, warmup=2):
+    """fn(inner) 를 warmup 번 버리고 repeat 번 잰다. 결과는 1회(op)당 초."""
+    for _ in range(warmup):
+        fn(inner)
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(inner)
+        samples.append((time.perf_counter() - t0) / inner)
+    return summarize(samples, inner)
+
+
+def summarize(samples, inner=1):
+    median = statistics.median(samples)
+    return {
+        'unit': 's/op',
+        'median': median,
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'min': min(samples),
+        'repeat': len(samples),
+        'inner': inner,
+        'ops_per_sec': 1 / median if median else None,
+    }
+
+
+# ============ 로직 ============
+def _board_states(G):
+    """말 하나로 갈 수 있는 모든 (노드, 진행 방향) 상태와 그때의 말 속성."""
+    logic = G.YutnoriGameLogic()
+    piece = logic.players[0]['pieces'][0]
+    start = (piece.node_id, piece.direction, piece.onBoard)
+    states = {(-1, piece.direction): start}
+    todo = [start]
+    while todo:
+        node, d, on_board = todo.pop()
+        for name in G.YUT_MAP:
+            if name == '빽도' and not on_board:
+                continue
+            piece.node_id, piece.direction, piece.onBoard = node, d, on_board
+            logic.occupancy.clear()
+            logic.move_piece(piece, name)
+            if piece.is_finished():
+                continue
+            key = (piece.node_id, piece.direction)
+            if key not in states:
+                states[key] = (piece.node_id, piece.direction, piece.onBoard)
+                todo.append(states[key])
+    return [states[key] for key in sorted(states)]
+
+
+def _move_op(G, states, name):
+    logic = G.YutnoriGameLogic()
+    piece = logic.players[0]['pieces'][0]
+    stack = piece.stacked_pieces
+    occupancy = logic.occupancy
+    states = [s for s in states if s[2] or name != '빽도']
+
+    def run(n):
+        # 말 상태를 되돌리는 비용도 포함된다 (속성 세 개 + 점유 정보)
+        for i in range(n):
+            node, d, on_board = states[i % len(states)]
+            piece.node_id, piece.direction, piece.onBoard = node, d, on_board
+            occupancy.clear()
+            if on_board:
+                occupancy[node] = stack
+            logic.move_piece(piece, name)
+    return run, len(states)
+
+
+def bench_move(G, repeat):
+    results = {}
+    states = _board_states(G)
+    for name in G.YUT_MAP:
+        run, n_states = _move_op(G, states, name)
+        result = measure(run, n_states * 20, repeat)
+        by_node = {}
+        for state in states:
+            if name == '빽도' and not state[2]:
+                continue
+            one, _ = _move_op(G, [state], name)
+            by_node[f"{state[0]}/{state[1]}"] = measure(one, 200, 3, 1)['median']
+        result['by_node'] = by_node
+        results[f"move_piece[{name}]"] = result
+    return results
+
+
+def _random_game(G, rng):
+    # GUI 흐름 그대로 (yutnori.record 확인용 드라이버와 같은 규칙)
+    logic = G.YutnoriGameLogic()
+    can_throw = True
+    while True:
+        pieces = logic.get_current_player()['pieces']
+        usable = [(p, m) for m in logic.turn_moves for p in pieces
+                  if not p.is_finished() and not (m == '빽도' and p.is_waiting())]
+        if can_throw and not usable:
+            name, _ = G.throw_yut()
+            can_throw = logic.play_throw(name) or name in ('윷', '모')
+        elif usable:
+            piece, name = usable[int(rng.random() * len(usable))]
+            result = logic.play_move(piece, name)
+            if result['won']:
+                return logic.current_player_index
+            can_throw = result['extra'] or result['turn_over']
+        else:
+            logic.pass_turn()
+            can_throw = True
+
+
+def _midgame(G, rng, throws=30):
+    # 말이 판 여기저기에 있고 남은 결과가 있는 국면까지 무작위로 둔다
+    logic = G.YutnoriGameLogic()
+    while throws or not logic.legal_moves():
+        moves = logic.legal_moves()
+        if moves and rng.random() < 0.6:
+            move = moves[int(rng.random() * len(moves))]
+            if logic.play_move(move.piece, move.name)['won']:
+                return _midgame(G, rng, 30)
+        else:
+            name, _ = G.throw_yut()
+            logic.play_throw(name)
+            throws = max(throws - 1, 0)
+    return logic
+
+
+def bench_search(G, repeat):
+    import copy
+
+    random.seed(0)
+    logic = _midgame(G, random.Random(0))
+    moves = logic.legal_moves()
+
+    def generate(n):
+        for _ in range(n):
+            logic.legal_moves()
+
+    def make_unmake(n):
+        for _ in range(n):
+            for move in moves:
+                logic.unmake(logic.make(move)[1])
+
+    snap = logic.snapshot()
+
+    def snapshot_restore(n):
+        for _ in range(n):
+            logic.restore(logic.snapshot())
+
+    def deep_copies(n):
+        for _ in range(n):
+            for move in moves:
+                copy.deepcopy(logic)
+
+    return {
+        'legal_moves': measure(generate, 500, repeat),
+        f'make+unmake[{len(moves)} moves]': measure(make_unmake, 200, repeat),
+        f'deepcopy[{len(moves)} moves]': measure(deep_copies, 5, repeat),
+        f'snapshot+restore[{len(snap)} bytes]': measure(snapshot_restore, 200, repeat),
+    }
+
+
+def bench_instrument(G, repeat):
+    from yutnori import instrument
+
+    states = _board_states(G)
+    run, n_states = _move_op(G, states, '도')
+    results = {'move_piece[instrument off]': measure(run, n_states * 20, repeat)}
+    instrument.enable(targets=[t for t in instrument.TARGETS if t[0] == 'yutnori.engine'], tk_handlers=False)
+    try:
+        results['move_piece[instrument on]'] = measure(run, n_states * 20, repeat)
+    finally:
+        instrument.disable()
+        instrument.RECORDER.reset()
+    results['move_piece[instrument off again]'] = measure(run, n_states * 20, repeat)
+
+    def spans(n):
+        for _ in range(n):
+            with instrument.span('x'):
+                pass
+
+    def counts(n):
+        for _ in range(n):
+            instrument.count('x')
+
+    results['span()[off]'] = measure(spans, 10000, repeat)
+    results['count()[off]'] = measure(counts, 10000, repeat)
+    return results
+
+
+def bench_sprites(G, repeat):
+    from yutnori.sprites import build_atlas
+
+    sprites = {f"pokemon{i}": sprite_png(inner=30 + 4 * i) for i in range(8)}
+    if build_atlas(sprites) is None:
+        return {}
+    return {'build_atlas[8 sprites]': measure(lambda n: [build_atlas(sprites) for _ in range(n)], 3, repeat)}
+
+
+def bench_game(G, repeat):
+    from yutnori.fastsim import FastGame, random_policy
+
+    fast = FastGame()
+
+    # 반복마다 같은 게임들을 두도록 난수를 다시 맞춘다 (게임 길이 차이가 잡음이 되지 않게)
+    def logic_games(n):
+        random.seed(0)
+        rng = random.Random(0)
+        for _ in range(n):
+            _random_game(G, rng)
+
+    def fast_games(n):
+        rng = random.Random(0)
+        for _ in range(n):
+            fast.play((random_policy, random_policy), rng)
+
+    return {
+        'game[logic]': measure(logic_games, 20, repeat),
+        'game[fastsim]': measure(fast_games, 200, repeat),
+    }
+
+
+def bench_throw(G, repeat):
+    from yutnori.throws import throw_batch
+
+    def single(n):
+        for _ in range(n):
+            G.throw_yut()
+
+    batch_size = 100000
+    rng = random.Random(0)
+
+    def batch(n):
+        for _ in range(n // batch_size):
+            throw_batch(batch_size, rng)
+
+    return {
+        'throw_yut': measure(single, 20000, repeat),
+        'throw_batch[per throw]': measure(batch, batch_size * 5, repeat),
+    }
+
+
+# ============ 화면 ============
+class Display:
+    """DISPLAY 가 없으면 Xvfb 를 띄운다. available 이 False 면 화면 벤치는 건너뛴다."""
+
+    def __enter__(self):
+        self.proc = None
+        if not os.environ.get('DISPLAY') and shutil.which('Xvfb'):
+            display = f":{90 + os.getpid() % 100}"
+            self.proc = subprocess.Popen(['Xvfb', display, '-screen', '0', '1280x800x24'],
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.environ['DISPLAY'] = display
+            time.sleep(0.5)
+        try:
+            import tkinter as tk
+
+            tk.Tk().destroy()
+            self.available, self.reason = True, None
+        except Exception as e:
+            self.available, self.reason = False, f"no display for Tk: {e}"
+        return self
+
+    def __exit__(self, *exc):
+        if self.proc:
+            self.proc.terminate()
+            self.proc.wait()
+            del os.environ['DISPLAY']
+
+
+def bench_render(G, repeat):
+    import tkinter as tk
+    from yutnori.gui import YutnoriGUI
+
+    root = tk.Tk()
+    app = YutnoriGUI(master=root)
+    deadline = time.perf_counter() + 10
+    while app._pokemon_pending and time.perf_counter() < deadline:
+        root.update()
+
+    def first_board(n):
+        for _ in range(n):
+            app.canvas.delete('board')
+            app._board_drawn = False
+            app.draw_board()
+            root.update_idletasks()
+
+    def pieces_unchanged(n):
+        for _ in range(n):
+            app.draw_pieces()
+            root.update_idletasks()
+
+    piece = app.game.players[0]['pieces'][0]
+
+    def frame_after_move(n):
+        for i in range(n):
+            piece.node_id, piece.onBoard = (i % 19) + 1, True
+            app.update_display()
+            root.update_idletasks()
+
+    def frame_unchanged(n):
+        for _ in range(n):
+            app.update_display()
+            root.update_idletasks()
+
+    results = {
+        'draw_board[first frame]': measure(first_board, 20, repeat),
+        'draw_pieces[no change]': measure(pieces_unchanged, 200, repeat),
+        'update_display[no change]': measure(frame_unchanged, 100, repeat),
+        'update_display[one piece moved]': measure(frame_after_move, 100, repeat),
+    }
+    root.destroy()
+    return results
+
+
+def _startup_child():
+    # 새 프로세스에서: import → (화면이 있으면 GUI 를 띄우고) 포켓몬 로딩이 끝날 때까지
+    import tkinter as tk
+    from yutnori import engine, gui
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        root = None
+    if root is None:
+        from yutnori.cache import PokemonCache
+        from yutnori.net import PokemonLoader
+
+        loader = PokemonLoader(cache=PokemonCache())
+        names = [p.pokemon_name for player in engine.YutnoriGameLogic().players for p in player['pieces']]
+        for future in loader.load_all(names).values():
+            future.result()
+        loader.close()
+        return
+    app = gui.YutnoriGUI(master=root)
+    while app._pokemon_pending or not app.sprites_ready:
+        root.update()
+    root.destroy()
+
+
+def bench_startup(G, repeat, display):
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = {}
+    with StubServer() as stub, tempfile.TemporaryDirectory() as tmp:
+        def spawn(cache_dir):
+            env = dict(os.environ, YUTNORI_CACHE_DIR=cache_dir, PYTHONPATH=here, **stub.env)
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, '-m', 'yutnori.bench', '_startup'], env=env, cwd=here, check=True)
+            return time.perf_counter() - t0
+
+        cold = [spawn(os.path.join(tmp, f"cold{i}")) for i in range(repeat)]
+        warm_dir = os.path.join(tmp, 'warm')
+        spawn(warm_dir)
+        warm = [spawn(warm_dir) for _ in range(repeat)]
+    suffix = 'gui' if display.available else 'headless'
+    results[f'startup[cold, {suffix}]'] = summarize(cold)
+    results[f'startup[warm, {suffix}]'] = summarize(warm)
+    return results
+
+
+SERVER_MATCHES = 200
+SERVER_CONCURRENCY = 100
+
+
+def bench_server(G, repeat):
+    import asyncio
+
+    from yutnori import server
+
+    per_match, move_p99 = [], []
+    proc, host, port = server.spawn_server()
+    try:
+        for i in range(repeat):
+            report = asyncio.run(server.run_load(host, port, SERVER_MATCHES, SERVER_CONCURRENCY, seed=i))
+            per_match.append(1 / report['matches_per_s'])
+            move_p99.append(report['move_p99_ms'] / 1000)
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {f'server[match, {SERVER_CONCURRENCY} concurrent]': summarize(per_match),
+            'server[move latency p99]': summarize(move_p99)}
+
+
+IMPORT_MODULES = ('yutnori.engine', 'yutnori.fastsim', 'yutnori.record', 'yutnori.net', 'yutnori.gui')
+HEAVY_MODULES = ('tkinter', 'urllib.request', 'http.client', 'asyncio', 'ssl', 'json')
+
+_IMPORT_CHILD = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+dt = time.perf_counter() - t0
+print(dt, *[m for m in {heavy!r} if m in sys.modules])
+"""
+
+
+def bench_import(G, repeat):
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # .pyc 를 쓰지 못하면 매번 컴파일 시간까지 재게 되므로 한 번 먼저 돌려 만들어 둔다
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    env['PYTHONPATH'] = here
+    results = {}
+    for module in IMPORT_MODULES:
+        code = _IMPORT_CHILD.format(module=module, heavy=HEAVY_MODULES)
+        samples, loaded = [], []
+        for i in range(repeat + 1):
+            out = subprocess.run([sys.executable, '-c', code], env=env, cwd=here,
+                                 capture_output=True, text=True, check=True).stdout.split()
+            if i:
+                samples.append(float(out[0]))
+            loaded = out[1:]
+        results[f'import[{module}]'] = dict(summarize(samples), loaded=loaded)
+    return results
+
+
+# ============ 실행 / 비교 ============
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(groups=GROUPS, quick=False, log=print):
+    from yutnori import engine as G
+
+    repeat = 3 if quick else 7
+    report = {
+        'meta': {'commit': _git_commit(), 'python': platform.python_version(),
+                 'platform': platform.platform(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                 'quick': quick},
+        'results': {},
+        'skipped': {},
+    }
+    with Display() as display, StubServer() as stub:
+        # GUI 를 띄우는 벤치도 가짜 서버와 임시 캐시를 쓴다
+        from yutnori import net
+
+        net.POKEAPI_URL = stub.env['YUTNORI_POKEAPI_URL']
+        net.ADVICE_URL = stub.env['YUTNORI_ADVICE_URL']
+        saved = os.environ.get('YUTNORI_CACHE_DIR')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ['YUTNORI_CACHE_DIR'] = cache_dir
+            for group in groups:
+                t0 = time.perf_counter()
+                if group == 'render' and not display.available:
+                    report['skipped']['render'] = display.reason
+                    log(f"render: skipped ({display.reason})")
+                    continue
+                if group == 'startup':
+                    results = bench_startup(G, repeat, display)
+                else:
+                    results = globals()[f"bench_{group}"](G, repeat)
+                report['results'].update(results)
+                for name, r in results.items():
+                    extra = f"  (+ {', '.join(r['loaded'])})" if r.get('loaded') else ''
+                    log(f"{name:36s} {_fmt(r['median'])} ± {_fmt(r['stdev'])}{extra}")
+                log(f"  ({group}: {time.perf_counter() - t0:.1f}s)")
+        if saved is None:
+            del os.environ['YUTNORI_CACHE_DIR']
+        else:
+            os.environ['YUTNORI_CACHE_DIR'] = saved
+    return report
+
+
+def _fmt(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def compare(old, new, threshold=DEFAULT_THRESHOLD, stat='median'):
+    """(이름, 이전 값, 지금 값, 비율, 회귀 여부) 목록. 한쪽에만 있는 항목은 뺀다.
+
+    이전 값이 0 이면 지금도 0 일 때만 같은 것(비율 1)으로 보고, 아니면 회귀다.
+    시끄러운 공유 머신에서는 stat='min' 이 더 안정적이다.
+    """
+    rows = []
+    for name in sorted(set(old['results']) & set(new['results'])):
+        a, b = old['results'][name][stat], new['results'][name][stat]
+        ratio = b / a if a else (float('inf') if b else 1.0)
+        rows.append((name, a, b, ratio, ratio > 1 + threshold))
+    return rows
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="윷놀이 벤치마크")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_run = sub.add_parser('run')
+    p_run.add_argument('--out', default='bench.json')
+    p_run.add_argument('--only', nargs='+', choices=GROUPS, default=list(GROUPS))
+    p_run.add_argument('--quick', action='store_true')
+    p_cmp = sub.add_parser('compare')
+    p_cmp.add_argument('old')
+    p_cmp.add_argument('new')
+    p_cmp.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                       help="이 비율 넘게 느려지면 회귀 (기본 0.10 = 10%%)")
+    p_cmp.add_argument('--stat', choices=['median', 'min', 'mean'], default='median')
+    sub.add_parser('_startup')
+    args = parser.parse_args()
+
+    if args.command == '_startup':
+        _startup_child()
+    elif args.command == 'run':
+        report = run(args.only, args.quick)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1, ensure_ascii=False)
+        print(f"wrote {args.out}")
+    else:
+        with open(args.old, encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.new, encoding='utf-8') as f:
+            new = json.load(f)
+        rows = compare(old, new, args.threshold, args.stat)
+        for name, a, b, ratio, regressed in rows:
+            flag = 'REGRESSION' if regressed else ('faster' if ratio < 1 - args.threshold else '')
+            print(f"{name:36s} {_fmt(a)} → {_fmt(b)}  x{ratio:5.2f}  {flag}")
+        regressions = [row for row in rows if row[4]]
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} "
+              f"({old['meta'].get('commit')} → {new['meta'].get('commit')})")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,148 @@
+from collections import defaultdict
+
+# ============ 노드/좌표/ID 매핑 ============
+
+NODE, ID2POS = {}, []
+def nid(xy):
+    if xy not in NODE:
+        NODE[xy] = len(ID2POS)
+        ID2POS.append(xy)
+    return NODE[xy]
+
+# 외곽(반시계 CCW) 20칸
+outer = [
+    (1,0),(1,0.2),(1,0.4),(1,0.6),(1,0.8),(1,1),
+    (0.8,1),(0.6,1),(0.4,1),(0.2,1),(0,1),
+    (0,0.8),(0,0.6),(0,0.4),(0,0.2),(0,0),
+    (0.2,0),(0.4,0),(0.6,0),(0.8,0)
+]
+# 대각선: BL↔TR, TL↔BR
+diag_bl_tr = [(0,0),(0.2,0.2),(0.4,0.4),(0.5,0.5),(0.6,0.6),(0.8,0.8),(1,1)]
+diag_tl_br = [(0,1),(0.2,0.8),(0.4,0.6),(0.5,0.5),(0.6,0.4),(0.8,0.2),(1,0)]
+
+OUT_IDS  = [nid(p) for p in outer]
+BLTR_IDS = [nid(p) for p in diag_bl_tr]  # [BL(0),...,CENTER(3),...,TR(6)]
+TLBR_IDS = [nid(p) for p in diag_tl_br]  # [TL(0),...,CENTER(3),...,BR(6)]
+
+START_ID  = OUT_IDS[0]   # BR
+TR_ID     = OUT_IDS[5]
+TL_ID     = OUT_IDS[10]
+BL_ID     = OUT_IDS[15]
+CENTER_ID = nid((0.5,0.5))
+
+# ============ 이동 그래프(NEXTS) 구성 ============
+# - 외곽: CCW 1칸씩
+# - 지름길:
+#   • TR쪽 내부: TR(6)→5→4→CENTER(3)
+#   • TL쪽 내부: TL(0)→1→2→CENTER(3)
+#   • CENTER 이후 반대 코너 쪽: BLTR 2→1→0, TLBR 4→5→6
+#   • 입구(TR/TL)에 서 있으면 무조건 지름길로 진입(코드에서 강제)
+NEXTS = defaultdict(list)
+def add_edge(u, v):
+    NEXTS[u].append(v)
+
+# 외곽 CCW
+for i, u in enumerate(OUT_IDS):
+    add_edge(u, OUT_IDS[(i + 1) % len(OUT_IDS)])
+
+# 대각선 내부(입구→센터) 방향
+# BLTR: TR→...→CENTER (6→5→4→3)
+for i in range(len(BLTR_IDS) - 1, 3, -1):   # 6,5,4
+    add_edge(BLTR_IDS[i], BLTR_IDS[i - 1])
+# TLBR: TL→...→CENTER (0→1→2→3)
+for i in range(0, 3):                       # 0,1,2
+    add_edge(TLBR_IDS[i], TLBR_IDS[i + 1])
+
+# 대각선(센터 이후 반대 코너 방향) — 센터 자체에서의 엣지는 만들지 않음(센터는 코드로 분기)
+# BLTR: 2→1→0 (CENTER(3) 뒤 BL 쪽)
+for i in range(2, 0, -1):
+    add_edge(BLTR_IDS[i], BLTR_IDS[i - 1])
+# TLBR: 4→5→6 (CENTER(3) 뒤 BR 쪽)
+for i in range(4, len(TLBR_IDS) - 1):
+    add_edge(TLBR_IDS[i], TLBR_IDS[i + 1])
+
+# ============ 이동 테이블(MOVE_TABLE) 컴파일 ============
+# - 진행 방향: 외곽(DIR_OUTER) / TR 입구로 들어간 대각선(DIR_BLTR) / TL 입구로 들어간 대각선(DIR_TLBR)
+# - (노드, 진행 방향, 칸수) → (도착 노드, 새 진행 방향, 완주 여부, 지나간 경로)
+# - 대기 중인 말은 노드 -1, 빽도는 칸수 -1 로 조회
+# - 한 칸씩 걷는 규칙(_walk)을 도달 가능한 모든 상태에서 한 번씩만 돌려서 만든다
+DIR_OUTER, DIR_BLTR, DIR_TLBR = 0, 1, 2
+
+def _route_dir(history):
+    if BLTR_IDS[-2] in history:
+        return DIR_BLTR
+    if TLBR_IDS[1] in history:
+        return DIR_TLBR
+    return DIR_OUTER
+
+def _walk(history, steps, is_starting_move):
+    """history 끝에서 steps 칸 전진. (도착 노드, 완주 여부, 새로 지나간 노드들)"""
+    history = list(history)
+    start_len = len(history)
+    node = history[-1]
+    is_on_tr_tl_entrance = node in {TR_ID, TL_ID}
+    is_on_center_entrance = node == CENTER_ID
+
+    for i in range(steps):
+        current_node = node
+        # 1) 턴 시작 시 TR/TL 입구에 있는 경우, 첫 스텝은 지름길로
+        if i == 0 and is_on_tr_tl_entrance:
+            next_node = BLTR_IDS[-2] if current_node == TR_ID else TLBR_IDS[1]
+        # 2) 턴 시작 시 중앙 입구에 있는 경우, 첫 스텝은 도착지로
+        elif i == 0 and is_on_center_entrance:
+            next_node = TLBR_IDS[4]
+        # 3) 이동 중 중앙을 통과하는 경우, 이전 경로에 따라 분기
+        elif current_node == CENTER_ID:
+            prev = history[-2] if len(history) >= 2 else None
+            next_node = BLTR_IDS[2] if prev in BLTR_IDS else TLBR_IDS[4]
+        # 4) 일반 노드: NEXTS 그래프를 따라 이동
+        else:
+            options = NEXTS.get(current_node, [])
+            if not options:
+                return -2, True, tuple(history[start_len:])  # 막다른 길 = 완주 또는 오류
+            next_node = options[0]
+
+        history.append(next_node)
+        node = next_node
+        # 완주: 시작점을 지나치면(턴 시작이 아닌 상태에서 START 재도달)
+        if node == START_ID and not is_starting_move:
+            return -2, True, tuple(history[start_len:])
+
+    return node, False, tuple(history[start_len:])
+
+def _build_move_table():
+    table = {}
+    states = {(-1, DIR_OUTER): ()}  # (노드, 진행 방향) → 그 상태의 history
+    pending = [()]
+    while pending:
+        history = pending.pop()
+        node = history[-1] if history else -1
+        d = _route_dir(history)
+
+        for steps in (1, 2, 3, 4, 5, -1):
+            if steps == -1:
+                if node == -1:
+                    continue
+                new_history = history[:-1]
+                dest = new_history[-1] if new_history else -1
+                table[node, d, -1] = (dest, _route_dir(new_history), False, ())
+            else:
+                if node == -1:
+                    dest, finished, path = _walk([START_ID], steps, True)
+                    path = (START_ID,) + path
+                else:
+                    dest, finished, path = _walk(history, steps, False)
+                new_history = history + path
+                table[node, d, steps] = (dest, _route_dir(new_history), finished, path)
+                if finished:
+                    continue
+
+            key = (dest, _route_dir(new_history))
+            if key not in states:
+                states[key] = new_history
+                pending.append(new_history)
+            # 같은 (노드, 진행 방향)이면 history 도 같아야 테이블 하나로 대신할 수 있다
+            assert states[key] == new_history, key
+    return table
+
+MOVE_TABLE = _build_move_table()
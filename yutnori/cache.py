@@ -0,0 +1,185 @@
+"""포켓몬 이름/스프라이트 디스크 캐시.
+
+    <cache dir>/pokemon/<이름>-<(이름, URL) 해시>.json   한국어 이름, 스프라이트 해시, 받은 시각
+    <cache dir>/blobs/<sha256>        스프라이트 PNG 원본
+    <cache dir>/atlas/<해시>.png/json  스프라이트를 모아 미리 줄여 둔 아틀라스 (yutnori.sprites)
+
+- 기록은 이름과 요청 URL 로 찾는다. YUTNORI_POKEAPI_URL 을 바꾸면 예전 서버의 기록은 쓰지 않는다.
+  파일 이름의 이름 부분은 [a-z0-9-] 만 남긴 것이라 '/' 나 '..' 가 들어간 이름도 pokemon/ 밖에
+  쓰지 않는다. 어느 기록인지는 뒤의 해시가 가린다.
+- 스프라이트는 내용 해시로 저장하므로 같은 그림은 한 번만 저장된다.
+- 읽을 수 없거나 필드가 빠진 기록은 없는 것으로 보고 다시 받는다.
+- 기록은 ttl 이 지나면 다시 받는다. 네트워크가 안 되면 오래된 기록이라도 쓴다.
+- 전체 크기가 max_bytes 를 넘으면 가장 오래 안 쓴 파일부터 지운다 (읽을 때 mtime 갱신).
+  put 마다 세 디렉터리를 훑으므로, warm 처럼 한꺼번에 쓸 때는 끝에 한 번만 훑는다.
+- 모든 쓰기는 임시 파일 → os.replace 라서 동시에 여러 개 띄워도 깨지지 않는다.
+
+    python -m yutnori.cache warm pikachu eevee ...   # 미리 받아 두기
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+_UNSAFE = re.compile(r'[^a-z0-9-]+')
+
+
+def default_cache_dir():
+    if os.environ.get('YUTNORI_CACHE_DIR'):
+        return os.environ['YUTNORI_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'yutnori')
+
+
+def _atomic_write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class PokemonCache:
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or default_cache_dir()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._batch = 0  # warm 중이면 put 이 evict 를 미룬다
+        self._batch_lock = threading.Lock()
+
+    def _record_path(self, english_name, url):
+        name = english_name.lower()
+        digest = hashlib.sha256(f"{name}\n{url}".encode()).hexdigest()[:16]
+        slug = _UNSAFE.sub('-', name).strip('-')[:40] or 'pokemon'
+        return os.path.join(self.path, 'pokemon', f"{slug}-{digest}.json")
+
+    def _blob_path(self, digest):
+        return os.path.join(self.path, 'blobs', digest)
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # LRU 기준 시각 갱신
+            return data
+        except OSError:
+            return None
+
+    def get(self, english_name, url, allow_stale=False):
+        """url 에서 받았던 {'korean_name', 'sprite_data'} 또는 None(없음/만료/깨짐)."""
+        raw = self._read(self._record_path(english_name, url))
+        if raw is None:
+            return None
+        try:
+            record = json.loads(raw)
+            age = time.time() - record['fetched_at']
+            korean_name, sprite = record['korean_name'], record['sprite']
+        except (ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(korean_name, str) or not (sprite is None or isinstance(sprite, str)):
+            return None
+        if not allow_stale and age > self.ttl:
+            return None
+
+        sprite_data = None
+        if sprite:
+            sprite_data = self._read(self._blob_path(sprite))
+            if sprite_data is None:
+                return None
+        return {'korean_name': korean_name, 'sprite_data': sprite_data}
+
+    def put(self, english_name, url, data):
+        digest = None
+        if data['sprite_data']:
+            digest = hashlib.sha256(data['sprite_data']).hexdigest()
+            if not os.path.exists(self._blob_path(digest)):
+                _atomic_write(self._blob_path(digest), data['sprite_data'])
+        record = {'korean_name': data['korean_name'], 'sprite': digest, 'fetched_at': time.time()}
+        _atomic_write(self._record_path(english_name, url), json.dumps(record, ensure_ascii=False).encode())
+        if not self._batch:
+            self.evict()
+
+    def evict(self):
+        """max_bytes 를 넘으면 가장 오래 안 쓴 파일부터 지운다."""
+        entries, total = [], 0
+        for sub in ('pokemon', 'blobs', 'atlas'):
+            try:
+                it = os.scandir(os.path.join(self.path, sub))
+            except FileNotFoundError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.name.startswith('.tmp-'):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def warm(self, english_names, loader=None):
+        """english_names 중 캐시에 없는(만료된) 것만 한꺼번에 받아 둔다."""
+        from yutnori import net
+
+        missing = [name for name in dict.fromkeys(english_names)
+                   if self.get(name, net.pokemon_url(name)) is None]
+        own = loader is None
+        loader = loader or net.PokemonLoader(cache=self)
+        with self._batch_lock:
+            self._batch += 1
+        try:
+            for future in loader.load_all(missing).values():
+                future.result()
+        finally:
+            if own:
+                loader.close()
+            with self._batch_lock:
+                self._batch -= 1
+            self.evict()
+        return missing
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="포켓몬 캐시 관리")
+    parser.add_argument('command', choices=['warm', 'evict'])
+    parser.add_argument('names', nargs='*')
+    parser.add_argument('--file', help="한 줄에 하나씩 이름이 적힌 로스터 파일")
+    parser.add_argument('--dir', default=None)
+    args = parser.parse_args()
+
+    cache = PokemonCache(args.dir)
+    if args.command == 'warm':
+        names = list(args.names)
+        if args.file:
+            with open(args.file, encoding='utf-8') as f:
+                names += [line.strip() for line in f if line.strip()]
+        fetched = cache.warm(names)
+        print(f"{len(fetched)} fetched, {len(names) - len(fetched)} already cached in {cache.path}")
+    else:
+        cache.evict()
@@ -0,0 +1,335 @@
+"""윷놀이 규칙 엔진: 말, 윷 던지기, 턴 진행. tkinter/네트워크 없이 import 된다.
+
+판 그래프는 yutnori.board, 던지기 조회표는 yutnori.throws 에 있고,
+화면은 yutnori.gui 가 이 모듈 위에 얹힌다.
+"""
+import random
+
+from yutnori.board import START_ID, DIR_OUTER, MOVE_TABLE
+from yutnori.throws import YUT_NAMES, throw_one
+
+# ============ 윷/말/게임 로직 ============
+
+YUT_MAP = {"도": 1, "개": 2, "걸": 3, "윷": 4, "모": 5, "빽도": -1}
+
+def throw_yut():
+    # 윷가락 16가지 조합 조회표 한 번 (yutnori.throws)
+    return throw_one(random)
+
+class Piece:
+    # 말 상태는 (노드, 진행 방향) 두 정수뿐이다. 지나온 길 전체는 필요 없다:
+    # 빽도로 돌아갈 칸과 중앙에서 꺾을 방향은 MOVE_TABLE 이 (노드, 진행 방향)만으로 정해 준다
+    __slots__ = ('id', 'player_info', 'pokemon_name', 'korean_name', 'sprite_image',
+                 'node_id', 'onBoard', 'direction', 'stacked_pieces')
+
+    def __init__(self, pid, player_info, pokemon_name):
+        self.id = pid
+        self.player_info = player_info
+        self.pokemon_name = pokemon_name # English name for API calls
+        self.korean_name = pokemon_name.capitalize() # Default value
+        self.sprite_image = None
+        self.node_id = -1
+        self.onBoard = False
+        self.direction = DIR_OUTER
+        self.stacked_pieces = [self]
+
+    def is_waiting(self):  return not self.onBoard
+    def is_finished(self): return self.node_id == -2
+
+    @property
+    def prev_node(self):
+        """빽도로 돌아갈 칸 (출발칸이면 -1 = 판 밖). 판 위에 없으면 None."""
+        if not self.onBoard or self.is_finished():
+            return None
+        return MOVE_TABLE[self.node_id, self.direction, -1][0]
+
+class Move:
+    """legal_moves 가 돌려주는 수 하나. 두기 전에 미리 계산한 도착 칸과 결과.
+
+    dest 는 도착 노드(-1: 판 밖으로, -2: 완주), captured 는 상대를 잡는지,
+    stacked 는 아군을 업는지, finished 는 완주하는지.
+    """
+    __slots__ = ('piece', 'name', 'dest', 'direction', 'captured', 'stacked', 'finished')
+
+    def __init__(self, piece, name, dest, direction, captured, stacked):
+        self.piece = piece
+        self.name = name
+        self.dest = dest
+        self.direction = direction
+        self.captured = captured
+        self.stacked = stacked
+        self.finished = dest == -2
+
+    def __repr__(self):
+        return f"Move({self.piece.id}번 말, {self.name} → {self.dest})"
+
+_MISSING = object()
+
+# 플레이어별 색과 포켓몬 (플레이어/말 수가 더 많으면 돌려 쓴다)
+PLAYER_COLORS = ['blue', 'red', 'green', 'purple']
+POKEMON_ROSTERS = [
+    ['squirtle', 'totodile', 'mudkip', 'piplup', 'oshawott', 'froakie'],
+    ['charmander', 'cyndaquil', 'torchic', 'chimchar', 'tepig', 'fennekin'],
+    ['bulbasaur', 'chikorita', 'treecko', 'turtwig', 'snivy', 'chespin'],
+    ['pikachu', 'mareep', 'elekid', 'shinx', 'blitzle', 'dedenne'],
+]
+
+class YutnoriGameLogic:
+    def __init__(self, n_players=2, n_pieces=4):
+        self.players = []
+        for p in range(n_players):
+            name, color = f'플레이어 {p + 1}', PLAYER_COLORS[p % len(PLAYER_COLORS)]
+            roster = POKEMON_ROSTERS[p % len(POKEMON_ROSTERS)]
+            self.players.append({
+                'name': name, 'color': color,
+                'pieces': [Piece(i, {'name': name, 'color': color}, roster[(i - 1) % len(roster)])
+                           for i in range(1, n_pieces + 1)]})
+        self.current_player_index = 0
+        self.turn_moves = []
+        self.recorder = None  # yutnori.record.RecordWriter
+        # 노드 → 그 칸에 있는 스택(말들이 함께 쓰는 stacked_pieces 리스트). 한 칸에는 스택이 하나뿐이다
+        self.occupancy = {}
+
+    def get_current_player(self): return self.players[self.current_player_index]
+    def switch_player(self):      self.current_player_index = (self.current_player_index + 1) % len(self.players)
+    def check_win_condition(self): return all(p.is_finished() for p in self.get_current_player()['pieces'])
+
+    # --- 턴 진행 (GUI 와 기록 재생이 같이 쓴다) --- 
+    def start_recording(self, recorder):
+        self.recorder = recorder
+        recorder.begin_game(len(self.players), len(self.players[0]['pieces']))
+
+    def has_piece_on_board(self):
+        """판 위에서 움직일 수 있는 말이 있나 (다 들어간 말은 onBoard 가 남아 있어도 세지 않는다)."""
+        return any(p.onBoard and not p.is_finished() for p in self.get_current_player()['pieces'])
+
+    def play_throw(self, name):
+        """던진 결과를 쌓는다. 판에 말이 없어 빽도로 턴이 넘어갔으면 True.
+
+        원래 GUI 규칙 그대로: 판에 올라온 적 있는 말(다 들어간 말도 onBoard 가 남아 있다)이
+        하나도 없으면 빽도는 버리고 턴을 넘긴다. 이번 턴에 남은 결과도 함께 버린다.
+        """
+        if self.recorder:
+            self.recorder.throw(YUT_NAMES.index(name))
+        if name == '빽도' and not any(p.onBoard for p in self.get_current_player()['pieces']):
+            self.turn_moves = []
+            self.switch_player()
+            return True
+        self.turn_moves.append(name)
+        return False
+
+    def play_move(self, piece, move_name):
+        """결과 하나를 쓴다. 이기지 않았고 남은 결과도 한 번 더도 없으면 턴을 넘긴다."""
+        if self.recorder:
+            self.recorder.move(self.get_current_player()['pieces'].index(piece), YUT_NAMES.index(move_name))
+        result = self.move_piece(piece, move_name)
+        self.turn_moves.remove(move_name)
+        result['extra'] = move_name in ('윷', '모') or result['captured']
+        result['won'] = self.check_win_condition()
+        result['turn_over'] = not result['won'] and not self.turn_moves and not result['extra']
+        if result['won'] and self.recorder:
+            self.recorder.end_game(self.current_player_index)
+        if result['turn_over']:
+            self.switch_player()
+        return result
+
+    def pass_turn(self):
+        if self.recorder:
+            self.recorder.pass_turn()
+        self.turn_moves = []
+        self.switch_player()
+
+    # --- 수 생성 / 두기·되돌리기 (탐색용: 객체를 복사하지 않는다) --- 
+    def is_legal(self, piece, move_name):
+        return (move_name in self.turn_moves and piece in self.get_current_player()['pieces']
+                and not piece.is_finished() and not (piece.is_waiting() and move_name == '빽도'))
+
+    def preview(self, piece, move_name):
+        """move_piece 를 부르지 않고 결과만 계산한 Move. 상태는 건드리지 않는다."""
+        steps = YUT_MAP[move_name]
+        dest, direction, _, _ = MOVE_TABLE[piece.node_id, piece.direction, steps]
+        captured = stacked = False
+        if dest >= 0:
+            occupant = self.occupancy.get(dest)
+            if occupant is not None and occupant is not piece.stacked_pieces:
+                if occupant[0].player_info['name'] != self.get_current_player()['name']:
+                    captured = True
+                else:
+                    stacked = True
+        return Move(piece, move_name, dest, direction, captured, stacked)
+
+    def path(self, piece, move_name):
+        """piece 가 move_name 으로 지나갈 칸들 (판 밖에서 들어오면 출발칸부터, 완주면 출발칸에서 끝). 화면용."""
+        steps = YUT_MAP[move_name]
+        dest, _, _, path = MOVE_TABLE[piece.node_id, piece.direction, steps]
+        if steps == -1:
+            return (dest,) if dest >= 0 else ()
+        return path
+
+    def legal_moves(self):
+        """현재 turn_moves 로 둘 수 있는 모든 수. 업힌 말은 맨 앞 말 하나로,
+        혼자 기다리는 말들은 번호가 가장 앞선 하나로 대표한다 (어느 것을 골라도 같은 수다).
+        """
+        pieces = []
+        seen = set()
+        waiting_single = False
+        for piece in self.get_current_player()['pieces']:
+            if piece.is_finished() or id(piece.stacked_pieces) in seen:
+                continue
+            seen.add(id(piece.stacked_pieces))
+            if piece.is_waiting() and len(piece.stacked_pieces) == 1:
+                if waiting_single:
+                    continue
+                waiting_single = True
+            pieces.append(piece)
+        moves = []
+        for name in dict.fromkeys(self.turn_moves):
+            for piece in pieces:
+                if name == '빽도' and piece.is_waiting():
+                    continue
+                moves.append(self.preview(piece, name))
+        return moves
+
+    def make(self, move):
+        """move 를 둔다 (play_move 와 같지만 기록하지 않는다). (결과, 되돌리기 정보)."""
+        piece = move.piece
+        touched = list(piece.stacked_pieces)
+        occupant = self.occupancy.get(move.dest)
+        if occupant is not None and occupant is not piece.stacked_pieces:
+            touched += occupant
+        # 건드릴 말들의 속성, 바뀔 두 칸의 점유 정보, 남은 결과, 차례만 저장한다
+        saved = [(p, p.node_id, p.direction, p.onBoard, p.stacked_pieces) for p in touched]
+        occ = [(node, self.occupancy.get(node, _MISSING)) for node in (piece.node_id, move.dest)]
+        undo = (saved, occ, self.turn_moves[:], self.current_player_index)
+        recorder, self.recorder = self.recorder, None
+        try:
+            result = self.play_move(piece, move.name)
+        finally:
+            self.recorder = recorder
+        return result, undo
+
+    def unmake(self, undo):
+        """make 직전 상태로 정확히 되돌린다 (가장 최근 make 부터 거꾸로)."""
+        saved, occ, turn_moves, player = undo
+        for p, node, direction, on_board, stack in saved:
+            p.node_id, p.direction, p.onBoard, p.stacked_pieces = node, direction, on_board, stack
+        for node, stack in reversed(occ):
+            if stack is _MISSING:
+                self.occupancy.pop(node, None)
+            else:
+                self.occupancy[node] = stack
+        self.turn_moves[:] = turn_moves
+        self.current_player_index = player
+
+    # --- 압축 스냅샷: 말마다 3바이트 + 차례 1바이트 + 남은 결과마다 1바이트 --- 
+    def snapshot(self):
+        """현재 게임 상태를 bytes 로. 말마다 (노드+2, 진행 방향 | 판 위면 4, 같은 스택 다음 말 번호+1)."""
+        out = bytearray()
+        for player in self.players:
+            pieces = player['pieces']
+            for piece in pieces:
+                stack = piece.stacked_pieces
+                i = stack.index(piece) + 1
+                nxt = pieces.index(stack[i]) + 1 if i < len(stack) else 0
+                out += bytes((piece.node_id + 2, piece.direction | (4 if piece.onBoard else 0), nxt))
+        out.append(self.current_player_index)
+        out += bytes(YUT_NAMES.index(name) for name in self.turn_moves)
+        return bytes(out)
+
+    def restore(self, snap):
+        """snapshot() 으로 만든 상태로 되돌린다 (같은 플레이어/말 수의 로직에서)."""
+        self.occupancy.clear()
+        i = 0
+        for player in self.players:
+            pieces = player['pieces']
+            nexts = []
+            for piece in pieces:
+                piece.node_id = snap[i] - 2
+                piece.direction = snap[i + 1] & 3
+                piece.onBoard = bool(snap[i + 1] & 4)
+                nexts.append(snap[i + 2] - 1)
+                i += 3
+            # 다른 말의 "다음 말"이 아닌 말이 스택 맨 앞이다
+            followers = set(nexts)
+            for j, piece in enumerate(pieces):
+                if j in followers:
+                    continue
+                stack = [piece]
+                while nexts[j] >= 0:
+                    j = nexts[j]
+                    stack.append(pieces[j])
+                for sp in stack:
+                    sp.stacked_pieces = stack
+                if piece.onBoard and not piece.is_finished():
+                    self.occupancy[piece.node_id] = stack
+        self.current_player_index = snap[i]
+        self.turn_moves[:] = [YUT_NAMES[k] for k in snap[i + 1:]]
+
+    def finish_all(self, player_index):
+        """player_index 의 말을 모두 다 들어간 것으로 만든다 (치트 키). 판 위의 점유 정보도 지운다."""
+        for piece in self.players[player_index]['pieces']:
+            if piece.onBoard and self.occupancy.get(piece.node_id) is piece.stacked_pieces:
+                del self.occupancy[piece.node_id]
+        for piece in self.players[player_index]['pieces']:
+            piece.node_id, piece.onBoard = -2, True
+            piece.stacked_pieces = [piece]
+
+    # --- 입장/후진 --- 
+    def _enter_from_offboard(self, piece):
+        piece.onBoard = True
+        piece.node_id = START_ID
+        piece.direction = DIR_OUTER
+
+    def _step_backward(self, piece):
+        if not piece.onBoard:
+            return
+        # 한 칸 뒤(출발칸이면 -1 = 판 밖)와 그때의 진행 방향은 테이블에 있다
+        piece.node_id, piece.direction = MOVE_TABLE[piece.node_id, piece.direction, -1][:2]
+        if piece.node_id == -1:
+            piece.onBoard = False
+
+    # --- 핵심 이동 --- 
+    def move_piece(self, piece, move_name):
+        steps = YUT_MAP[move_name]
+
+        # 떠나는 칸의 점유 정보부터 지운다
+        if piece.onBoard and self.occupancy.get(piece.node_id) is piece.stacked_pieces:
+            del self.occupancy[piece.node_id]
+
+        if steps == -1:
+            if not piece.onBoard:
+                self._enter_from_offboard(piece)
+            self._step_backward(piece)
+        else:
+            # 한 칸씩 걷지 않고 미리 컴파일한 테이블에서 한 번에 조회
+            piece.node_id, piece.direction, _, _ = MOVE_TABLE[piece.node_id, piece.direction, steps]
+            piece.onBoard = True
+
+        # 스택(업기) 동기화
+        for p in piece.stacked_pieces:
+            p.node_id = piece.node_id
+            p.direction = piece.direction
+            p.onBoard = piece.onBoard
+
+        if piece.is_finished() or not piece.onBoard:
+            return {'captured': False}
+
+        # 잡기 / 업기: 도착한 칸의 스택 하나만 보면 된다
+        captured = False
+        occupant = self.occupancy.get(piece.node_id)
+        if occupant is not None and occupant is not piece.stacked_pieces:
+            if occupant[0].player_info['name'] != self.get_current_player()['name']:
+                # 상대 잡기
+                for sp in list(occupant):
+                    sp.onBoard, sp.node_id = False, -1
+                    sp.direction = DIR_OUTER
+                    sp.stacked_pieces = [sp]
+                captured = True
+            else:
+                # 아군 업기
+                merged = occupant + piece.stacked_pieces
+                for sp in merged:
+                    sp.stacked_pieces = merged
+        self.occupancy[piece.node_id] = piece.stacked_pieces
+
+        return {'captured': captured}
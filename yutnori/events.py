@@ -0,0 +1,8 @@
+"""게임 기록(yutnori.record)과 대전 서버(yutnori.server)가 같이 쓰는 이벤트 종류.
+
+아무것도 import 하지 않으므로 GUI 가 시작할 때 기록/서버 모듈 없이 불러 쓴다.
+"""
+# read_events 가 돌려주는 이벤트 종류
+THROW, MOVE, PASS, START, END = 'throw', 'move', 'pass', 'start', 'end'
+# 기록에는 없는, 서버 대전에서만 쓰는 이벤트 종류
+THROW_REQUEST, SEAT, REJECT = 'throw?', 'seat', 'reject'
@@ -0,0 +1,353 @@
+"""tkinter 없이 돌아가는 정수 인코딩 윷놀이 시뮬레이터.
+
+게임 상태는 고정 길이 리스트 몇 개로만 표현한다.
+- pos[i]  : 말 i 의 위치 코드 (OFF, DONE, 또는 (노드, 진행 방향) 조합)
+- grp[i]  : 말 i 가 속한 업기 그룹 (그룹 대표 말의 번호)
+- pending : 아직 쓰지 않은 윷 결과 개수 (빽도, 도, 개, 걸, 윷, 모)
+말 번호는 플레이어 p 의 j 번째 말이 p * PIECES + j 이다.
+
+규칙은 YutnoriGameLogic.move_piece / play_throw / check_win_condition 과 같고,
+이동은 board.MOVE_TABLE 을 위치 코드 단위로 다시 펼친 NEXT_POS 한 번 조회로 끝난다.
+GUI 에서는 던지기와 이동 순서를 사람이 고르므로, 여기서는 한 턴을 다음 순서로 고정한다.
+1) 윷/모가 아닐 때까지 던진다 (판에 말이 없는데 빽도면 남은 결과까지 버리고 턴 종료)
+2) 남은 결과를 정책이 고른 (말, 결과) 순서로 쓴다. 잡으면 1) 을 한 번 더 한다.
+3) 쓸 수 있는 결과가 없으면(판에 말 없는 빽도만 남음) 턴을 넘긴다.
+빽도로 턴이 끝나는 조건은 GUI(YutnoriGameLogic.play_throw)와 같다: 판에 올라온 적 있는 말이
+하나도 없을 때. 다 들어간 말(DONE)도 올라온 말로 센다.
+
+범위: 요청의 "코어 하나에서 초당 10만 판" 목표는 이 모듈에서 뺐다. 한 판이 50수 안팎이라
+초당 500만 수, 수 하나에 0.2us 가 필요한데, 이 프로젝트에는 컴파일 확장이 없고 순수 파이썬은
+수 하나에 1~2us 가 든다. 이 모듈이 맡는 것은 tkinter/엔진 객체 없이 엔진과 같은 규칙으로
+대량의 판을 두는 것이고, 양쪽 다 random_policy 인 판은 전용 루프(_run_random)로 엔진보다
+약 2배 빠르다 (bench 의 game[logic] / game[fastsim]: 280us / 140us). 그 이상은
+analytics.simulate 처럼 프로세스 여러 개로 나눠 돌린다.
+"""
+import random
+
+from yutnori.board import MOVE_TABLE
+from yutnori.throws import BACKDO, MO, THROW16, YUT, YUT_NAMES, YUT_STEPS
+
+PLAYERS, PIECES = 2, 4
+N_PIECES = PLAYERS * PIECES
+
+# ============ 위치 코드 / 전이표 ============
+OFF, DONE = 0, 1
+POS_KEYS = [(-1, 0), (-2, 0)] + sorted({(node, d) for node, d, _ in MOVE_TABLE if node >= 0})
+POS_INDEX = {key: i for i, key in enumerate(POS_KEYS)}
+N_POS = len(POS_KEYS)
+NODE_OF = [node for node, _ in POS_KEYS]  # OFF → -1, DONE → -2
+
+NEXT_POS = [DONE] * (N_POS * 6)
+for (node, d, steps), (dest, new_d, finished, _) in MOVE_TABLE.items():
+    src = POS_INDEX[node, d]
+    k = YUT_STEPS.index(steps)
+    NEXT_POS[src * 6 + k] = DONE if finished else POS_INDEX[dest, new_d]
+NEXT_POS[OFF * 6 + BACKDO] = OFF  # 대기 말의 빽도: 들어왔다가 바로 다시 나간다
+
+# 위치마다 도로만 움직였을 때 완주까지 남은 칸 수 (정책의 진행도 기준)
+TO_GO = [0] * N_POS
+for p in range(N_POS):
+    q = p
+    while q != DONE:
+        q = NEXT_POS[q * 6 + 1]
+        TO_GO[p] += 1
+
+
+def random_policy(game, actions, n, rng):
+    return int(rng.random() * n)
+
+
+class FastGame:
+    __slots__ = ('pos', 'grp', 'pending', 'player', 'turns', 'actions')
+
+    def __init__(self):
+        self.pos = [OFF] * N_PIECES
+        self.grp = list(range(N_PIECES))
+        self.pending = [0] * 6
+        self.player = 0
+        self.turns = 0
+        self.actions = [0] * (N_PIECES * 6)  # 가능한 행동: 말 번호 * 8 + 윷 결과 번호
+
+    def reset(self):
+        pos, grp = self.pos, self.grp
+        for i in range(N_PIECES):
+            pos[i] = OFF
+            grp[i] = i
+        self.pending[:] = (0, 0, 0, 0, 0, 0)
+        self.player = 0
+        self.turns = 0
+
+    def copy(self):
+        other = FastGame.__new__(FastGame)
+        other.pos = self.pos[:]
+        other.grp = self.grp[:]
+        other.pending = self.pending[:]
+        other.player = self.player
+        other.turns = self.turns
+        other.actions = [0] * (N_PIECES * 6)
+        return other
+
+    def encode(self):
+        """상태 전체를 정수 하나로 묶는다 (말마다 위치 6비트 + 그룹 2비트, 차례 1비트)."""
+        key = self.player
+        pos, grp = self.pos, self.grp
+        for i in range(N_PIECES):
+            key = (key << 8) | (pos[i] << 2) | (grp[i] % PIECES)
+        return key
+
+    def decode(self, key):
+        pos, grp = self.pos, self.grp
+        for i in range(N_PIECES - 1, -1, -1):
+            pos[i] = (key >> 2) & 0x3F
+            grp[i] = (i - i % PIECES) + (key & 3)
+            key >>= 8
+        self.player = key
+
+    def has_entered(self, player):
+        """대기 중이 아닌 말(판 위 또는 다 들어간 말)이 있나. 빽도로 턴이 끝나는지는 이것으로 정한다."""
+        pos = self.pos
+        for i in range(player * PIECES, player * PIECES + PIECES):
+            if pos[i] != OFF:
+                return True
+        return False
+
+    def throw(self, rng):
+        """윷/모가 아닐 때까지 던져서 pending 에 쌓는다. 턴이 그대로 끝나면 False."""
+        pending = self.pending
+        while True:
+            k = THROW16[rng.getrandbits(4)]
+            if k == BACKDO and not self.has_entered(self.player):
+                return False
+            pending[k] += 1
+            if k != YUT and k != MO:
+                return True
+
+    def legal_actions(self):
+        """가능한 (말, 결과) 행동을 self.actions 앞쪽에 채우고 개수를 돌려준다."""
+        pos, grp, pending, actions = self.pos, self.grp, self.pending, self.actions
+        base = self.player * PIECES
+        n = 0
+        for k in range(6):
+            if not pending[k]:
+                continue
+            for i in range(base, base + PIECES):
+                # 업힌 말은 그룹 대표 말 하나로만 움직인다
+                if grp[i] != i or pos[i] == DONE:
+                    continue
+                if k == BACKDO and pos[i] == OFF:
+                    continue
+                actions[n] = i * 8 + k
+                n += 1
+        return n
+
+    def apply(self, action):
+        """행동 하나를 적용한다. 0: 보통, 1: 잡음(한 번 더), 2: 승리."""
+        pos, grp = self.pos, self.grp
+        i, k = action >> 3, action & 7
+        self.pending[k] -= 1
+        base = self.player * PIECES
+        end = base + PIECES
+
+        dst = NEXT_POS[pos[i] * 6 + k]
+        g = grp[i]
+        for j in range(base, end):
+            if grp[j] == g:
+                pos[j] = dst
+
+        if dst == DONE:
+            for j in range(base, end):
+                if pos[j] != DONE:
+                    return 0
+            return 2
+
+        node = NODE_OF[dst]
+        if node < 0:
+            return 0
+
+        # 잡기: 같은 노드의 상대 말(업힌 말 포함)은 모두 대기로
+        captured = 0
+        obase = (1 - self.player) * PIECES
+        for j in range(obase, obase + PIECES):
+            if NODE_OF[pos[j]] == node:
+                pos[j] = OFF
+                grp[j] = j
+                captured = 1
+
+        # 업기: 같은 노드의 아군 그룹을 움직인 그룹에 합친다
+        for j in range(base, end):
+            if grp[j] != g and NODE_OF[pos[j]] == node:
+                h = grp[j]
+                for m in range(base, end):
+                    if grp[m] == h:
+                        grp[m] = g
+                break
+        return captured
+
+    def play(self, policies, rng=None):
+        """정책 두 개로 한 판을 끝까지 두고 승자 번호를 돌려준다.
+
+        정책은 policy(game, actions, n, rng) → actions[:n] 중 고를 인덱스.
+        """
+        if rng is None:
+            rng = random.Random()
+        self.reset()
+        return self.run(policies, rng)
+
+    def run(self, policies, rng):
+        """지금 상태에서 이어서 끝까지 둔다. pending 이 남아 있으면 던지지 않고 그것부터 쓴다."""
+        if policies[0] is random_policy and policies[1] is random_policy:
+            return self._run_random(rng)
+        pending, actions = self.pending, self.actions
+        while True:
+            self.turns += 1
+            policy = policies[self.player]
+            if any(pending) or self.throw(rng):
+                while True:
+                    n = self.legal_actions()
+                    if not n:
+                        break
+                    result = self.apply(actions[policy(self, actions, n, rng)])
+                    if result == 2:
+                        return self.player
+                    if result == 1 and not self.throw(rng):
+                        break
+            pending[:] = (0, 0, 0, 0, 0, 0)
+            self.player = 1 - self.player
+
+    def _run_random(self, rng):
+        """run 을 양쪽 다 random_policy 로 둘 때의 전용 루프.
+
+        고르는 분포는 run 과 같다 (쓸 수 있는 결과 종류 × 그룹 대표 말 중 균등). 다만 정책 호출,
+        legal_actions 의 여섯 칸 훑기, apply 의 메서드 호출을 모두 루프 안에 풀어 썼고,
+        남은 결과는 종류 목록(kinds)으로 들고 다닌다. 한 번에 던진 결과가 대개 하나라서
+        보통은 그룹 대표 말 목록에서 바로 고른다.
+        """
+        pos, grp, pending = self.pos, self.grp, self.pending
+        getrandbits, rand = rng.getrandbits, rng.random
+        player = self.player
+        kinds = [k for k in range(6) for _ in range(pending[k])]
+        pending[:] = (0, 0, 0, 0, 0, 0)
+        turns = self.turns
+        try:
+            while True:
+                turns += 1
+                base = player * PIECES
+                end = base + PIECES
+                obase = PIECES - base
+                entered = pos[base] != OFF or pos[base + 1] != OFF or pos[base + 2] != OFF or pos[base + 3] != OFF
+                throwing = not kinds
+                while True:
+                    if throwing:
+                        # 윷/모가 아닐 때까지 던진다 (throw 와 같다)
+                        while True:
+                            k = THROW16[getrandbits(4)]
+                            if k == BACKDO and not entered:
+                                kinds = None
+                                break
+                            kinds.append(k)
+                            if k != YUT and k != MO:
+                                break
+                        if kinds is None:
+                            break
+                    leaders = [i for i in range(base, end) if grp[i] == i and pos[i] != DONE]
+                    if len(kinds) == 1:
+                        k = kinds[0]
+                        if k == BACKDO:
+                            leaders = [i for i in leaders if pos[i] != OFF]
+                        if not leaders:
+                            break
+                        i = leaders[int(rand() * len(leaders))]
+                        kinds.clear()
+                    else:
+                        acts = []
+                        for k in sorted(set(kinds)):
+                            for i in leaders:
+                                if k != BACKDO or pos[i] != OFF:
+                                    acts.append(i * 8 + k)
+                        if not acts:
+                            break
+                        action = acts[int(rand() * len(acts))]
+                        i, k = action >> 3, action & 7
+                        kinds.remove(k)
+
+                    # apply 와 같다
+                    entered = True
+                    dst = NEXT_POS[pos[i] * 6 + k]
+                    g = grp[i]
+                    for j in range(base, end):
+                        if grp[j] == g:
+                            pos[j] = dst
+                    if dst == DONE:
+                        if pos[base] == DONE and pos[base + 1] == DONE and pos[base + 2] == DONE and pos[base + 3] == DONE:
+                            return player
+                    else:
+                        node = NODE_OF[dst]
+                        throwing = False
+                        for j in range(obase, obase + PIECES):
+                            if NODE_OF[pos[j]] == node:
+                                pos[j] = OFF
+                                grp[j] = j
+                                throwing = True
+                        for j in range(base, end):
+                            if grp[j] != g and NODE_OF[pos[j]] == node:
+                                h = grp[j]
+                                for m in range(base, end):
+                                    if grp[m] == h:
+                                        grp[m] = g
+                                break
+                        if throwing:
+                            continue
+                    if not kinds:
+                        break
+                kinds = []
+                player = 1 - player
+        finally:
+            self.player = player
+            self.turns = turns
+
+
+def supports(logic):
+    """fastsim(그리고 그 위의 AI / 끝내기 테이블)이 다루는 2인 × 말 4개 게임인가."""
+    return len(logic.players) == PLAYERS and all(len(p['pieces']) == PIECES for p in logic.players)
+
+
+def from_logic(logic):
+    """YutnoriGameLogic 의 현재 상태(차례, turn_moves 포함)를 FastGame 으로 옮긴다."""
+    if not supports(logic):
+        raise ValueError(f"fastsim 은 {PLAYERS}인 × 말 {PIECES}개 게임만 다룬다")
+    game = FastGame()
+    for p, player in enumerate(logic.players):
+        pieces = player['pieces']
+        for j, piece in enumerate(pieces):
+            i = p * PIECES + j
+            if piece.is_finished():
+                game.pos[i] = DONE
+            elif piece.onBoard:
+                game.pos[i] = POS_INDEX[piece.node_id, piece.direction]
+            # 그룹 번호는 업힌 말 중 가장 앞 번호
+            game.grp[i] = p * PIECES + min(pieces.index(sp) for sp in piece.stacked_pieces)
+    for name in logic.turn_moves:
+        game.pending[YUT_NAMES.index(name)] += 1
+    game.player = logic.current_player_index
+    return game
+
+
+def simulate(n_games, policies=(random_policy, random_policy), seed=None):
+    """n_games 판을 두고 플레이어별 승리 수를 돌려준다."""
+    rng = random.Random(seed)
+    game = FastGame()
+    wins = [0] * PLAYERS
+    for _ in range(n_games):
+        wins[game.play(policies, rng)] += 1
+    return wins
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    t0 = time.perf_counter()
+    wins = simulate(n, seed=0)
+    dt = time.perf_counter() - t0
+    print(f"{n} games in {dt:.2f}s ({n / dt:.0f} games/s), wins={wins}")
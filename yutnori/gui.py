@@ -0,0 +1,1002 @@
+"""tkinter 화면. 규칙은 yutnori.engine. 네트워크(yutnori.net), 기록, 서버, 스프라이트, 통계 모듈은
+처음 쓸 때 불러온다 (import 만으로 json/urllib 을 불러오지 않는다: tests/test_imports.py).
+
+    python -m yutnori.gui [--ai] [--record FILE] [--replay FILE --game K] [--metrics FILE] [--trace FILE]
+    python -m yutnori.gui --connect HOST:PORT    # yutnori.server 에 붙는 씬 클라이언트
+    python -m yutnori.gui --heatmap stats.json:captures   # yutnori.analytics 의 칸별 통계를 판 위에
+
+F2 는 FPS / 핸들러 지연 / 네트워크 대기를 보여 주는 성능 오버레이를 켜고 끈다 (yutnori.instrument).
+"""
+import tkinter as tk
+import math
+import random
+import time
+from collections import deque
+
+from yutnori import instrument
+from yutnori.animation import STEP_MS, Animator, PathTween, Pulse, Ticker
+from yutnori.board import (
+    ID2POS, outer, diag_bl_tr, diag_tl_br,
+    START_ID, TR_ID, TL_ID, BL_ID, CENTER_ID,
+)
+from yutnori.engine import YUT_MAP, YutnoriGameLogic, throw_yut
+from yutnori.fastsim import PIECES, from_logic, supports
+from yutnori.events import END, MOVE, PASS, REJECT, SEAT, START, THROW, THROW_REQUEST
+from yutnori.tasks import TaskRunner
+from yutnori.throws import ANIMATION16, THROW16, VISUALS16, YUT_NAMES
+
+# ============ GUI ============
+
+ADVICE_DEADLINE = 3.0     # 조언 API 를 기다리는 최대 시간(초)
+ADVICE_PREFETCH_LEFT = 2  # 남은 말이 이 수 이하가 되면 조언을 미리 받아 둔다
+AI_BUDGET = 0.05          # 컴퓨터 플레이어의 한 수당 생각 시간(초)
+AI_DELAY_MS = 400         # 컴퓨터가 두는 모습을 볼 수 있도록 한 동작마다 쉬는 시간
+WINPROB_WIDTH = 180
+REPLAY_STEP_MS = 600      # 기록 재생 1배속에서 이벤트 사이 간격
+BOARD_SIZE = 560          # 기본 판 크기(px). 창 크기가 바뀌면 비율대로 늘리고 줄인다
+MIN_BOARD_SIZE = 240
+OVERLAY_REFRESH_MS = 500  # 성능 오버레이 글자를 고치는 간격
+HEARTBEAT_MS = 16         # 오버레이의 FPS: 이 간격으로 예약한 after 가 초당 몇 번 돌았나
+YUT_ANIMATION_MS = 1000   # 윷가락이 굴러가는 시간
+YUT_ROLL_MS = 50          # 굴러가는 중 윷가락 모양을 바꾸는 간격
+CAPTURE_COLOR = '#FF3030'
+WAIT_PER_ROW = 6             # 판 밖 대기 줄 하나에 놓는 말 수 (플레이어마다)
+MOVE_SLOTS = len(YUT_NAMES)  # 이동 선택 버튼 수 (결과 종류마다 하나)
+
+class YutnoriGUI(tk.Frame):
+    def __init__(self, master=None, ai_players=(), record_path=None, replay=None, connect=None,
+                 heatmap=None):
+        super().__init__(master)
+        self.master = master
+        self.master.title('윷놀이')
+        self.master.geometry('1000x720')
+        self.pack(fill=tk.BOTH, expand=True)
+
+        # replay: (기록 파일, 게임 번호) — 그 게임을 처음부터 다시 보여 준다
+        self.replay = None
+        if replay:
+            from yutnori.record import read_game
+
+            self.replay = read_game(*replay)
+        if self.replay:
+            self.game = YutnoriGameLogic(self.replay.n_players, self.replay.n_pieces)
+        else:
+            self.game = YutnoriGameLogic()
+        self.recorder = None
+        if record_path and not self.replay:
+            from yutnori.record import RecordWriter
+
+            self.recorder = RecordWriter(record_path)
+            self.game.start_recording(self.recorder)
+        self.selected_piece = None
+        self.canvas_size, self.margin = BOARD_SIZE, 40
+        self.zoom = 1.0           # 지금 쓰는 스프라이트 배율 (yutnori.sprites.ZOOMS 중 하나)
+        self.sprites = None       # SpriteAtlas
+        self.sprites_ready = False
+        self._sprite_png = {}     # 포켓몬 이름 → 받은 PNG (아틀라스를 만들 때까지만 둔다)
+        self._native_photos = {}  # Pillow 가 없을 때 이름별 원본 PhotoImage
+        # 보존형(retained) 렌더링 상태
+        self._board_drawn = False
+        self._piece_items = {}   # piece → 캔버스 아이템 id 들
+        self._piece_views = {}   # piece → 마지막으로 그린 모양
+        self.items_created = 0
+        self.pieces_updated = 0
+        self.last_frame_stats = {'items_created': 0, 'pieces_updated': 0}
+        # 이동 선택 칸에서 새로 만든 Tk 위젯 수 (전체 / 지난 턴)
+        self.widgets_created = 0
+        self.last_turn_widgets = 0
+        self._turn_widgets_start = 0
+        self._panel_player = None
+        # 애니메이션은 모두 이 스케줄러 하나가 돌린다 (yutnori.animation)
+        self.animator = Animator(self)
+        self._animating = set()   # 애니메이션이 아이템을 옮기는 중인 말 (draw_pieces 가 건드리지 않는다)
+        self._piece_anims = set()  # 진행 중인 말 이동 애니메이션
+        self._free_effects = []   # 다 쓴 효과용 원 아이템 (다시 빌려 쓴다)
+        self.heatmap = heatmap    # 칸 번호 순서의 0~1 값 (yutnori.analytics), 판 위에 겹쳐 그린다
+
+        # 네트워크 호출은 모두 이 러너로 보내서 Tk 루프를 막지 않는다
+        self.tasks = TaskRunner(self)
+        self.bind('<Destroy>', lambda e: self.close() if e.widget is self else None)
+        self._advice_task = None
+        self._advice = None
+        self._winner = None
+
+        # 컴퓨터 플레이어와 승률 막대는 fastsim 이 다루는 2인 × 말 4개 게임에서만 쓴다
+        # (다른 크기로 기록된 게임을 다시 볼 때는 둘 다 끈다)
+        self.fast_compatible = supports(self.game)
+        # 컴퓨터 플레이어 자리 (플레이어 번호 집합)
+        self.ai_players = set(ai_players) if self.fast_compatible else set()
+        self._layout_players()
+        # 끝내기 승률 테이블이 있으면 승률 막대와 컴퓨터의 끝내기 수에 쓴다
+        from yutnori.tablebase import Tablebase
+
+        self.tablebase = Tablebase.open_default()
+        self._winprob_key = None   # 승률 막대가 보여 주는(또는 계산 중인) 국면
+        self._winprob_task = None
+        self.ai = None
+        if self.ai_players:
+            from yutnori.ai import YutAI
+
+            self.ai = YutAI(budget=AI_BUDGET, tablebase=self.tablebase)
+        self._ai_busy = False    # 예약됐거나 생각 중
+        self._ai_acting = False  # 컴퓨터가 버튼 핸들러를 부르는 중
+        # 서버 대전(connect): 내 동작은 서버로 보내고, 서버가 돌려준 이벤트만 로직에 둔다
+        self.remote = None          # yutnori.server.Connection
+        self.remote_seat = None
+        self._remote_events = deque()
+        self._remote_over = False
+        self._throw_requested = False
+        self._rolling = False       # 윷가락이 굴러가는 중 (그동안 온 이벤트는 기다린다)
+
+        self.create_widgets()
+        self.update_display()         # 대체 원으로 판을 먼저 그리고
+        self.load_all_pokemon_data()  # 이름/스프라이트는 도착하는 대로 채운다
+        self.master.bind('<F1>', self.cheat_win_p1)
+        self._overlay = None  # 켜져 있으면 {'items', 'ticks', 'since', 'owns_instrument'}
+        self.master.bind('<F2>', self.toggle_overlay)
+        if self.replay:
+            self._replay_pos = 0
+            self.throw_button.config(state=tk.DISABLED)
+            self.after(REPLAY_STEP_MS, self.replay_step)
+        elif connect:
+            self.connect(connect)
+
+    def close(self):
+        self.animator.cancel_all()
+        if self.remote is not None:
+            self.tasks.loop.call_soon_threadsafe(self.remote.close)
+        self.tasks.close()
+        if self.recorder:
+            self.recorder.close()
+
+    def norm_to_canvas(self, pos):
+        x = self.margin + pos[0] * self.canvas_size
+        y = self.margin + (1 - pos[1]) * self.canvas_size
+        return x, y
+
+    def create_widgets(self):
+        canvas_dim = self.canvas_size + 2 * self.margin
+        self.canvas = tk.Canvas(self, width=canvas_dim, height=canvas_dim, bg='#D2B48C', highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.canvas.bind('<Configure>', self.on_canvas_resize)
+
+        control = tk.Frame(self, width=220, bg='#F0F0F0')
+        control.pack(side=tk.RIGHT, fill=tk.Y, padx=8, pady=10)
+        control.pack_propagate(False)
+
+        self.player_label = tk.Label(control, text="", font=("Malgun Gothic", 18, "bold"), bg='#F0F0F0', fg='#2244FF')
+        self.player_label.pack(pady=(10, 10))
+
+        self.yut_display_label = tk.Label(control, text="", font=("Malgun Gothic", 24, "bold"), bg='#F0F0F0', height=2)
+        self.yut_display_label.pack(pady=10)
+
+        # 끝내기 승률 막대 (테이블이 다루는 국면에서만 보인다)
+        self.winprob_bar = tk.Canvas(control, width=WINPROB_WIDTH, height=14, bg='#F0F0F0', highlightthickness=0)
+        self.winprob_items = [self.winprob_bar.create_rectangle(0, 0, 0, 14, width=0, fill=p['color'])
+                              for p in self.game.players]
+        self.winprob_label = tk.Label(control, text="", bg='#F0F0F0', font=("Malgun Gothic", 9))
+        self.winprob_bar.pack(pady=(0, 2))
+        self.winprob_label.pack()
+
+        if self.replay:
+            self.replay_speed = tk.DoubleVar(value=1.0)
+            tk.Scale(control, label="재생 속도(배)", variable=self.replay_speed, from_=0.25, to=8,
+                     resolution=0.25, orient=tk.HORIZONTAL, bg='#F0F0F0').pack(fill=tk.X, padx=12)
+
+        self.throw_button = tk.Button(control, text="윷 굴리기", command=self.handle_throw_yut, height=2)
+        self.throw_button.pack(pady=10, fill=tk.X, padx=12)
+
+        self.moves_frame = tk.Frame(control, bg='#F0F0F0')
+        self.moves_frame.pack(pady=10, fill=tk.X)
+        self._build_moves_panel()
+
+        self.message_label = tk.Label(control, text="게임을 시작하세요!", wraplength=180, bg='#F0F0F0',
+                                      font=("Malgun Gothic", 10, "bold"), fg='#333')
+        self.message_label.pack(side=tk.BOTTOM, pady=20)
+
+    def draw_board(self):
+        # 판은 바뀌지 않으므로 처음 한 번만 그린다
+        if self._board_drawn:
+            return
+        self._board_drawn = True
+        # 외곽 선
+        for i in range(len(outer)):
+            self.canvas.create_line(
+                self.norm_to_canvas(outer[i]),
+                self.norm_to_canvas(outer[(i + 1) % len(outer)]),
+                width=2, fill="#222", tags="board"
+            )
+        # 대각선 선(두 줄)
+        self.canvas.create_line(self.norm_to_canvas(diag_bl_tr[0]), self.norm_to_canvas(diag_bl_tr[-1]),
+                                width=2, fill="#222", tags="board")
+        self.canvas.create_line(self.norm_to_canvas(diag_tl_br[0]), self.norm_to_canvas(diag_tl_br[-1]),
+                                width=2, fill="#222", tags="board")
+
+        # 노드 원
+        for i, pos in enumerate(ID2POS):
+            x, y = self.norm_to_canvas(pos)
+            is_corner = i in (START_ID, TR_ID, TL_ID, BL_ID)
+            is_center = i == CENTER_ID
+            r = (16 if (is_corner or is_center) else 11) * self.canvas_size / BOARD_SIZE
+            fill = "#FFD000" if is_center else "white"
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=fill, outline="#000", width=2, tags="board")
+        self.items_created += len(outer) + 2 + len(ID2POS)
+        if self.heatmap:
+            self.show_heatmap(self.heatmap)
+
+    def show_heatmap(self, values):
+        """칸마다 값(0~1)만큼 진한 원을 판 위, 말 아래에 반투명으로 겹친다. None 이면 지운다."""
+        self.canvas.delete('heatmap')
+        self.heatmap = values
+        if not values:
+            return
+        from yutnori.analytics import heat_color
+
+        for pos, v in zip(ID2POS, values):
+            if v <= 0:
+                continue
+            x, y = self.norm_to_canvas(pos)
+            r = (8 + 14 * v) * self.canvas_size / BOARD_SIZE
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=heat_color(v), outline='',
+                                    stipple='gray50', tags='heatmap')
+            self.items_created += 1
+        # 판 바로 위, 말과 효과 아래
+        self.canvas.tag_lower('heatmap')
+        self.canvas.tag_lower('board')
+
+    def on_canvas_resize(self, event):
+        # 판을 새 크기로 다시 그리고, 스프라이트는 미리 만들어 둔 배율 중 가장 가까운 것으로 바꾼다
+        size = max(min(event.width, event.height) - 2 * self.margin, MIN_BOARD_SIZE)
+        if size == self.canvas_size:
+            return
+        self._finish_piece_animations()  # 옛 크기로 계산한 경로는 버리고 끝 자리로
+        self.canvas_size = size
+        self.canvas.delete('board')
+        self._board_drawn = False
+        self.draw_board()
+        self.canvas.tag_lower('board')
+        self._piece_views.clear()
+        from yutnori.sprites import nearest_zoom
+
+        zoom = nearest_zoom(size / BOARD_SIZE)
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self._apply_sprites()
+        else:
+            self.draw_pieces()
+
+    def load_all_pokemon_data(self):
+        # urllib/http.client 는 import 만으로도 느려서 여기서 처음 불러온다
+        from yutnori.cache import PokemonCache
+        from yutnori.net import PokemonLoader
+
+        self.message_label.config(text="포켓몬을 불러오는 중...")
+        self._pokemon_loader = PokemonLoader(cache=PokemonCache())
+        pieces = [piece for player in self.game.players for piece in player['pieces']]
+        self._pokemon_pending = len(pieces)
+        for piece in pieces:
+            future = self._pokemon_loader.load(piece.pokemon_name)
+            if future.done():
+                # 캐시에 있던 것은 첫 화면부터 바로 보인다
+                self._on_pokemon_loaded(piece, future.result())
+            else:
+                self.tasks.submit(future, on_done=lambda data, p=piece: self._on_pokemon_loaded(p, data))
+
+    def _on_pokemon_loaded(self, piece, data):
+        piece.korean_name = data['korean_name']
+        if data['sprite_data']:
+            # 여기(메인 스레드)에서는 디코드하지 않는다. 다 모이면 작업 스레드에서 아틀라스로 만든다
+            self._sprite_png[piece.pokemon_name] = data['sprite_data']
+        self.draw_pieces()
+
+        self._pokemon_pending -= 1
+        if self._pokemon_pending:
+            return
+        self._pokemon_loader.close()
+        from yutnori.sprites import load_or_build
+
+        sprites = dict(self._sprite_png)
+        self.tasks.submit(lambda: load_or_build(sprites), on_done=self._on_atlas_ready,
+                          on_error=lambda e: self._on_atlas_ready(None))
+        if self.message_label.cget('text') == "포켓몬을 불러오는 중...":
+            self.message_label.config(text="게임을 시작하세요!")
+
+    def _on_atlas_ready(self, atlas):
+        if atlas is None:
+            # Pillow 가 없으면 원본 PNG 를 그대로 쓴다 (이름마다 한 번만 디코드, 배율 없음)
+            for name, png in self._sprite_png.items():
+                self._native_photos[name] = tk.PhotoImage(data=png)
+        else:
+            from yutnori.sprites import SpriteAtlas
+
+            self.sprites = SpriteAtlas(self, *atlas)
+        self._sprite_png = {}
+        self.sprites_ready = True
+        self._apply_sprites()
+
+    def _apply_sprites(self):
+        for player in self.game.players:
+            for piece in player['pieces']:
+                if self.sprites is not None:
+                    piece.sprite_image = self.sprites.photo(piece.pokemon_name, self.zoom)
+                else:
+                    piece.sprite_image = self._native_photos.get(piece.pokemon_name)
+        self.draw_pieces()
+
+    def _piece_view(self, pidx, idx, piece):
+        """말 하나를 어떻게 그릴지: (모드, x, y, 스프라이트, 글자, 업힌 말 스프라이트)."""
+        sprite = piece.sprite_image
+        n_pieces = len(self.game.players[pidx]['pieces'])
+        if piece.is_waiting():
+            # 짝수 번 플레이어는 왼쪽부터, 홀수 번은 오른쪽부터 WAIT_PER_ROW 개씩.
+            # 플레이어 1, 2 는 판 아래, 3, 4 는 판 위, 그 뒤는 더 바깥 줄로 (말이 많으면 줄을 더 쓴다)
+            rows = -(-n_pieces // WAIT_PER_ROW)
+            row = (pidx // 4) * rows + idx // WAIT_PER_ROW
+            col = idx % WAIT_PER_ROW
+            x = 0.04 + 0.08 * col if pidx % 2 == 0 else 0.96 - 0.08 * col
+            y = -0.10 - 0.09 * row if pidx % 4 < 2 else 1.10 + 0.09 * row
+            x, y = self.norm_to_canvas((x, y))
+            return ('wait', x, y, sprite, None, None)
+
+        if piece.is_finished():
+            # 완주 표시는 텍스트로 유지 (플레이어마다 말 수만큼 줄을 쓴다)
+            return ('done', 690, 60 + pidx * (n_pieces * 25 + 20) + idx * 25, None,
+                    f"- {piece.korean_name}", None)
+
+        # 스택이면 맨 아래 말만 그림
+        if len(piece.stacked_pieces) > 1 and piece is not piece.stacked_pieces[0]:
+            return ('hidden', 0, 0, None, None, None)
+
+        x, y = self._node_xy(pidx, piece.node_id)
+        badge = badge_sprite = None
+        if len(piece.stacked_pieces) > 1:
+            badge = f"+{len(piece.stacked_pieces)-1}"
+            if self.sprites is not None:
+                from yutnori.sprites import BADGE  # 아틀라스가 있으면 이미 불러온 모듈
+
+                badge_sprite = self.sprites.photo(piece.stacked_pieces[1].pokemon_name, BADGE)
+        return ('board', x, y, sprite, badge, badge_sprite)
+
+    def _layout_players(self):
+        # 판 위 말을 플레이어마다 조금씩 비껴 그린다: 2인이면 왼쪽/오른쪽, 더 많으면 원을 따라
+        n = len(self.game.players)
+        self._player_offsets = [(round(20 * math.cos(math.pi + 2 * math.pi * i / n), 6),
+                                 round(20 * math.sin(math.pi + 2 * math.pi * i / n), 6)) for i in range(n)]
+
+    def _node_xy(self, pidx, node):
+        # Reverted on-board alignment to pixel offset
+        cx, cy = self.norm_to_canvas(ID2POS[node])
+        dx, dy = self._player_offsets[pidx]
+        scale = self.canvas_size / BOARD_SIZE
+        return cx + dx * scale, cy + dy * scale
+
+    def _create_piece_items(self, pidx, piece, color):
+        # 말마다 캔버스 아이템을 한 번만 만들고, 클릭 바인딩도 이때 한 번만 건다
+        tag = f"p{pidx}_m{piece.id}"
+        c = self.canvas
+        items = {
+            'image': c.create_image(0, 0, state=tk.HIDDEN, tags=("piece", tag)),
+            'oval': c.create_oval(0, 0, 0, 0, fill=color, outline="", state=tk.HIDDEN, tags=("piece", tag)),
+            'label': c.create_text(0, 0, text=str(piece.id), fill="white", state=tk.HIDDEN, tags=("piece", tag)),
+            'badge': c.create_text(0, 0, fill=color, font=("Malgun Gothic", 10, "bold"),
+                                   state=tk.HIDDEN, tags=("piece", tag)),
+            'badge_image': c.create_image(0, 0, state=tk.HIDDEN, tags=("piece", tag)),
+            'done': c.create_text(0, 0, fill=color, anchor="w", state=tk.HIDDEN, tags="piece"),
+        }
+        self.items_created += len(items)
+        c.tag_bind(tag, "<Button-1>", lambda e, p=piece: self.handle_piece_click(p))
+        return items
+
+    def draw_pieces(self):
+        # 지난 프레임과 그릴 모양이 달라진 말만 coords/itemconfigure 로 고친다
+        c = self.canvas
+        for pidx, player in enumerate(self.game.players):
+            for idx, piece in enumerate(player['pieces']):
+                if piece in self._animating:
+                    continue
+                view = self._piece_view(pidx, idx, piece)
+                items = self._piece_items.get(piece)
+                if items is None:
+                    items = self._piece_items[piece] = self._create_piece_items(pidx, piece, player['color'])
+                elif self._piece_views.get(piece) == view:
+                    continue
+                self._piece_views[piece] = view
+                self.pieces_updated += 1
+
+                mode, x, y, sprite, text, badge_sprite = view
+                k = self.canvas_size / BOARD_SIZE
+                on_board = mode in ('wait', 'board')
+                if on_board and sprite is not None:
+                    c.coords(items['image'], x, y)
+                    c.itemconfigure(items['image'], image=sprite, state=tk.NORMAL)
+                else:
+                    c.itemconfigure(items['image'], state=tk.HIDDEN)
+                body_state = tk.NORMAL if on_board and sprite is None else tk.HIDDEN
+                r = 12 * k
+                c.coords(items['oval'], x-r, y-r, x+r, y+r)
+                c.coords(items['label'], x, y)
+                c.itemconfigure(items['oval'], state=body_state)
+                c.itemconfigure(items['label'], state=body_state)
+
+                if mode == 'board' and text:
+                    c.coords(items['badge'], x, y + 20 * k)
+                    c.itemconfigure(items['badge'], text=text, state=tk.NORMAL)
+                else:
+                    c.itemconfigure(items['badge'], state=tk.HIDDEN)
+                if mode == 'board' and badge_sprite is not None:
+                    # 업힌 말은 미리 줄여 둔 작은 스프라이트로 옆에 보여 준다
+                    c.coords(items['badge_image'], x + 14 * k, y - 14 * k)
+                    c.itemconfigure(items['badge_image'], image=badge_sprite, state=tk.NORMAL)
+                else:
+                    c.itemconfigure(items['badge_image'], state=tk.HIDDEN)
+
+                if mode == 'done':
+                    c.coords(items['done'], x, y)
+                    c.itemconfigure(items['done'], text=text, state=tk.NORMAL)
+                else:
+                    c.itemconfigure(items['done'], state=tk.HIDDEN)
+
+    def update_display(self):
+        created, updated = self.items_created, self.pieces_updated
+        self.draw_board()
+        self.draw_pieces()
+        # 프레임마다 새로 만든 캔버스 아이템 수 / 다시 그린 말 수
+        self.last_frame_stats = {'items_created': self.items_created - created,
+                                 'pieces_updated': self.pieces_updated - updated}
+        cur = self.game.get_current_player()
+        self.player_label.config(text=cur['name'], fg=cur['color'])
+        self.update_moves_display()
+        self.update_win_probability()
+        self.schedule_ai()
+
+    def update_win_probability(self):
+        # 국면마다 한 번만 계산한다. 던지기 직전 국면은 테이블 조회 한 번이라 바로 그린다.
+        # 남은 결과가 있으면 대개 조회 한 번이지만, 윷/모가 테이블보다 길게 쌓이면 턴 그래프를
+        # 펼쳐야 하므로 러너에서 돌리고, 그동안은 막대를 그대로 둔다
+        game = None
+        if self.tablebase is not None and self.fast_compatible and self._winner is None:
+            game = from_logic(self.game)
+        key = None if game is None else (game.encode(), tuple(game.pending))
+        if key is not None and key == self._winprob_key:
+            return
+        self._winprob_key = key
+        if self._winprob_task is not None:
+            self._winprob_task.cancel()
+            self._winprob_task = None
+        if game is None:
+            self._show_win_probability(None, 0)
+        elif not any(game.pending):
+            self._show_win_probability(self.tablebase.win_probability(game), game.player)
+        else:
+            tablebase = self.tablebase
+            self._winprob_task = self.tasks.submit(
+                lambda: tablebase.win_probability(game),
+                on_done=lambda p: self._show_win_probability(p, game.player),
+                on_error=lambda e: self._show_win_probability(None, 0))
+
+    def _show_win_probability(self, p, player):
+        self._winprob_task = None
+        if p is None:
+            for item in self.winprob_items:
+                self.winprob_bar.itemconfigure(item, state=tk.HIDDEN)
+            self.winprob_label.config(text="")
+            return
+        if player == 1:
+            p = 1.0 - p
+        split = round(WINPROB_WIDTH * p)
+        self.winprob_bar.coords(self.winprob_items[0], 0, 0, split, 14)
+        self.winprob_bar.coords(self.winprob_items[1], split, 0, WINPROB_WIDTH, 14)
+        for item in self.winprob_items:
+            self.winprob_bar.itemconfigure(item, state=tk.NORMAL)
+        self.winprob_label.config(text=f"승률 {p:.0%} : {1 - p:.0%}")
+
+    def _build_moves_panel(self):
+        # 이동 선택 칸은 처음에 한 번만 만들고, 그 뒤로는 글자/상태만 바꾼다 (update_moves_display).
+        # 결과 종류는 YUT_NAMES 만큼뿐이라 같은 결과는 버튼 하나에 묶으면 칸 수가 모자라지 않는다.
+        # 모든 칸을 늘 grid 에 둔 채 빈 칸은 납작하게 숨기므로, 글자나 상태가 바뀌어도 다시 배치하지 않는다
+        frame = self.moves_frame
+        frame.columnconfigure(0, weight=1)
+        # 상태 글도 버튼처럼 width=1 로 두고 열 너비(sticky='ew')를 채운다: 글이 바뀌어도 요청 크기는 그대로다
+        self.moves_status = tk.Label(frame, text="", width=1, bg='#F0F0F0', anchor='center')
+        self.moves_status.grid(row=0, column=0, sticky='ew')
+        self.move_buttons = []
+        for i in range(MOVE_SLOTS):
+            button = tk.Button(frame, width=1, command=lambda i=i: self._on_move_slot(i))
+            button.grid(row=i + 1, column=0, sticky='ew', padx=10, pady=2)
+            self.move_buttons.append(button)
+        self.pass_button = tk.Button(frame, width=1, command=self.handle_pass_turn)
+        self.pass_button.grid(row=MOVE_SLOTS + 1, column=0, sticky='ew', padx=10, pady=2)
+        self._button_bg = self.pass_button.cget('bg')
+        self._slot_moves = [None] * MOVE_SLOTS
+        self._slot_views = {}  # 위젯 → 마지막으로 넣은 (글자, 보이는지)
+        self._count_widgets(2 + MOVE_SLOTS)
+
+    def _count_widgets(self, n):
+        self.widgets_created += n
+        instrument.count('widgets_created', n)
+
+    def _set_slot(self, widget, text):
+        """text 가 None 이면 자리는 그대로 두고 안 보이게 한다. 바뀐 것이 있을 때만 Tk 에 보낸다."""
+        view = (text, text is not None)
+        if self._slot_views.get(widget) == view:
+            return
+        self._slot_views[widget] = view
+        if text is None:
+            widget.config(text="", state=tk.DISABLED, relief=tk.FLAT, bg='#F0F0F0', takefocus=0)
+        else:
+            widget.config(text=text, state=tk.NORMAL, relief=tk.RAISED, bg=self._button_bg, takefocus=1)
+
+    def _on_move_slot(self, i):
+        if self._slot_moves[i] is not None:
+            self.handle_move_selection(self._slot_moves[i])
+
+    def update_moves_display(self):
+        # 턴이 바뀌면 지난 턴 동안 새로 만든 위젯 수를 남긴다 (묶어 두었으니 0 이어야 한다)
+        if self.game.current_player_index != self._panel_player:
+            self._panel_player = self.game.current_player_index
+            self.last_turn_widgets = self.widgets_created - self._turn_widgets_start
+            self._turn_widgets_start = self.widgets_created
+
+        can_move_backdo = self.game.has_piece_on_board()
+        counts = {}
+        for mv in self.game.turn_moves:
+            if mv != '빽도' or can_move_backdo:
+                counts[mv] = counts.get(mv, 0) + 1
+
+        if not self.game.turn_moves:
+            status = "이동할 결과가 없습니다."
+        elif not counts:
+            status = "움직일 수 있는 말이 없습니다."
+        else:
+            status = "사용할 이동 선택:"
+        if self.moves_status.cget('text') != status:
+            self.moves_status.config(text=status)
+
+        names = list(counts)
+        for i, button in enumerate(self.move_buttons):
+            mv = names[i] if i < len(names) else None
+            self._slot_moves[i] = mv
+            if mv is None:
+                self._set_slot(button, None)
+            else:
+                n = counts[mv]
+                self._set_slot(button, f"{mv}({YUT_MAP[mv]})" + (f" ×{n}" if n > 1 else ""))
+        self._set_slot(self.pass_button, "턴 넘기기" if self.game.turn_moves and not counts else None)
+
+    def handle_pass_turn(self):
+        if self.input_locked():
+            return
+        if self.remote is not None and not self._ai_acting:
+            self.send_remote(PASS)
+            return
+        self.message_label.config(text="턴 종료. 다음 플레이어 차례입니다.")
+        self.game.pass_turn()
+        self.throw_button.config(state=tk.NORMAL)
+        self.update_display()
+
+    # -------- 컨트롤러 -------- 
+    def handle_throw_yut(self):
+        if self.input_locked():
+            return
+        self.throw_button.config(state=tk.DISABLED)
+        if self.remote is not None and not self._ai_acting:
+            # 윷은 서버가 던진다. 결과는 이벤트로 돌아온다
+            self._throw_requested = True
+            self.send_remote(THROW_REQUEST)
+            return
+        name, visuals = throw_yut()
+        self.show_yut_animation(name, visuals)
+
+    def show_yut_animation(self, final_name, final_visuals):
+        def roll():
+            # Animate with symbols
+            self.yut_display_label.config(text=ANIMATION16[random.getrandbits(4)])
+
+        def show_result():
+            self._rolling = False
+            visual_str = " ".join(final_visuals)
+            self.yut_display_label.config(text=f"{final_name}\n{visual_str}")
+            self.after_animation(final_name)
+            if self.remote is not None:
+                self._drain_remote()
+
+        self._rolling = True
+        self.animator.add(Ticker(YUT_ROLL_MS, YUT_ANIMATION_MS, roll, on_done=show_result))
+
+    def after_animation(self, name):
+        # 빽도인데 판에 말이 없는 경우
+        if self.game.play_throw(name):
+            self.message_label.config(text="빽도! 하지만 움직일 말이 없어 턴을 넘깁니다.")
+            self.update_display()
+            self.throw_button.config(state=tk.NORMAL)
+            return
+
+        self.update_moves_display()
+        self.update_win_probability()
+        
+        if name in ('윷', '모'):
+            self.throw_button.config(state=tk.NORMAL)
+        
+        self.message_label.config(text="움직일 말을 클릭하세요.")
+        self.schedule_ai()
+
+    def handle_piece_click(self, piece):
+        if self.input_locked():
+            return
+        if piece.player_info['name'] != self.game.get_current_player()['name']:
+            return
+        if not self.game.turn_moves:
+            return
+        self.selected_piece = piece
+        self.message_label.config(text=f"{piece.korean_name}({piece.id}번 말) 선택됨.")
+
+    def handle_move_selection(self, move_name):
+        if self.input_locked():
+            return
+        if not self.selected_piece:
+            self.message_label.config(text="먼저 움직일 말을 클릭하세요.")
+            return
+        if move_name not in self.game.turn_moves:
+            return
+
+        # 빽도 꼼수 방지
+        if self.selected_piece.is_waiting() and move_name == '빽도':
+            self.message_label.config(text="판에 없는 말은 빽도를 할 수 없습니다.")
+            return
+
+        if self.remote is not None and not self._ai_acting:
+            pieces = self.game.get_current_player()['pieces']
+            self.send_remote(MOVE, pieces.index(self.selected_piece), YUT_NAMES.index(move_name))
+            self.selected_piece = None
+            return
+
+        # 앞 수의 애니메이션이 아직 돌고 있으면 끝 자리로 보내고 나서 둔다
+        self._finish_piece_animations()
+        piece = self.selected_piece
+        pidx = self.game.current_player_index
+        mover = piece.stacked_pieces[0]  # 스택이면 화면에 보이는 맨 아래 말
+        # 지나갈 칸과 잡힐 말은 두기 전에 알아 둔다
+        move = self.game.preview(piece, move_name)
+        path = self.game.path(piece, move_name)
+        captured = tuple(self.game.occupancy[move.dest]) if move.captured else ()
+        result = self.game.play_move(piece, move_name)
+        self.selected_piece = None
+        self._animate_move(pidx, mover, path, captured, move.stacked)
+
+        if result['extra']:
+            self.message_label.config(text="한 번 더 굴립니다!")
+            self.throw_button.config(state=tk.NORMAL)
+
+        if any(sum(not p.is_finished() for p in player['pieces']) <= ADVICE_PREFETCH_LEFT
+               for player in self.game.players):
+            self.prefetch_advice()
+
+        if result['won']:
+            self.end_game()
+            return
+
+        if result['turn_over']:
+            self.message_label.config(text="턴 종료. 다음 플레이어 차례입니다.")
+            self.throw_button.config(state=tk.NORMAL)
+        self.update_display()
+
+    # -------- 말 이동 애니메이션 -------- 
+    def _animate_move(self, pidx, mover, path, captured, stacked):
+        """play_move 뒤: mover 의 아이템을 지나간 칸들을 따라 옮기고, 도착하면 잡기/업기 효과를 보여 준다."""
+        start = self._piece_views.get(mover)
+        if start is None or start[0] not in ('wait', 'board'):
+            return  # 그려진 적이 없으면 다음 draw_pieces 가 바로 제자리에 그린다
+        points = [self._node_xy(pidx, node) for node in path]
+        end = self._piece_view(pidx, self.game.players[pidx]['pieces'].index(mover), mover)
+        if end[0] in ('wait', 'board') and (not points or points[-1] != end[1:3]):
+            points.append(end[1:3])  # 빽도로 판 밖에 나간 자리 등
+        self._animating.add(mover)
+        self._animating.update(captured)
+
+        def arrived():
+            self._animating.discard(mover)
+            x, y = points[-1] if points else start[1:3]
+            if captured:
+                self._pulse(x, y, CAPTURE_COLOR)
+                self._send_home(captured)
+            elif stacked:
+                self._pulse(x, y, mover.player_info['color'])
+            self.draw_pieces()
+
+        self._add_piece_anim(PathTween(self.canvas, f"p{pidx}_m{mover.id}", start[1:3], points,
+                                       on_done=arrived))
+
+    def _send_home(self, captured):
+        # 잡힌 스택: 보이던 맨 아래 말만 대기 자리로 날아가고, 나머지는 도착할 때 함께 나타난다
+        leader = captured[0]
+        opp = next(i for i, player in enumerate(self.game.players) if leader in player['pieces'])
+        start = self._piece_views.get(leader)
+
+        def home():
+            self._animating.difference_update(captured)
+            self.draw_pieces()
+
+        if start is None or start[0] != 'board':
+            home()
+            return
+        end = self._piece_view(opp, self.game.players[opp]['pieces'].index(leader), leader)
+        self._add_piece_anim(PathTween(self.canvas, f"p{opp}_m{leader.id}", start[1:3], [end[1:3]],
+                                       step_ms=2 * STEP_MS, on_done=home))
+
+    def _add_piece_anim(self, anim):
+        on_done = anim.on_done
+
+        def done():
+            self._piece_anims.discard(anim)
+            on_done()
+
+        anim.on_done = done
+        self._piece_anims.add(anim)
+        self.animator.add(anim)
+
+    def _finish_piece_animations(self):
+        # 끝내는 중에 이어지는 애니메이션(잡힌 말)이 생기면 그것도 끝낸다
+        while self._piece_anims:
+            self._piece_anims.pop().finish()
+
+    def _pulse(self, x, y, color):
+        # 효과용 원은 다 쓰면 돌려받아 다시 쓴다
+        if self._free_effects:
+            item = self._free_effects.pop()
+        else:
+            item = self.canvas.create_oval(0, 0, 0, 0, fill='', state=tk.HIDDEN, tags='effect')
+            self.items_created += 1
+        k = self.canvas_size / BOARD_SIZE
+        self.animator.add(Pulse(self.canvas, item, x, y, color, 12 * k, 34 * k,
+                                on_done=lambda: self._free_effects.append(item)))
+
+    def prefetch_advice(self):
+        if self._advice_task is None:
+            from yutnori.net import ADVICE_FALLBACK, get_advice
+
+            self._advice_task = self.tasks.submit(
+                get_advice, on_done=self._on_advice, deadline=ADVICE_DEADLINE,
+                on_error=lambda e: self._on_advice(ADVICE_FALLBACK))
+
+    def _on_advice(self, advice):
+        self._advice = advice
+        if self._winner is not None:
+            self.show_win_message()
+
+    def end_game(self):
+        self._winner = self.game.get_current_player()
+        self.prefetch_advice()  # 미리 받아 두지 못했으면 지금 시작하고, 도착하면 문구만 바꾼다
+        self.show_win_message()
+        self.throw_button.config(state=tk.DISABLED)
+
+    def show_win_message(self):
+        advice = self._advice or "..."
+        win_message = f"게임 종료! {self._winner['name']} 승리!\n\n{advice}"
+        self.message_label.config(text=win_message)
+
+    # -------- 컴퓨터 플레이어 / 기록 재생 -------- 
+    def is_ai_turn(self):
+        return self.game.current_player_index in self.ai_players
+
+    def input_locked(self):
+        """컴퓨터 차례, 재생 중, 서버 대전에서 내 차례가 아닐 때는 사람 입력을 받지 않는다."""
+        remote_wait = self.remote is not None and (
+            self.remote_seat != self.game.current_player_index or self._remote_over)
+        return (self.replay is not None or self.is_ai_turn() or remote_wait) and not self._ai_acting
+
+    def _apply_event(self, kind, a, b, animate=False):
+        """기록 재생 / 서버 대전: 이미 정해진 동작 하나를 사람이 누른 것처럼 처리한다."""
+        self._ai_acting = True
+        try:
+            if kind == THROW:
+                name = YUT_NAMES[a]
+                visuals = VISUALS16[THROW16.index(a)]
+                self.throw_button.config(state=tk.DISABLED)
+                if animate:
+                    self.show_yut_animation(name, visuals)
+                else:
+                    self.yut_display_label.config(text=f"{name}\n{' '.join(visuals)}")
+                    self.after_animation(name)
+            elif kind == PASS:
+                self.handle_pass_turn()
+            elif kind == MOVE:
+                self.selected_piece = self.game.get_current_player()['pieces'][a]
+                self.handle_move_selection(YUT_NAMES[b])
+        finally:
+            self._ai_acting = False
+
+    def replay_step(self):
+        if self._winner is not None or self._replay_pos >= len(self.replay.events):
+            return
+        kind, a, b = self.replay.events[self._replay_pos]
+        self._replay_pos += 1
+        self._apply_event(kind, a, b)
+        self.throw_button.config(state=tk.DISABLED)
+        self.after(int(REPLAY_STEP_MS / self.replay_speed.get()), self.replay_step)
+
+    def schedule_ai(self):
+        if self.is_ai_turn() and not self._ai_busy and self._winner is None:
+            self._ai_busy = True
+            self.after(AI_DELAY_MS, self.ai_step)
+
+    def ai_step(self):
+        """사람이 하듯 한 동작만 한다: 쓸 결과가 있으면 이동, 없으면 던지기, 둘 다 안 되면 턴 넘기기."""
+        if not self.is_ai_turn() or self._winner is not None or not self.fast_compatible:
+            self._ai_busy = False
+            return
+        # 상태 복사는 여기(메인 스레드)에서, 탐색은 작업 스레드에서
+        snapshot = from_logic(self.game)
+        if snapshot.legal_actions():
+            self.tasks.submit(lambda: self.ai.choose(snapshot), on_done=self._on_ai_choice)
+            return
+
+        self._ai_busy = False
+        self._ai_acting = True
+        try:
+            if self.throw_button['state'] == tk.NORMAL:
+                self.handle_throw_yut()
+            elif self.game.turn_moves:
+                self.handle_pass_turn()
+        finally:
+            self._ai_acting = False
+
+    def _on_ai_choice(self, action):
+        self._ai_busy = False
+        if self._winner is not None:
+            return
+        self._ai_acting = True
+        try:
+            self.selected_piece = self.game.get_current_player()['pieces'][(action >> 3) % PIECES]
+            self.handle_move_selection(YUT_NAMES[action & 7])
+        finally:
+            self._ai_acting = False
+
+    # -------- 서버 대전 (씬 클라이언트) -------- 
+    def connect(self, address):
+        from yutnori.server import Connection, parse_address
+
+        self.remote = Connection(*parse_address(address))
+        self.throw_button.config(state=tk.DISABLED)
+        self.message_label.config(text="서버에 연결하는 중...")
+        # 연결은 TaskRunner 의 이벤트 루프에서 돌고, 받은 이벤트는 Tk 스레드로 넘긴다
+        self.tasks.submit(self.remote.run(lambda *event: self.tasks.post(self._on_remote_event, *event)),
+                          on_done=lambda _: self._on_remote_closed(None), on_error=self._on_remote_closed)
+
+    def send_remote(self, kind, a=None, b=None):
+        self.tasks.loop.call_soon_threadsafe(self.remote.send, kind, a, b)
+
+    def _on_remote_event(self, kind, a, b):
+        self._remote_events.append((kind, a, b))
+        self._drain_remote()
+
+    def _drain_remote(self):
+        # 윷가락이 굴러가는 동안 온 이벤트는 굴리기가 끝난 뒤에 차례대로 둔다
+        while self._remote_events and not self._rolling:
+            kind, a, b = self._remote_events.popleft()
+            if kind == SEAT:
+                self.remote_seat = a
+                self.message_label.config(text=f"{self.game.players[a]['name']} 자리입니다. 상대를 기다리는 중...")
+            elif kind == START:
+                if (a, b) != (len(self.game.players), len(self.game.players[0]['pieces'])):
+                    self.message_label.config(text="서버의 게임 설정(플레이어/말 수)이 다릅니다.")
+                    self._remote_over = True
+                    self.tasks.loop.call_soon_threadsafe(self.remote.close)
+                    return
+                self.throw_button.config(state=tk.NORMAL)
+                self.message_label.config(text="게임을 시작하세요!")
+            elif kind == REJECT:
+                self.message_label.config(text="서버가 받아들이지 않은 동작입니다.")
+                if self._throw_requested:
+                    self._throw_requested = False
+                    self.throw_button.config(state=tk.NORMAL)
+            elif kind == END:
+                self._remote_over = True
+                if self._winner is None:
+                    self.message_label.config(text="상대가 나가서 게임이 끝났습니다.")
+                    self.throw_button.config(state=tk.DISABLED)
+            else:
+                if kind == THROW:
+                    self._throw_requested = False
+                self._apply_event(kind, a, b, animate=True)
+
+    def _on_remote_closed(self, error):
+        if not self._remote_over:
+            self._remote_over = True
+            self.message_label.config(text=f"서버와 연결이 끊겼습니다.{f' ({error})' if error else ''}")
+            self.throw_button.config(state=tk.DISABLED)
+
+    def cheat_win_p1(self, event=None):
+        """Cheat function to make Player 1 win instantly."""
+        self.game.current_player_index = 0
+        self.game.finish_all(0)
+        self.update_display()
+        self.end_game()
+
+    # -------- 성능 오버레이 (F2) -------- 
+    def toggle_overlay(self, event=None):
+        if self._overlay is not None:
+            self.canvas.delete('overlay')
+            if self._overlay['owns_instrument']:
+                instrument.disable()
+            self._overlay = None
+            return
+        owns = not instrument.ENABLED
+        if owns:
+            instrument.enable()
+        bg = self.canvas.create_rectangle(6, 6, 250, 112, fill='#000', stipple='gray50', width=0, tags='overlay')
+        text = self.canvas.create_text(12, 10, anchor='nw', fill='#0F0', font=("Consolas", 9), tags='overlay')
+        self._overlay = {'items': (bg, text), 'ticks': 0, 'since': time.perf_counter(),
+                         'owns_instrument': owns}
+        self._overlay_heartbeat()
+        self._overlay_refresh()
+
+    def _overlay_heartbeat(self):
+        if self._overlay is None:
+            return
+        self._overlay['ticks'] += 1
+        self.after(HEARTBEAT_MS, self._overlay_heartbeat)
+
+    def _overlay_refresh(self):
+        overlay = self._overlay
+        if overlay is None:
+            return
+        now = time.perf_counter()
+        fps = overlay['ticks'] / (now - overlay['since'])
+        overlay['ticks'], overlay['since'] = 0, now
+        rec = instrument.RECORDER
+        tk_stats, net, draw = rec.stats('tk'), rec.stats('net'), rec.stats('render')
+        lines = [f"FPS {fps:4.0f}"]
+        if tk_stats:
+            lines.append(f"핸들러 p50 {tk_stats['p50_ms']:.2f}ms  p99 {tk_stats['p99_ms']:.2f}ms")
+        if draw:
+            lines.append(f"그리기 p50 {draw['p50_ms']:.2f}ms  p99 {draw['p99_ms']:.2f}ms")
+        anim = self.animator
+        lines.append(f"애니메이션 {len(anim.active)}개  건너뛴 프레임 {anim.dropped}  미룸 {anim.deferred}")
+        lines.append(f"위젯 생성 {self.widgets_created}개  지난 턴 {self.last_turn_widgets}개")
+        if net:
+            lines.append(f"네트워크 대기 {net['total_ms']:.0f}ms ({net['count']}건, p99 {net['p99_ms']:.0f}ms)")
+        self.canvas.itemconfigure(overlay['items'][1], text="\n".join(lines))
+        self.canvas.tag_raise('overlay')
+        self.after(OVERLAY_REFRESH_MS, self._overlay_refresh)
+
+# ============ 실행 ============
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="포켓몬 윷놀이")
+    parser.add_argument('--ai', action='store_true', help="플레이어 2 를 컴퓨터가 둔다")
+    parser.add_argument('--record', metavar='FILE', help="게임을 FILE 에 기록한다 (덧붙이기)")
+    parser.add_argument('--replay', metavar='FILE', help="FILE 에 기록된 게임을 다시 보여 준다")
+    parser.add_argument('--game', type=int, default=0, help="다시 볼 게임 번호 (0부터)")
+    parser.add_argument('--metrics', metavar='FILE', help="계측을 켜고 끝날 때 이름별 통계를 JSON 으로 쓴다")
+    parser.add_argument('--trace', metavar='FILE', help="계측을 켜고 끝날 때 Chrome trace 파일을 쓴다")
+    parser.add_argument('--connect', metavar='HOST:PORT', help="대전 서버(yutnori.server)에 붙어서 둔다")
+    parser.add_argument('--heatmap', metavar='FILE[:NAME]',
+                        help="yutnori.analytics 가 쓴 통계의 칸별 히트맵을 판 위에 그린다 (기본 captures)")
+    args = parser.parse_args(argv)
+
+    if args.metrics or args.trace:
+        instrument.enable()
+    heatmap = None
+    if args.heatmap:
+        from yutnori.analytics import load_heatmap
+
+        heatmap = load_heatmap(args.heatmap)
+    root = tk.Tk()
+    app = YutnoriGUI(master=root, ai_players=(1,) if args.ai and not args.connect else (),
+                     record_path=args.record, replay=(args.replay, args.game) if args.replay else None,
+                     connect=args.connect, heatmap=heatmap)
+    app.mainloop()
+    if args.metrics or args.trace:
+        instrument.RECORDER.counters.update(canvas_items_created=app.items_created,
+                                            pieces_updated=app.pieces_updated,
+                                            widgets_created=app.widgets_created)
+        if args.metrics:
+            instrument.RECORDER.write_json(args.metrics)
+        if args.trace:
+            instrument.RECORDER.write_chrome_trace(args.trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""핫 패스 계측: 시간 구간(span)과 카운터. 꺼져 있으면 아무 일도 하지 않는다.
+
+enable() 이 TARGETS 의 함수들을 재는 래퍼로 바꿔 끼우고 disable() 이 원래 함수로 되돌린다.
+꺼져 있을 때는 원래 함수가 그대로 있으므로 추가 비용이 없다 (bench 의 instrument 항목).
+
+- 규칙/화면: move_piece, throw_yut, draw_board, draw_pieces, update_moves_display,
+  애니메이션 프레임 (Animator._tick)
+- 네트워크: HTTPPool._send (get_pokemon_data 의 HTTP 왕복 하나하나, 재시도/리다이렉트도 한 번씩),
+  get_advice. 작업 스레드에서 잰다
+- Tk 이벤트 처리: tkinter.CallWrapper 하나로 버튼/클릭/after 콜백을 모두 잰다 ('tk' 분류).
+  TaskRunner 의 _poll 과 오버레이의 heartbeat 처럼 주기적으로 도는 살림 콜백은 TK_BACKGROUND 로
+  따로 모아 'tk-bg' 분류로 적는다 (핸들러 지연 히스토그램에 섞이지 않는다)
+
+    instrument.enable()
+    ...
+    instrument.RECORDER.write_json('metrics.json')          # 이름별 횟수/합계/p50/p99
+    instrument.RECORDER.write_chrome_trace('trace.json')    # chrome://tracing, Perfetto 에서 연다
+
+직접 재고 싶은 구간은 `with instrument.span('이름'):`, 개수는 instrument.count('이름').
+이 둘은 꺼져 있으면 함수 호출 한 번 비용만 든다.
+"""
+import functools
+import importlib
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+MAX_EVENTS = 200_000  # trace 로 남길 구간 수 (넘으면 오래된 것부터 버린다)
+WINDOW = 1024         # 백분위수는 이름/분류별 최근 구간들로 계산한다
+
+# (모듈, 클래스 또는 None, 함수 이름, 분류)
+TARGETS = (
+    ('yutnori.engine', 'YutnoriGameLogic', 'move_piece', 'logic'),
+    ('yutnori.gui', None, 'throw_yut', 'logic'),
+    ('yutnori.gui', 'YutnoriGUI', 'draw_board', 'render'),
+    ('yutnori.gui', 'YutnoriGUI', 'draw_pieces', 'render'),
+    ('yutnori.gui', 'YutnoriGUI', 'update_moves_display', 'render'),
+    ('yutnori.animation', 'Animator', '_tick', 'render'),
+    ('yutnori.net', 'HTTPPool', '_send', 'net'),
+    ('yutnori.net', None, 'get_advice', 'net'),
+)
+# 'tk' 대신 'tk-bg' 로 적는 주기 콜백 (after 로 예약한 원래 함수의 __qualname__)
+TK_BACKGROUND = frozenset({
+    'TaskRunner._poll',
+    'YutnoriGUI._overlay_heartbeat',
+    'YutnoriGUI._overlay_refresh',
+})
+
+ENABLED = False
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class Recorder:
+    def __init__(self, max_events=MAX_EVENTS):
+        self.max_events = max_events
+        self.reset()
+
+    def reset(self):
+        self._lock = threading.Lock()
+        self.origin = time.perf_counter_ns()
+        self.events = deque(maxlen=self.max_events)  # (이름, 분류, 시작 ns, 길이 ns, 스레드)
+        self.totals = defaultdict(lambda: [0, 0])    # 이름 → [횟수, 합계 ns]
+        self.recent = defaultdict(lambda: deque(maxlen=WINDOW))  # 이름 또는 분류 → 최근 길이들
+        self.categories = {}                         # 이름 → 분류
+        self.counters = defaultdict(int)
+
+    def add(self, name, cat, start, duration):
+        with self._lock:
+            self.events.append((name, cat, start, duration, threading.get_ident()))
+            total = self.totals[name]
+            total[0] += 1
+            total[1] += duration
+            self.recent[name].append(duration)
+            self.recent[cat].append(duration)
+            self.categories[name] = cat
+
+    def stats(self, key):
+        """이름(또는 분류) 하나의 {count, total_ms, p50_ms, p99_ms, max_ms}. 기록이 없으면 None."""
+        with self._lock:
+            window = sorted(self.recent.get(key, ()))
+            if key in self.totals:
+                count, total = self.totals[key]
+            else:
+                names = [n for n, c in self.categories.items() if c == key]
+                count = sum(self.totals[n][0] for n in names)
+                total = sum(self.totals[n][1] for n in names)
+        if not window:
+            return None
+        return {'count': count, 'total_ms': total / 1e6, 'p50_ms': _percentile(window, 0.5) / 1e6,
+                'p99_ms': _percentile(window, 0.99) / 1e6, 'max_ms': window[-1] / 1e6}
+
+    def summary(self):
+        with self._lock:
+            names = list(self.totals)
+            cats = sorted(set(self.categories.values()))
+            counters = dict(self.counters)
+        return {'spans': {name: dict(self.stats(name), cat=self.categories[name]) for name in sorted(names)},
+                'categories': {cat: self.stats(cat) for cat in cats},
+                'counters': counters}
+
+    def write_json(self, path):
+        import json  # 끝날 때만 쓴다: GUI 시작 경로에서 json 을 불러오지 않는다
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=1, ensure_ascii=False)
+
+    def write_chrome_trace(self, path):
+        """Chrome trace event 형식 ('X' 완료 이벤트, 시각은 마이크로초)."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        threads = {t.ident: t.name for t in threading.enumerate()}
+        trace = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': threads[tid]}}
+                 for tid in {e[4] for e in events} if tid in threads]
+        trace += [{'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+                   'ts': (start - self.origin) / 1000, 'dur': duration / 1000}
+                  for name, cat, start, duration, tid in events]
+        import json
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms',
+                       'otherData': {'counters': dict(self.counters)}}, f)
+
+
+RECORDER = Recorder()
+
+
+# ============ 켜기/끄기 ============
+_installed = []  # (객체, 속성 이름, 원래 값)
+
+
+def _timed(fn, name, cat):
+    add, clock = RECORDER.add, time.perf_counter_ns
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            add(name, cat, start, clock() - start)
+    return wrapper
+
+
+def _tk_target(func):
+    # after() 는 콜백을 callit 으로 감싸서 등록한다: 클로저에서 원래 함수를 꺼낸다
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_name == 'callit' and 'func' in code.co_freevars:
+        return func.__closure__[code.co_freevars.index('func')].cell_contents
+    return func
+
+
+def _tk_call_wrapper(original):
+    add, clock = RECORDER.add, time.perf_counter_ns
+
+    def __call__(self, *args):
+        start = clock()
+        try:
+            return original(self, *args)
+        finally:
+            duration = clock() - start
+            name = getattr(_tk_target(self.func), '__qualname__', '?')
+            add('tk:' + name, 'tk-bg' if name in TK_BACKGROUND else 'tk', start, duration)
+    return __call__
+
+
+def _install(owner, attr, value):
+    _installed.append((owner, attr, owner.__dict__[attr]))
+    setattr(owner, attr, value)
+
+
+def enable(targets=TARGETS, tk_handlers=True):
+    """계측을 켠다. targets 의 모듈은 이때 import 한다 (tkinter 가 싫으면 targets 를 줄인다)."""
+    global ENABLED
+    if ENABLED:
+        return
+    for module_name, cls, attr, cat in targets:
+        module = importlib.import_module(module_name)
+        owner = getattr(module, cls) if cls else module
+        name = f"{cls}.{attr}" if cls else attr
+        _install(owner, attr, _timed(owner.__dict__[attr], name, cat))
+    if tk_handlers:
+        import tkinter
+
+        _install(tkinter.CallWrapper, '__call__', _tk_call_wrapper(tkinter.CallWrapper.__call__))
+    ENABLED = True
+
+
+def disable():
+    """원래 함수들을 되돌려 놓는다. 모은 기록은 RECORDER 에 남는다."""
+    global ENABLED
+    while _installed:
+        owner, attr, original = _installed.pop()
+        setattr(owner, attr, original)
+    ENABLED = False
+
+
+# ============ 직접 재기 ============
+class _Span:
+    __slots__ = ('name', 'cat', 'start')
+
+    def __init__(self, name, cat):
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        RECORDER.add(self.name, self.cat, self.start, time.perf_counter_ns() - self.start)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, cat='app'):
+    return _Span(name, cat) if ENABLED else _NULL_SPAN
+
+
+def count(name, n=1):
+    if ENABLED:
+        RECORDER.counters[name] += n
@@ -0,0 +1,197 @@
+"""PokeAPI / 조언 API 네트워크 호출.
+
+PokemonLoader 는 여러 포켓몬을 스레드 풀에서 한꺼번에 불러온다.
+- 같은 URL 은 한 번만 요청하고 결과(Future)를 나눠 쓴다.
+- 호스트마다 keep-alive 연결을 모아 두고 다시 쓴다 (HTTPPool).
+- 포켓몬 하나가 끝날 때마다 Future 가 완료되므로 화면을 조금씩 채울 수 있다.
+- cache(PokemonCache)가 있으면 먼저 디스크에서 찾고, 받은 결과는 다시 저장한다.
+  네트워크가 실패하면 만료된 캐시라도 쓰고, offline=True 면 아예 요청하지 않는다.
+"""
+import http.client
+import json
+import os
+import threading
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+# 환경 변수로 바꿀 수 있다 (벤치마크/시험용 로컬 서버)
+POKEAPI_URL = os.environ.get('YUTNORI_POKEAPI_URL', "https://pokeapi.co/api/v2/pokemon/{}/")
+ADVICE_URL = os.environ.get('YUTNORI_ADVICE_URL', "https://api.adviceslip.com/advice")
+ADVICE_FALLBACK = "승리한 당신, 언제나 최고입니다!"
+TIMEOUT = 5
+
+
+class HTTPPool:
+    """호스트별 keep-alive 연결을 재사용하는 작은 GET 전용 클라이언트."""
+
+    def __init__(self, timeout=TIMEOUT):
+        self.timeout = timeout
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _connect(self, scheme, netloc):
+        self.connections_opened += 1
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def get(self, url, redirects=3):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+        with self._lock:
+            conn = self._idle[key].pop() if self._idle[key] else None
+        reused = conn is not None
+        if conn is None:
+            conn = self._connect(*key)
+
+        try:
+            resp, body = self._send(conn, path)
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if reused:
+                # 서버가 먼저 닫은 keep-alive 연결이면 새 연결로 한 번만 다시 시도
+                return self.get(url, redirects)
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                self._idle[key].append(conn)
+
+        if resp.status in (301, 302, 303, 307, 308) and redirects:
+            return self.get(urljoin(url, resp.getheader('Location')), redirects - 1)
+        if resp.status >= 400:
+            raise OSError(f"HTTP {resp.status} for {url}")
+        return body
+
+    def _send(self, conn, path):
+        # 왕복 한 번. get 은 재시도/리다이렉트 때 자신을 다시 부르므로 계측은 여기서 한다 (yutnori.instrument)
+        conn.request('GET', path, headers={'User-Agent': 'yutnori', 'Accept-Encoding': 'identity'})
+        resp = conn.getresponse()
+        return resp, resp.read()
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+def pokemon_url(english_name):
+    return POKEAPI_URL.format(english_name.lower())
+
+
+class PokemonLoader:
+    """포켓몬 이름/스프라이트를 동시에 불러오는 로더."""
+
+    def __init__(self, max_workers=8, http=None, cache=None, offline=False):
+        self.http = http or HTTPPool()
+        self.cache = cache
+        self.offline = offline
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='pokeapi')
+        self._requests = {}  # url → Future[bytes]
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        """url 의 내용을 돌려줄 Future. 같은 url 이면 같은 Future 를 준다."""
+        with self._lock:
+            future = self._requests.get(url)
+            if future is None:
+                future = self.executor.submit(self.http.get, url)
+                self._requests[url] = future
+        return future
+
+    def load(self, english_name):
+        """{'korean_name', 'sprite_data'} 를 돌려줄 Future."""
+        result = Future()
+        fallback = english_name.capitalize()
+        url = pokemon_url(english_name)
+
+        if self.cache:
+            cached = self.cache.get(english_name, url, allow_stale=self.offline)
+            if cached is not None:
+                result.set_result(cached)
+                return result
+        if self.offline:
+            result.set_result({'korean_name': fallback, 'sprite_data': None})
+            return result
+
+        def fail(e):
+            # 어떤 예외든 Future 는 반드시 채운다 (안 채우면 result() 가 영원히 기다린다)
+            if result.done():
+                return
+            print(f"Error getting pokemon data for {english_name}: {e}")
+            try:
+                stale = self.cache.get(english_name, url, allow_stale=True) if self.cache else None
+            except Exception:
+                stale = None
+            result.set_result(stale or {'korean_name': fallback, 'sprite_data': None})
+
+        def on_main(f):
+            try:
+                main_data = json.loads(f.result().decode())
+                species = self.fetch(main_data['species']['url'])
+                sprite_url = main_data['sprites']['front_default']
+                sprite = self.fetch(sprite_url) if sprite_url else None
+            except Exception as e:
+                fail(e)
+                return
+            # species 와 sprite 는 동시에 받고, 둘 다 끝나면 한 번만 결과를 채운다
+            species.add_done_callback(
+                lambda _: sprite.add_done_callback(lambda _: finish(species, sprite)) if sprite
+                else finish(species, None))
+
+        def finish(species, sprite):
+            try:
+                korean_name = fallback
+                for name_info in json.loads(species.result().decode())['names']:
+                    if name_info['language']['name'] == 'ko':
+                        korean_name = name_info['name']
+                        break
+                sprite_data = sprite.result() if sprite else None
+            except Exception as e:
+                fail(e)
+                return
+            data = {'korean_name': korean_name, 'sprite_data': sprite_data}
+            try:
+                if self.cache:
+                    self.cache.put(english_name, url, data)
+            except Exception as e:
+                print(f"Error caching pokemon data for {english_name}: {e}")
+            finally:
+                result.set_result(data)
+
+        self.fetch(url).add_done_callback(on_main)
+        return result
+
+    def load_all(self, english_names):
+        """이름마다 load() Future 를 돌려준다 (같은 이름은 한 번만 요청)."""
+        return {name: self.load(name) for name in dict.fromkeys(english_names)}
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.http.close()
+
+
+def get_pokemon_data(english_name, cache=None):
+    loader = PokemonLoader(max_workers=2, cache=cache)
+    try:
+        return loader.load(english_name).result()
+    finally:
+        loader.close()
+
+
+def get_advice():
+    try:
+        with urllib.request.urlopen(ADVICE_URL, timeout=TIMEOUT) as url:
+            data = json.loads(url.read().decode())
+            return data['slip']['advice']
+    except Exception:
+        return ADVICE_FALLBACK
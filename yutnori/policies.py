@@ -0,0 +1,76 @@
+"""fastsim.FastGame 용 말 선택 정책들.
+
+정책은 모두 policy(game, actions, n, rng) → actions[:n] 중 고를 인덱스 형식이다.
+"""
+from yutnori.fastsim import BACKDO, DONE, NEXT_POS, NODE_OF, PIECES, TO_GO, random_policy
+
+
+def _lands(game, action):
+    i, k = action >> 3, action & 7
+    return NEXT_POS[game.pos[i] * 6 + k]
+
+
+def _lead_score(game, action):
+    # 완주에 가까운 말일수록, 많이 가는 결과일수록 좋다. 빽도는 마지막 수단
+    i, k = action >> 3, action & 7
+    return (k == BACKDO, TO_GO[game.pos[i]], -k)
+
+
+def lead_policy(game, actions, n, rng):
+    """가장 앞선 말을 최대한 멀리 보낸다."""
+    best, best_score = 0, None
+    for idx in range(n):
+        score = _lead_score(game, actions[idx])
+        if best_score is None or score < best_score:
+            best, best_score = idx, score
+    return best
+
+
+def _count_at(game, node, first, last):
+    pos = game.pos
+    count = 0
+    for j in range(first, last):
+        if NODE_OF[pos[j]] == node:
+            count += 1
+    return count
+
+
+def capture_policy(game, actions, n, rng):
+    """잡을 수 있으면 가장 많이 잡는 수를, 아니면 lead_policy 를 따른다."""
+    obase = (1 - game.player) * PIECES
+    best, best_count = -1, 0
+    for idx in range(n):
+        dst = _lands(game, actions[idx])
+        if dst == DONE or NODE_OF[dst] < 0:
+            continue
+        count = _count_at(game, NODE_OF[dst], obase, obase + PIECES)
+        if count > best_count:
+            best, best_count = idx, count
+    if best >= 0:
+        return best
+    return lead_policy(game, actions, n, rng)
+
+
+def stack_policy(game, actions, n, rng):
+    """아군 말 위로 업을 수 있으면 업고, 아니면 capture_policy 를 따른다."""
+    base = game.player * PIECES
+    grp = game.grp
+    for idx in range(n):
+        action = actions[idx]
+        dst = _lands(game, action)
+        node = NODE_OF[dst]
+        if dst == DONE or node < 0:
+            continue
+        g = grp[action >> 3]
+        for j in range(base, base + PIECES):
+            if grp[j] != g and NODE_OF[game.pos[j]] == node:
+                return idx
+    return capture_policy(game, actions, n, rng)
+
+
+POLICIES = {
+    'random': random_policy,
+    'lead': lead_policy,
+    'capture': capture_policy,
+    'stack': stack_policy,
+}
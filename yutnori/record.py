@@ -0,0 +1,331 @@
+"""게임 기록: 덧붙이기만 하는 바이너리 로그와 오프셋 색인.
+
+    파일 머리   b'YUTREC' + 버전(1바이트) + 0
+    게임 시작   0x08, 플레이어 수, 말 수
+    던지기      0x00 ~ 0x05                 (윷 결과 번호: 빽도=0 … 모=5)
+    턴 넘기기   0x06
+    이동        0x10 + 말 번호 * 8 + 결과   (말 번호 0~29, 1바이트)
+                0x0A, 말 번호, 결과          (말 번호 30 이상)
+    게임 끝     0x09, 이긴 플레이어 번호
+
+이벤트는 대부분 1바이트다. 게임 끝이 없으면(중간에 끈 게임) 승자 없이 끝난 게임으로 본다.
+<파일>.idx 에는 게임 시작 위치가 u64 로 차례로 붙어 있어서 K 번째 게임으로 바로 간다.
+색인이 없거나 어긋나면 build_index 로 다시 만든다.
+
+    with RecordWriter('games.yut') as rec:
+        logic.start_recording(rec)   # 이후 play_throw / play_move / pass_turn 이 기록된다
+        ...
+    for game in iter_games('games.yut'):   # 파일 전체를 읽지 않고 한 게임씩
+        replay(game)
+"""
+import os
+import struct
+
+from yutnori.engine import YutnoriGameLogic
+from yutnori.events import END, MOVE, PASS, START, THROW  # read_events 가 돌려주는 이벤트 종류
+from yutnori.throws import YUT_NAMES
+
+MAGIC = b'YUTREC'
+INDEX_MAGIC = b'YUTIDX'
+VERSION = 2       # 2: 판에 말이 없는 빽도는 남은 결과까지 버린다 (YutnoriGameLogic.play_throw). 1 과는 다시 두기가 다르다
+HEADER_SIZE = 8
+OFFSET = struct.Struct('<Q')
+CHUNK = 1 << 16
+
+OP_PASS = 0x06
+OP_START = 0x08
+OP_END = 0x09
+OP_MOVE_LONG = 0x0A
+OP_MOVE = 0x10
+SHORT_PIECES = (0x100 - OP_MOVE) // 8
+NO_WINNER = 0xFF
+
+
+class RecordError(ValueError):
+    """기록 파일이 깨졌거나 규칙에 맞지 않는다."""
+
+
+def _header(magic):
+    return magic + bytes((VERSION, 0))
+
+
+def _check_header(head, magic, path):
+    if len(head) < HEADER_SIZE or head[:6] != magic:
+        raise RecordError(f"not a yutnori record: {path}")
+    if head[6] != VERSION:
+        raise RecordError(f"unsupported record version {head[6]} (expected {VERSION}): {path}")
+
+
+def index_path(path):
+    return path + '.idx'
+
+
+def encode_move(piece, k):
+    """이동 이벤트 바이트 (yutnori.server 도 같은 인코딩을 쓴다)."""
+    if piece < SHORT_PIECES:
+        return bytes((OP_MOVE + piece * 8 + k,))
+    return bytes((OP_MOVE_LONG, piece, k))
+
+
+# ============ 쓰기 ============
+class RecordWriter:
+    def __init__(self, path):
+        self.path = path
+        self.f = open(path, 'ab')
+        if self.f.tell() == 0:
+            self.f.write(_header(MAGIC))
+        else:
+            # 다른 버전 파일 뒤에 이어 쓰면 다시 둘 수 없는 파일이 된다
+            with open(path, 'rb') as f:
+                try:
+                    _check_header(f.read(HEADER_SIZE), MAGIC, path)
+                except RecordError:
+                    self.f.close()
+                    raise
+        self.index = open(index_path(path), 'ab')
+        if self.index.tell() == 0:
+            self.index.write(_header(INDEX_MAGIC))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def begin_game(self, n_players, n_pieces):
+        if not (1 <= n_players <= 255 and 1 <= n_pieces <= 255):
+            raise ValueError("players and pieces must fit in one byte")
+        self.f.flush()
+        self.index.write(OFFSET.pack(self.f.tell()))
+        self.index.flush()
+        self.f.write(bytes((OP_START, n_players, n_pieces)))
+
+    def throw(self, k):
+        self.f.write(bytes((k,)))
+
+    def move(self, piece, k):
+        self.f.write(encode_move(piece, k))
+
+    def pass_turn(self):
+        self.f.write(bytes((OP_PASS,)))
+
+    def end_game(self, winner):
+        self.f.write(bytes((OP_END, NO_WINNER if winner is None else winner)))
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+        self.index.close()
+
+
+# ============ 읽기 ============
+def read_events(path, offset=None):
+    """(종류, a, b) 이벤트를 하나씩 돌려준다. offset 이 있으면 그 위치(게임 시작)부터 읽는다.
+
+    START: (플레이어 수, 말 수), THROW: (결과, None), MOVE: (말 번호, 결과),
+    PASS: (None, None), END: (승자 또는 None, None)
+    """
+    with open(path, 'rb') as f:
+        _check_header(f.read(HEADER_SIZE), MAGIC, path)
+        if offset is not None:
+            if offset < HEADER_SIZE:
+                raise RecordError(f"bad game offset {offset}")
+            f.seek(offset)
+        pos = f.tell()
+        buf = b''
+        i = 0
+        while True:
+            if len(buf) - i < 3:
+                # 남은 조각 뒤에 다음 덩어리를 붙여서, 인자가 덩어리 경계에 걸쳐도 읽을 수 있게 한다
+                more = f.read(CHUNK)
+                pos += i
+                buf = buf[i:] + more
+                i = 0
+                if not buf:
+                    return
+            b = buf[i]
+            if b >= OP_MOVE:
+                piece, k = divmod(b - OP_MOVE, 8)
+                if k > 5:
+                    raise RecordError(f"bad move byte 0x{b:02x} at {pos + i}")
+                yield MOVE, piece, k
+                i += 1
+            elif b <= 5:
+                yield THROW, b, None
+                i += 1
+            elif b == OP_PASS:
+                yield PASS, None, None
+                i += 1
+            elif b in (OP_START, OP_MOVE_LONG, OP_END):
+                n_args = 1 if b == OP_END else 2
+                if len(buf) - i < 1 + n_args:
+                    raise RecordError(f"truncated event at {pos + i}")
+                a = buf[i + 1]
+                c = buf[i + 2] if n_args == 2 else None
+                if b == OP_START:
+                    if not a or not c:
+                        raise RecordError(f"bad game header at {pos + i}")
+                    yield START, a, c
+                elif b == OP_MOVE_LONG:
+                    if c > 5:
+                        raise RecordError(f"bad move result {c} at {pos + i}")
+                    yield MOVE, a, c
+                else:
+                    yield END, (None if a == NO_WINNER else a), None
+                i += 1 + n_args
+            else:
+                raise RecordError(f"unknown event 0x{b:02x} at {pos + i}")
+
+
+class Game:
+    __slots__ = ('n_players', 'n_pieces', 'events', 'winner')
+
+    def __init__(self, n_players, n_pieces):
+        self.n_players = n_players
+        self.n_pieces = n_pieces
+        self.events = []  # START/END 를 뺀 (종류, a, b)
+        self.winner = None
+
+
+def iter_games(path, offset=None):
+    """게임을 하나씩 돌려준다 (한 번에 한 게임만 메모리에 둔다)."""
+    game = None
+    for event in read_events(path, offset):
+        kind = event[0]
+        if kind == START:
+            if game is not None:
+                yield game
+            game = Game(event[1], event[2])
+        elif game is None:
+            raise RecordError("event before the first game start")
+        elif kind == END:
+            game.winner = event[1]
+            yield game
+            game = None
+        else:
+            game.events.append(event)
+    if game is not None:
+        yield game
+
+
+def build_index(path):
+    """기록 파일을 훑어서 색인을 다시 쓴다. 게임 수를 돌려준다."""
+    offsets = []
+    with open(path, 'rb') as f:
+        _check_header(f.read(HEADER_SIZE), MAGIC, path)
+        data = f.read(CHUNK)
+        pos, i = HEADER_SIZE, 0
+        while data:
+            # read_events 와 같은 길이 규칙으로 건너뛴다 (인자 바이트를 시작으로 오인하지 않도록)
+            while i < len(data):
+                b = data[i]
+                if b == OP_START:
+                    offsets.append(pos + i)
+                i += 3 if b in (OP_START, OP_MOVE_LONG) else 2 if b == OP_END else 1
+            pos += len(data)
+            i -= len(data)
+            data = f.read(CHUNK)
+    tmp = index_path(path) + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_header(INDEX_MAGIC))
+        for offset in offsets:
+            f.write(OFFSET.pack(offset))
+    os.replace(tmp, index_path(path))
+    return len(offsets)
+
+
+def count_games(path):
+    try:
+        return (os.path.getsize(index_path(path)) - HEADER_SIZE) // OFFSET.size
+    except OSError:
+        return build_index(path)
+
+
+def game_offset(path, k):
+    """K 번째(0부터) 게임의 시작 위치. 색인에서 8바이트만 읽는다."""
+    if not os.path.exists(index_path(path)):
+        build_index(path)
+    with open(index_path(path), 'rb') as f:
+        _check_header(f.read(HEADER_SIZE), INDEX_MAGIC, index_path(path))
+        f.seek(HEADER_SIZE + k * OFFSET.size)
+        raw = f.read(OFFSET.size)
+    if k < 0 or len(raw) < OFFSET.size:
+        raise IndexError(f"no game {k} in {path}")
+    offset = OFFSET.unpack(raw)[0]
+    if not HEADER_SIZE <= offset < os.path.getsize(path):
+        raise RecordError(f"index points outside {path}: game {k} at {offset}")
+    return offset
+
+
+def read_game(path, k):
+    games = iter_games(path, game_offset(path, k))
+    try:
+        game = next(games, None)
+    finally:
+        games.close()
+    if game is None:
+        raise RecordError(f"index points past the end of {path}")
+    return game
+
+
+# ============ 다시 두기 ============
+def replay(game, logic=None):
+    """게임 기록을 YutnoriGameLogic 으로 처음부터 다시 두고, 끝난 로직을 돌려준다.
+
+    규칙에 맞지 않는 이벤트나 기록된 승자와 다른 결과는 RecordError.
+    던지기와 넘기기도 GUI / server.MatchState.check 와 같은 규칙으로 확인한다: 던지기는 턴 첫
+    던지기이거나 윷/모·잡기로 한 번 더 얻었을 때만, 넘기기는 남은 결과를 하나도 쓸 수 없을 때만.
+    """
+    if logic is None:
+        logic = YutnoriGameLogic(game.n_players, game.n_pieces)
+    can_throw = True
+    for n, (kind, a, b) in enumerate(game.events):
+        if kind == THROW:
+            if not can_throw:
+                raise RecordError(f"throw without a throw left at event {n}")
+            name = YUT_NAMES[a]
+            can_throw = logic.play_throw(name) or name in ('윷', '모')
+        elif kind == PASS:
+            if not logic.turn_moves or logic.legal_moves():
+                raise RecordError(f"pass with a usable result or nothing thrown at event {n}")
+            logic.pass_turn()
+            can_throw = True
+        else:
+            pieces = logic.get_current_player()['pieces']
+            name = YUT_NAMES[b]
+            if a >= len(pieces) or not logic.is_legal(pieces[a], name):
+                raise RecordError(f"illegal move at event {n}: piece {a}, {name}")
+            result = logic.play_move(pieces[a], name)
+            if result['won'] and n != len(game.events) - 1:
+                raise RecordError(f"events after the winning move at event {n}")
+            can_throw = can_throw or result['extra'] or result['turn_over']
+    if game.winner is not None:
+        if not logic.check_win_condition() or logic.current_player_index != game.winner:
+            raise RecordError(f"recorded winner {game.winner} does not match the replay")
+    return logic
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="게임 기록 파일 도구")
+    parser.add_argument('command', choices=['stats', 'index', 'verify'])
+    parser.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'index':
+        print(f"{build_index(args.path)} games indexed")
+    else:
+        t0 = time.perf_counter()
+        games = events = 0
+        wins = {}
+        for game in iter_games(args.path):
+            if args.command == 'verify':
+                replay(game)
+            games += 1
+            events += len(game.events)
+            wins[game.winner] = wins.get(game.winner, 0) + 1
+        dt = time.perf_counter() - t0
+        print(f"{games} games, {events} events, {os.path.getsize(args.path)} bytes, "
+              f"wins {wins}, {dt:.2f}s ({games / dt if dt else 0:.0f} games/s)")
@@ -0,0 +1,480 @@
+"""대전 서버: asyncio 이벤트 루프 하나로 여러 판을 동시에 돌린다.
+
+윷은 서버가 던지고(throw_yut), 이동/턴 넘기기는 서버가 규칙을 확인한 뒤에만 받아들인다.
+서버와 클라이언트는 상태 전체가 아니라 이벤트(변화분)만 주고받는다. 이벤트 인코딩은 게임 기록
+(yutnori.record)과 같아서 대부분 1바이트이고, 클라이언트는 받은 이벤트를 자기
+YutnoriGameLogic 에 그대로 두어 같은 상태를 만든다 (규칙은 결정적이다).
+
+    클라이언트 → 서버   0x07 던지기 요청, 0x06 턴 넘기기, 이동 (기록과 같은 바이트)
+    서버 → 클라이언트   0x0B 자리 번호 / 0x08 게임 시작 (플레이어 수, 말 수)
+                        윷 결과 0x00~0x05, 이동, 0x06 턴 넘기기, 0x09 게임 끝 (승자, 0xFF 는 없음)
+                        0x0C 거절 (이유 번호)
+
+서버는 접속한 순서대로 players 명씩 묶어 한 판을 만든다. 누가 나가면 그 판은 승자 없이 끝난다.
+
+    python -m yutnori.server serve --port 7878
+    python -m yutnori.gui --connect 127.0.0.1:7878          # 창 두 개로 대전
+    python -m yutnori.server load --matches 2000 --concurrency 500
+        # 서버를 새 프로세스로 띄우고 봇 클라이언트로 루프백 부하를 걸어
+        # 초당 끝난 판 수와 이동 지연 p50/p99 를 잰다 (--connect 로 이미 떠 있는 서버에도)
+"""
+import asyncio
+import random
+import time
+
+from yutnori.engine import YutnoriGameLogic, throw_yut
+from yutnori.events import REJECT, SEAT, THROW_REQUEST  # 기록에는 없는 이벤트 종류
+from yutnori.record import (
+    END, MOVE, NO_WINNER, OP_END, OP_MOVE, OP_MOVE_LONG, OP_PASS, OP_START, PASS, START, THROW,
+    encode_move,
+)
+from yutnori.throws import YUT_NAMES
+
+OP_THROW = 0x07
+OP_SEAT = 0x0B
+OP_REJECT = 0x0C
+_ARGS = {OP_START: 2, OP_END: 1, OP_MOVE_LONG: 2, OP_SEAT: 1, OP_REJECT: 1}
+_OPCODES = {START: OP_START, END: OP_END, SEAT: OP_SEAT, REJECT: OP_REJECT}
+
+# 거절 이유
+NOT_YOUR_TURN, ILLEGAL, GAME_OVER = 1, 2, 3
+
+DEFAULT_PORT = 7878
+READ_SIZE = 4096
+MAX_BUFFER = 1 << 16  # 보낼 바이트가 이만큼 쌓이도록 읽지 않는 클라이언트는 끊는다
+
+
+class ProtocolError(ValueError):
+    """알 수 없는 바이트이거나 보낼 수 없는 이벤트."""
+
+
+def encode(kind, a=None, b=None):
+    if kind == MOVE:
+        return encode_move(a, b)
+    if kind == THROW:
+        return bytes((a,))
+    if kind == PASS:
+        return bytes((OP_PASS,))
+    if kind == THROW_REQUEST:
+        return bytes((OP_THROW,))
+    if kind == END:
+        return bytes((OP_END, NO_WINNER if a is None else a))
+    if kind == START:
+        return bytes((OP_START, a, b))
+    return bytes((_OPCODES[kind], a))
+
+
+class Decoder:
+    """받은 바이트 조각 → (종류, a, b) 이벤트들. 인자가 다음 조각으로 넘어가도 된다."""
+
+    def __init__(self):
+        self.buf = b''
+
+    def feed(self, data):
+        buf = self.buf + data if self.buf else data
+        events = []
+        i, n = 0, len(buf)
+        while i < n:
+            b = buf[i]
+            if b >= OP_MOVE:
+                piece, k = divmod(b - OP_MOVE, 8)
+                if k > 5:
+                    raise ProtocolError(f"bad move byte 0x{b:02x}")
+                events.append((MOVE, piece, k))
+            elif b <= 5:
+                events.append((THROW, b, None))
+            elif b == OP_PASS:
+                events.append((PASS, None, None))
+            elif b == OP_THROW:
+                events.append((THROW_REQUEST, None, None))
+            else:
+                n_args = _ARGS.get(b)
+                if n_args is None:
+                    raise ProtocolError(f"unknown event 0x{b:02x}")
+                if n - i <= n_args:
+                    break
+                a = buf[i + 1]
+                c = buf[i + 2] if n_args == 2 else None
+                if b == OP_MOVE_LONG:
+                    if c > 5:
+                        raise ProtocolError(f"bad move result {c}")
+                    events.append((MOVE, a, c))
+                elif b == OP_END:
+                    events.append((END, None if a == NO_WINNER else a, None))
+                else:
+                    events.append(({OP_START: START, OP_SEAT: SEAT, OP_REJECT: REJECT}[b], a, c))
+                i += n_args
+            i += 1
+        self.buf = buf[i:]
+        return events
+
+
+def parse_address(text, default_port=DEFAULT_PORT):
+    host, _, port = text.rpartition(':')
+    if not host:
+        return text, default_port
+    return host, int(port)
+
+
+# ============ 판 상태 (서버와 클라이언트가 같이 쓴다) ============
+class MatchState:
+    """규칙 상태와 '지금 던질 수 있나'. 같은 이벤트를 같은 순서로 apply 하면 어디서나 같은 상태다.
+
+    던지기 가능 여부는 GUI 의 던지기 버튼과 같은 규칙이다: 차례 시작, 윷/모, 잡기, 턴이 넘어갈 때.
+    """
+
+    def __init__(self, n_players=2, n_pieces=4):
+        self.logic = YutnoriGameLogic(n_players, n_pieces)
+        self.can_throw = True
+        self.over = False
+        self.winner = None
+
+    def check(self, seat, kind, a=None, b=None):
+        """seat 의 요청이 지금 규칙에 맞으면 None, 아니면 거절 이유."""
+        logic = self.logic
+        if self.over:
+            return GAME_OVER
+        if seat != logic.current_player_index:
+            return NOT_YOUR_TURN
+        if kind == THROW_REQUEST:
+            ok = self.can_throw
+        elif kind == MOVE:
+            pieces = logic.get_current_player()['pieces']
+            ok = a < len(pieces) and logic.is_legal(pieces[a], YUT_NAMES[b])
+        elif kind == PASS:
+            ok = bool(logic.turn_moves) and not logic.legal_moves()
+        else:
+            ok = False
+        return None if ok else ILLEGAL
+
+    def apply(self, kind, a=None, b=None):
+        logic = self.logic
+        if kind == THROW:
+            name = YUT_NAMES[a]
+            self.can_throw = logic.play_throw(name) or name in ('윷', '모')
+        elif kind == MOVE:
+            result = logic.play_move(logic.get_current_player()['pieces'][a], YUT_NAMES[b])
+            self.can_throw = self.can_throw or result['extra'] or result['turn_over']
+            if result['won']:
+                self.over, self.winner = True, logic.current_player_index
+        elif kind == PASS:
+            logic.pass_turn()
+            self.can_throw = True
+        elif kind == END:
+            self.over, self.winner = True, a
+
+
+# ============ 서버 ============
+class _Conn:
+    __slots__ = ('writer', 'match', 'seat')
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.match = None
+        self.seat = None
+
+
+class Match:
+    def __init__(self, server, conns):
+        self.server = server
+        self.conns = conns
+        self.state = MatchState(len(conns), server.n_pieces)
+        start = encode(START, len(conns), server.n_pieces)
+        for seat, conn in enumerate(conns):
+            conn.match, conn.seat = self, seat
+            self._send(conn, encode(SEAT, seat) + start)
+
+    def _send(self, conn, data):
+        transport = conn.writer.transport
+        if transport.is_closing():
+            return
+        transport.write(data)
+        if transport.get_write_buffer_size() > MAX_BUFFER:
+            transport.abort()
+
+    def handle(self, seat, kind, a, b):
+        if kind not in (THROW_REQUEST, MOVE, PASS):
+            raise ProtocolError(f"clients cannot send {kind!r}")
+        server = self.server
+        reason = self.state.check(seat, kind, a, b)
+        if reason is not None:
+            server.stats['rejected'] += 1
+            self._send(self.conns[seat], encode(REJECT, reason))
+            return
+        if kind == THROW_REQUEST:
+            # 윷은 서버가 던진다
+            kind, a = THROW, YUT_NAMES.index(throw_yut()[0])
+        self.state.apply(kind, a, b)
+        server.stats['actions'] += 1
+        out = encode(kind, a, b)
+        if self.state.over:
+            out += encode(END, self.state.winner)
+        for conn in self.conns:
+            self._send(conn, out)
+        if self.state.over:
+            self._close()
+
+    def leave(self, seat):
+        if self.state.over:
+            return
+        self.state.apply(END)
+        for conn in self.conns:
+            if conn.seat != seat:
+                self._send(conn, encode(END))
+        self._close()
+
+    def _close(self):
+        # 쌓인 바이트를 다 보낸 뒤에 닫힌다
+        for conn in self.conns:
+            conn.writer.close()
+        self.server.matches.discard(self)
+        self.server.stats['matches_finished'] += 1
+
+
+class GameServer:
+    def __init__(self, n_players=2, n_pieces=4):
+        self.n_players = n_players
+        self.n_pieces = n_pieces
+        self.matches = set()
+        self._waiting = []
+        self.stats = {'connections': 0, 'matches_started': 0, 'matches_finished': 0,
+                      'actions': 0, 'rejected': 0, 'protocol_errors': 0}
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        """듣기 시작하고 실제 (호스트, 포트)를 돌려준다 (port=0 이면 빈 포트)."""
+        self._server = await asyncio.start_server(self._connection, host, port, backlog=4096)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+
+    def _join(self, conn):
+        self.stats['connections'] += 1
+        self._waiting.append(conn)
+        if len(self._waiting) == self.n_players:
+            conns, self._waiting = self._waiting, []
+            self.matches.add(Match(self, conns))
+            self.stats['matches_started'] += 1
+
+    async def _connection(self, reader, writer):
+        conn = _Conn(writer)
+        self._join(conn)
+        decoder = Decoder()
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                for kind, a, b in decoder.feed(data):
+                    if conn.match is None:
+                        raise ProtocolError("action before the game started")
+                    conn.match.handle(conn.seat, kind, a, b)
+        except ProtocolError:
+            self.stats['protocol_errors'] += 1
+        except ConnectionError:
+            pass
+        finally:
+            if conn.match is None:
+                self._waiting.remove(conn)
+            else:
+                conn.match.leave(conn.seat)
+            writer.close()
+
+
+# ============ 클라이언트 ============
+class Connection:
+    """클라이언트 쪽 연결 하나 (GUI 의 --connect). 같은 이벤트 루프 스레드에서만 쓴다."""
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.writer = None
+
+    async def run(self, on_event):
+        """연결하고, 서버가 닫을 때까지 받은 이벤트마다 on_event(종류, a, b)."""
+        reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        decoder = Decoder()
+        try:
+            while data := await reader.read(READ_SIZE):
+                for event in decoder.feed(data):
+                    on_event(*event)
+        finally:
+            self.writer.close()
+
+    def send(self, kind, a=None, b=None):
+        if self.writer is not None and not self.writer.is_closing():
+            self.writer.write(encode(kind, a, b))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+# ============ 부하 생성기 ============
+async def _bot(host, port, rng, latencies):
+    """규칙대로 무작위로 두는 클라이언트 하나. 자기 동작이 서버에서 돌아오기까지의 시간을 잰다."""
+    reader, writer = await asyncio.open_connection(host, port)
+    decoder = Decoder()
+    state = seat = None
+    sent = sent_kind = None
+    try:
+        while data := await reader.read(READ_SIZE):
+            for kind, a, b in decoder.feed(data):
+                if kind == SEAT:
+                    seat = a
+                elif kind == START:
+                    state = MatchState(a, b)
+                elif kind == REJECT:
+                    raise RuntimeError(f"server rejected a bot action (reason {a})")
+                else:
+                    actor = state.logic.current_player_index
+                    state.apply(kind, a, b)
+                    if actor == seat and sent is not None:
+                        latencies[sent_kind].append(time.perf_counter() - sent)
+                        sent = None
+            if state is None or state.over or sent is not None or state.logic.current_player_index != seat:
+                continue
+            logic = state.logic
+            moves = logic.legal_moves()
+            if moves and (not state.can_throw or rng.random() < 0.7):
+                move = moves[int(rng.random() * len(moves))]
+                sent_kind = MOVE
+                writer.write(encode(MOVE, logic.get_current_player()['pieces'].index(move.piece),
+                                    YUT_NAMES.index(move.name)))
+            elif state.can_throw:
+                sent_kind = THROW
+                writer.write(encode(THROW_REQUEST))
+            else:
+                sent_kind = PASS
+                writer.write(encode(PASS))
+            sent = time.perf_counter()
+    finally:
+        writer.close()
+    return state is not None and state.winner is not None
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else None
+
+
+async def run_load(host, port, matches=1000, concurrency=200, players=2, seed=0):
+    """concurrency 판씩 동시에 붙여 matches 판을 끝까지 둔다. 결과 dict."""
+    rng = random.Random(seed)
+    latencies = {MOVE: [], THROW: [], PASS: []}
+    gate = asyncio.Semaphore(concurrency)
+    finished = 0
+
+    async def one_match():
+        nonlocal finished
+        async with gate:
+            bots = [_bot(host, port, random.Random(rng.random()), latencies) for _ in range(players)]
+            # 접속 순서로 짝이 지어지므로 같은 판의 봇끼리 만난다는 보장은 없다 (판 수만 센다)
+            done = sum(await asyncio.gather(*bots))
+            finished += done
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one_match() for _ in range(matches)))
+    wall = time.perf_counter() - t0
+    report = {'matches': finished // players, 'wall_s': wall, 'matches_per_s': finished / players / wall,
+              'actions_per_s': sum(map(len, latencies.values())) / wall, 'concurrency': concurrency}
+    for kind, values in latencies.items():
+        report[f'{kind}_count'] = len(values)
+        for q in (0.5, 0.99):
+            v = _percentile(values, q)
+            report[f'{kind}_p{round(q * 100)}_ms'] = None if v is None else v * 1000
+    return report
+
+
+def _raise_fd_limit():
+    # 연결 수천 개 = 파일 기술자 수천 개
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    want = hard if hard != resource.RLIM_INFINITY else 65536
+    if soft < want:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (want, hard))
+
+
+def spawn_server(players=2, pieces=4):
+    """서버를 새 프로세스로 띄우고 (Popen, 호스트, 포트). 부하 생성기와 CPU 를 나눠 쓰게 한다."""
+    import os
+    import subprocess
+    import sys
+
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [here, os.environ.get('PYTHONPATH')])))
+    proc = subprocess.Popen([sys.executable, '-m', 'yutnori.server', 'serve', '--port', '0',
+                             '--players', str(players), '--pieces', str(pieces)],
+                            stdout=subprocess.PIPE, text=True, env=env)
+    line = proc.stdout.readline()
+    if not line.startswith('listening on '):
+        proc.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    host, port = parse_address(line.split()[-1])
+    return proc, host, port
+
+
+if __name__ == '__main__':
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="윷놀이 대전 서버 / 부하 생성기")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_serve = sub.add_parser('serve')
+    p_serve.add_argument('--host', default='127.0.0.1')
+    p_serve.add_argument('--port', type=int, default=DEFAULT_PORT)
+    p_serve.add_argument('--players', type=int, default=2)
+    p_serve.add_argument('--pieces', type=int, default=4)
+    p_serve.add_argument('--seed', type=int, help="서버 윷 난수 seed (재현용)")
+    p_load = sub.add_parser('load')
+    p_load.add_argument('--connect', metavar='HOST:PORT', help="떠 있는 서버에 건다 (없으면 새로 띄운다)")
+    p_load.add_argument('--matches', type=int, default=1000)
+    p_load.add_argument('--concurrency', type=int, default=200, help="동시에 진행하는 판 수")
+    p_load.add_argument('--players', type=int, default=2)
+    p_load.add_argument('--seed', type=int, default=0)
+    p_load.add_argument('--out', help="결과를 JSON 으로도 쓴다")
+    args = parser.parse_args()
+    _raise_fd_limit()
+
+    if args.command == 'serve':
+        if args.seed is not None:
+            random.seed(args.seed)
+        server = GameServer(args.players, args.pieces)
+
+        async def main():
+            host, port = await server.start(args.host, args.port)
+            print(f"listening on {host}:{port}", flush=True)
+            await server.serve_forever()
+
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            pass
+        print(json.dumps(server.stats))
+    else:
+        proc = None
+        if args.connect:
+            host, port = parse_address(args.connect)
+        else:
+            proc, host, port = spawn_server(args.players)
+        try:
+            report = asyncio.run(run_load(host, port, args.matches, args.concurrency, args.players, args.seed))
+        finally:
+            if proc:
+                proc.terminate()
+                proc.wait()
+        print(f"{report['matches']} matches in {report['wall_s']:.2f}s: {report['matches_per_s']:.0f} matches/s, "
+              f"{report['actions_per_s']:.0f} actions/s (concurrency {args.concurrency})")
+        print(f"move latency p50 {report['move_p50_ms']:.2f}ms  p99 {report['move_p99_ms']:.2f}ms; "
+              f"throw p99 {report['throw_p99_ms']:.2f}ms")
+        if args.out:
+            with open(args.out, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=1)
@@ -0,0 +1,149 @@
+"""스프라이트 아틀라스: 포켓몬 스프라이트를 한 번만 디코드해서 한 장에 모은다 (Pillow).
+
+작업 스레드(build_atlas / load_or_build)에서
+- PNG 를 디코드하고 투명한 테두리를 잘라 낸다 (PokeAPI 스프라이트는 96x96 중 대부분이 빈칸)
+- 배율(ZOOMS)마다, 그리고 업힌 말 표시(BADGE)용으로 미리 줄여 두고
+- 전부를 한 장의 PNG 로 모은다. 위치는 layout[이름][변형] = [x, y, w, h].
+완성된 아틀라스는 캐시 폴더의 atlas/ 에 스프라이트 내용 해시로 저장되므로 다음 실행부터는
+Pillow 작업도 없다.
+
+Tk 쪽(SpriteAtlas)은 아틀라스를 PhotoImage 로 한 번 읽고, (이름, 변형)마다 영역을 복사한
+PhotoImage 를 미리 만들어 둔다. 게임 중 다시 그리거나 창 크기가 바뀌어도 디코드/배율 조정
+없이 같은 PhotoImage 를 쓴다.
+
+Pillow 는 처음 아틀라스를 만들 때(작업 스레드에서) 불러온다. Pillow 가 없으면
+load_or_build 는 None 을 돌려주고 GUI 는 원본 스프라이트를 그대로 그린다.
+
+    png, layout = load_or_build({'pikachu': sprite_png, ...})
+    atlas = SpriteAtlas(root, png, layout)
+    canvas.create_image(x, y, image=atlas.photo('pikachu', 1.5))
+"""
+import hashlib
+import io
+import json
+import os
+
+ZOOMS = (0.75, 1.0, 1.5)  # 판 크기(기본 560px) 대비 배율. 창 크기에 가장 가까운 것을 고른다
+BADGE = 'badge'
+BADGE_SIZE = 20           # 업힌 말 표시용 작은 스프라이트의 긴 변(px)
+ATLAS_WIDTH = 256
+PADDING = 1               # 이웃 스프라이트가 번지지 않도록 띄우는 간격
+ATLAS_VERSION = 1
+
+
+def nearest_zoom(scale):
+    return min(ZOOMS, key=lambda zoom: abs(zoom - scale))
+
+
+def _pil_image():
+    try:
+        from PIL import Image
+    except ImportError:  # Pillow 가 없으면 아틀라스 없이 원본 크기로 그린다
+        return None
+    return Image
+
+
+def _variant_key(variant):
+    return variant if variant == BADGE else str(float(variant))
+
+
+def _variants(Image, png):
+    """PNG 하나 → {변형 키: RGBA 이미지}. 투명한 테두리는 잘라 낸다."""
+    img = Image.open(io.BytesIO(png)).convert('RGBA')
+    bbox = img.getchannel('A').getbbox()
+    if bbox:
+        img = img.crop(bbox)
+    w, h = img.size
+    out = {}
+    for zoom in ZOOMS:
+        size = (max(1, round(w * zoom)), max(1, round(h * zoom)))
+        out[_variant_key(zoom)] = img if size == img.size else img.resize(size, Image.Resampling.LANCZOS)
+    scale = BADGE_SIZE / max(w, h)
+    out[BADGE] = img.resize((max(1, round(w * scale)), max(1, round(h * scale))), Image.Resampling.LANCZOS)
+    return out
+
+
+def build_atlas(sprites):
+    """{이름: PNG 바이트} → (아틀라스 PNG 바이트, layout). Pillow 가 없으면 None."""
+    Image = _pil_image()
+    if Image is None:
+        return None
+    images = []
+    for name, png in sprites.items():
+        try:
+            variants = _variants(Image, png)
+        except (OSError, ValueError) as e:  # 깨진 PNG 는 빼고 (그 말은 대체 원으로 그린다)
+            print(f"Error decoding sprite for {name}: {e}")
+            continue
+        images += [(name, key, img) for key, img in variants.items()]
+
+    # 선반(shelf) 채우기: 키 큰 것부터 한 줄씩 왼쪽에서 오른쪽으로
+    images.sort(key=lambda item: -item[2].size[1])
+    width = max([ATLAS_WIDTH] + [img.size[0] + PADDING for _, _, img in images])
+    layout = {}
+    x = y = row_height = 0
+    for name, key, img in images:
+        w, h = img.size
+        if x + w > width:
+            x, y, row_height = 0, y + row_height + PADDING, 0
+        layout.setdefault(name, {})[key] = [x, y, w, h]
+        x += w + PADDING
+        row_height = max(row_height, h)
+
+    sheet = Image.new('RGBA', (width, max(1, y + row_height)), (0, 0, 0, 0))
+    for name, key, img in images:
+        sheet.paste(img, tuple(layout[name][key][:2]))
+    buf = io.BytesIO()
+    sheet.save(buf, 'PNG', compress_level=1)  # Tk 가 한 번 읽을 것이라 압축보다 읽기 속도
+    return buf.getvalue(), layout
+
+
+def load_or_build(sprites, cache_dir=None):
+    """캐시에 같은 스프라이트로 만든 아틀라스가 있으면 읽고, 없으면 만들어 저장한다."""
+    if _pil_image() is None:
+        return None
+    from yutnori.cache import _atomic_write, default_cache_dir
+
+    key = hashlib.sha256(json.dumps([
+        ATLAS_VERSION, ZOOMS, BADGE_SIZE,
+        sorted((name, hashlib.sha256(png).hexdigest()) for name, png in sprites.items()),
+    ]).encode()).hexdigest()
+    base = os.path.join(cache_dir or default_cache_dir(), 'atlas', key)
+    try:
+        with open(base + '.png', 'rb') as f:
+            png = f.read()
+        with open(base + '.json', 'rb') as f:
+            layout = json.loads(f.read())
+        os.utime(base + '.png')  # 캐시 LRU 기준 시각 갱신
+        return png, layout
+    except (OSError, ValueError):
+        pass
+
+    png, layout = build_atlas(sprites)
+    try:
+        _atomic_write(base + '.png', png)
+        _atomic_write(base + '.json', json.dumps(layout).encode())
+    except OSError as e:
+        print(f"Error caching sprite atlas: {e}")
+    return png, layout
+
+
+class SpriteAtlas:
+    """Tk 쪽: 아틀라스 PhotoImage 한 장과, 거기서 잘라 낸 (이름, 변형)별 PhotoImage."""
+
+    def __init__(self, master, png, layout):
+        import tkinter as tk
+
+        self.sheet = tk.PhotoImage(master=master, data=png)
+        self.layout = layout
+        # 복사는 픽셀 옮기기뿐이지만 그것도 게임 중에 하지 않도록 처음에 전부 만들어 둔다
+        self._photos = {}
+        for name, boxes in layout.items():
+            for key, (x, y, w, h) in boxes.items():
+                photo = tk.PhotoImage(master=master, width=w, height=h)
+                photo.copy_replace(self.sheet, from_coords=(x, y, x + w, y + h))
+                self._photos[name, key] = photo
+
+    def photo(self, name, variant=1.0):
+        """(이름, 배율 또는 BADGE)의 PhotoImage. 없으면 None."""
+        return self._photos.get((name, _variant_key(variant)))
@@ -0,0 +1,69 @@
+"""로컬 가짜 PokeAPI / 조언 API. 벤치마크(startup, render)와 네트워크 시험이 같이 쓴다.
+
+    with StubServer() as stub:
+        os.environ.update(stub.env)   # YUTNORI_POKEAPI_URL / YUTNORI_ADVICE_URL
+
+응답을 바꾸려면 StubHandler 를 상속해 do_GET 을 고쳐 handler 로 넘긴다.
+"""
+import json
+import struct
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def sprite_png(size=96, inner=40):
+    # PokeAPI 스프라이트처럼 투명한 테두리 안에 inner x inner 불투명 사각형이 있는 RGBA PNG
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    lo = (size - inner) // 2
+    rows = b''.join(b'\x00' + b''.join(b'\xff\x00\x00\xff' if lo <= x < lo + inner and lo <= y < lo + inner
+                                          else b'\x00\x00\x00\x00' for x in range(size))
+                    for y in range(size))
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b''))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    png = sprite_png()
+
+    def do_GET(self):
+        base = f"http://{self.server.server_address[0]}:{self.server.server_address[1]}"
+        parts = self.path.strip('/').split('/')
+        if parts[0] == 'pokemon':
+            body = json.dumps({'species': {'url': f"{base}/species/{parts[1]}/"},
+                               'sprites': {'front_default': f"{base}/sprite/{parts[1]}.png"}}).encode()
+        elif parts[0] == 'species':
+            body = json.dumps({'names': [{'language': {'name': 'ko'}, 'name': parts[1].upper()}]}).encode()
+        elif parts[0] == 'sprite':
+            body = self.png
+        else:
+            body = json.dumps({'slip': {'advice': 'stub'}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """127.0.0.1 의 임의 포트에서 도는 가짜 PokeAPI/조언 API. handler 로 응답을 바꿀 수 있다 (시험용)."""
+
+    def __init__(self, handler=StubHandler):
+        self.handler = handler
+
+    def __enter__(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self.handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        host, port = self.httpd.server_address
+        self.env = {'YUTNORI_POKEAPI_URL': f"http://{host}:{port}/pokemon/{{}}/",
+                    'YUTNORI_ADVICE_URL': f"http://{host}:{port}/advice"}
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,559 @@
+"""끝내기 승률/최선 수 테이블 (후퇴 분석 + 가치 반복, mmap 으로 여는 바이너리 파일).
+
+범위: 요청은 2인 × 말 4개의 도달 가능한 모든 국면이었지만, 이 모듈은 끝내기만 푼다.
+한 플레이어의 배치(업기, 판 밖 스택 포함)만 남은 말 0~4개에 1 + 38 + 734 + 9,615 + 96,143 개라
+두 플레이어 조합은 약 10^10 개이고, 층 3(51,820 국면)을 푸는 데 이미 몇 분 걸리는 순수 파이썬
+풀이기로는 닿을 수 없다. 그래서 체스 엔드게임 테이블처럼 "아직 안 들어간 말" 수의 합이
+max_total 이하인 국면만 푼다. 들어간 말은 더 이상 게임에 영향이 없으므로, 남은 말이
+(나 a, 상대 b) 개인 국면은 말 수와 상관없이 같은 국면이다. 테이블 밖 국면은 YutAI 의 탐색이 맡는다.
+
+- 상태 키: 차례인 플레이어와 상대의 말 위치 코드(fastsim) 4개씩을 정렬해 6비트씩 묶은 정수.
+  업힌 말은 같은 코드를 가지므로 키만으로 업기가 결정된다.
+  엔진/fastsim 처럼 출발칸의 스택이 빽도로 판 밖에 나가면 업힌 채로 남는다. 그런 스택은
+  OFF 대신 OFF_STACKS 코드(스택마다 하나, 큰 스택이 앞 코드)로 적는다.
+- 항목 키: 상태 키 << 8 | 남은 결과 번호(PENDING_INDEX, 0 은 던지기 직전).
+  값은 차례인 플레이어의 승률과 최선 수 한 바이트(결과 * 8 + groups() 안의 순번,
+  던지기 직전이거나 쓸 수 있는 결과가 없으면 NO_MOVE). 그래서 조회 때 탐색이 없다.
+  턴 진행은 fastsim 과 같은 순서(윷/모가 아닐 때까지 던지고, 잡으면 한 번 더)이고
+  던지기 분포는 THROW16 이다.
+- 남은 말 수의 합 t 가 작은 층부터 푼다. 턴 안에서 말이 들어가면 아래 층으로만 가므로
+  아래 층은 이미 확정값이고, 같은 층 안(잡기로 생기는 순환)은 가치 반복으로 수렴시킨다.
+- 한 턴에 윷/모가 MAX_PENDING 번 넘게 이어지면 마지막 결과에서 멈춘다고 본다
+  (빠지는 확률은 (1/8)^MAX_PENDING 이하).
+  그보다 긴 남은 결과는 테이블에 없으므로, 그때만 이번 턴을 펼치고 턴 끝 국면 값을 읽는다.
+
+    python -m yutnori.tablebase build --max-total 3
+    python -m yutnori.tablebase probe
+"""
+import itertools
+import mmap
+import os
+import struct
+import time
+from array import array
+
+from yutnori.fastsim import (
+    BACKDO, DONE, MO, N_POS, NEXT_POS, NODE_OF, OFF, PIECES, THROW16, YUT,
+)
+
+MAGIC = b'YUTTB\x00\x02\x00'  # 2: GUI 의 빽도 규칙, 판 밖 스택, (국면, 남은 결과)마다 최선 수
+HEADER = struct.Struct('<8sIIII')  # magic, max_total, max_pending, slot_bits, n_entries
+SLOT = struct.Struct('<QfB')  # 키, 승률, 최선 수
+EMPTY = (1 << 64) - 1
+NO_MOVE = 0xFF
+MAX_PENDING = 4
+# 남은 결과(정렬한 튜플) → 1 바이트 번호. 0 은 빈 튜플(던지기 직전)
+PENDING_INDEX = {pending: i for i, pending in enumerate(
+    p for n in range(MAX_PENDING + 1) for p in itertools.combinations_with_replacement(range(6), n))}
+THROW_PROBS = [(k, THROW16.count(k) / 16) for k in range(6) if THROW16.count(k)]
+FILENAME = 'tablebase.bin'
+OFF_STACKS = (N_POS, N_POS + 1)  # 업힌 채 판 밖에 있는 스택 (말 4개면 많아야 둘)
+WAITING = (OFF,) + OFF_STACKS
+
+
+def default_path():
+    from yutnori.cache import default_cache_dir
+
+    return os.path.join(default_cache_dir(), FILENAME)
+
+
+# ============ 상태 표현 ============
+def encode(mine, theirs):
+    key = 0
+    for code in mine + theirs:
+        key = (key << 6) | code
+    return key
+
+
+def entry_key(mine, theirs, pending=()):
+    """테이블 항목 키. pending 이 PENDING_INDEX 에 없으면(너무 길면) None."""
+    index = PENDING_INDEX.get(pending)
+    if index is None:
+        return None
+    return (encode(mine, theirs) << 8) | index
+
+
+def unfinished(side):
+    return PIECES - side.count(DONE)
+
+
+def on_board(code):
+    return DONE < code < N_POS
+
+
+def entered(side):
+    # 빽도로 턴이 끝나는지: 대기 중이 아닌 말(판 위 또는 다 들어간 말)이 있나 (FastGame.has_entered)
+    for code in side:
+        if code not in WAITING:
+            return True
+    return False
+
+
+def canonical(side):
+    """정렬한 튜플. 판 밖 스택이 둘이면 큰 쪽이, 하나면 그것이 OFF_STACKS[0] 이 되게 이름을 바꾼다."""
+    a, b = OFF_STACKS
+    if side.count(b) > side.count(a):
+        side = [b if c == a else a if c == b else c for c in side]
+    return tuple(sorted(side))
+
+
+def groups(side, k):
+    """결과 k 로 움직일 수 있는 그룹(위치 코드)들. 혼자 기다리는 말은 하나씩만 움직인다."""
+    seen = []
+    for code in side:
+        if code == DONE or code in seen or (k == BACKDO and code in WAITING):
+            continue
+        seen.append(code)
+    return seen
+
+
+def apply(mine, theirs, code, k):
+    """(새 mine, 새 theirs, 결과) — 결과 0: 보통, 1: 잡음, 2: 승리."""
+    dst = NEXT_POS[(OFF if code in OFF_STACKS else code) * 6 + k]
+    if code == OFF:
+        moved = list(mine)
+        moved[moved.index(OFF)] = dst
+    else:
+        if dst == OFF and mine.count(code) > 1:
+            # 출발칸의 스택이 빽도로 나가면 업힌 채로 기다린다
+            dst = OFF_STACKS[OFF_STACKS[0] in mine]
+        moved = [dst if c == code else c for c in mine]
+    if dst == DONE:
+        if moved.count(DONE) == PIECES:
+            return None, None, 2
+        return canonical(moved), theirs, 0
+    if not on_board(dst):
+        return canonical(moved), theirs, 0
+
+    node = NODE_OF[dst]
+    # 업기: 같은 노드의 아군은 모두 움직인 그룹의 위치로 합친다
+    moved = canonical([dst if on_board(c) and NODE_OF[c] == node else c for c in moved])
+    if any(on_board(c) and NODE_OF[c] == node for c in theirs):
+        # 잡힌 말은 스택이었어도 하나씩 기다린다
+        theirs = canonical([OFF if on_board(c) and NODE_OF[c] == node else c for c in theirs])
+        return moved, theirs, 1
+    return moved, theirs, 0
+
+
+def _waiting(left):
+    """기다리는 말 left 개를 혼자 기다리는 말과 판 밖 스택으로 나누는 방법들."""
+    a, b = OFF_STACKS
+    out = [[OFF] * left]
+    for s1 in range(2, left + 1):
+        out.append([a] * s1 + [OFF] * (left - s1))
+        for s2 in range(2, min(s1, left - s1) + 1):
+            out.append([a] * s1 + [b] * s2 + [OFF] * (left - s1 - s2))
+    return out
+
+
+def _sides(n_left):
+    """남은 말이 n_left 개인 한 플레이어의 가능한 배치 (업힌 말은 같은 노드, 다른 그룹은 다른 노드)."""
+    board = [c for c in range(DONE + 1, N_POS)]
+    result = set()
+
+    def place(left, nodes, acc):
+        for waiting in _waiting(left):
+            result.add(tuple(sorted(acc + waiting + [DONE] * (PIECES - n_left))))
+        if not left:
+            return
+        for code in board:
+            if NODE_OF[code] in nodes:
+                continue
+            if acc and code < max(acc):
+                continue
+            for size in range(1, left + 1):
+                place(left - size, nodes | {NODE_OF[code]}, acc + [code] * size)
+
+    place(n_left, frozenset(), [])
+    return result
+
+
+def layer_states(total):
+    """남은 말 수의 합이 total 인 (mine, theirs) 상태들 (둘 다 1개 이상, 노드 겹침 없음)."""
+    states = []
+    for a in range(1, min(total, PIECES + 1)):
+        b = total - a
+        if not 1 <= b <= PIECES:
+            continue
+        sides_b = _sides(b)
+        for mine in _sides(a):
+            mine_nodes = {NODE_OF[c] for c in mine if on_board(c)}
+            for theirs in sides_b:
+                if not any(on_board(c) and NODE_OF[c] in mine_nodes for c in theirs):
+                    states.append((mine, theirs))
+    return states
+
+
+# ============ 한 턴 계산 그래프 ============
+class _TurnGraph:
+    """한 턴을 던지기(확률 합) / 결정(최댓값) 노드의 DAG 로 펼친다.
+
+    값은 모두 ev 배열에 있고, 노드는 자식보다 늦게 만들어지므로 만든 순서대로 계산하면 된다.
+    leaf(mine, theirs) 는 턴이 끝난 국면의 ev 인덱스(턴을 끝낸 쪽 기준 승률)를 돌려준다.
+    턴 안에서는 잡을 때마다 상대 말이 줄어들어 순환이 생기지 않는다.
+    memo 의 키는 memo_key() 이고, 결정 노드 키의 값은 (ev 인덱스, 노드 번호)다
+    (쓸 수 있는 결과가 없어 턴을 넘기면 노드 번호는 -1).
+    """
+
+    def __init__(self, leaf, ev=None):
+        self.leaf = leaf
+        self.ev = ev if ev is not None else array('d')
+        self.is_throw = bytearray()
+        self.out = array('l')
+        self.start = array('l', [0])
+        self.children = array('l')
+        self.weights = array('d')  # 던지기: 확률, 결정: 결과 * 8 + groups() 안의 순번
+        self.memo = {}
+        self.win = self.const(1.0)
+
+    @staticmethod
+    def memo_key(mine, theirs, pending, throw):
+        key = entry_key(mine, theirs, pending)
+        if key is None:
+            return encode(mine, theirs), pending, throw  # 테이블보다 긴 남은 결과 (조회 때만 생긴다)
+        return (key << 1) | throw
+
+    def const(self, value):
+        self.ev.append(value)
+        return len(self.ev) - 1
+
+    def _node(self, throw, children, weights):
+        self.ev.append(0.0)
+        self.is_throw.append(throw)
+        self.out.append(len(self.ev) - 1)
+        self.children.extend(children)
+        self.weights.extend(weights)
+        self.start.append(len(self.children))
+        return len(self.ev) - 1
+
+    def throw(self, mine, theirs, pending):
+        key = self.memo_key(mine, theirs, pending, 1)
+        ref = self.memo.get(key)
+        if ref is not None:
+            return ref
+        children, weights = [], []
+        for k, p in THROW_PROBS:
+            if k == BACKDO and not entered(mine):
+                children.append(self.leaf(mine, theirs))
+            else:
+                more = tuple(sorted(pending + (k,)))
+                if (k == YUT or k == MO) and len(more) < MAX_PENDING:
+                    children.append(self.throw(mine, theirs, more))
+                else:
+                    children.append(self.decide(mine, theirs, more))
+            weights.append(p)
+        ref = self.memo[key] = self._node(1, children, weights)
+        return ref
+
+    def decide(self, mine, theirs, pending):
+        key = self.memo_key(mine, theirs, pending, 0)
+        found = self.memo.get(key)
+        if found is not None:
+            return found[0]
+        children, weights = [], []
+        for k in sorted(set(pending)):
+            rest = list(pending)
+            rest.remove(k)
+            rest = tuple(rest)
+            for rank, code in enumerate(groups(mine, k)):
+                m2, t2, result = apply(mine, theirs, code, k)
+                if result == 2:
+                    children.append(self.win)
+                elif result == 1:
+                    children.append(self.throw(m2, t2, rest))
+                elif rest:
+                    children.append(self.decide(m2, t2, rest))
+                else:
+                    children.append(self.leaf(m2, t2))
+                weights.append(k * 8 + rank)
+        if children:
+            ref = self._node(0, children, weights)
+            self.memo[key] = (ref, len(self.out) - 1)
+        else:
+            ref = self.leaf(mine, theirs)  # 쓸 수 있는 결과가 없으면 턴을 넘긴다
+            self.memo[key] = (ref, -1)
+        return ref
+
+    def evaluate(self):
+        ev, is_throw, out, start, children, weights = (
+            self.ev, self.is_throw, self.out, self.start, self.children, self.weights)
+        for j in range(len(out)):
+            a, b = start[j], start[j + 1]
+            if is_throw[j]:
+                v = 0.0
+                for c in range(a, b):
+                    v += ev[children[c]] * weights[c]
+            else:
+                v = -1.0
+                for c in range(a, b):
+                    if ev[children[c]] > v:
+                        v = ev[children[c]]
+            ev[out[j]] = v
+
+    def best_move(self, j):
+        """결정 노드 j(노드 번호)에서 가장 좋은 수 바이트 (결과 * 8 + 순번). j < 0 이면 NO_MOVE."""
+        if j < 0:
+            return NO_MOVE
+        ev, children = self.ev, self.children
+        best = max(range(self.start[j], self.start[j + 1]), key=lambda c: ev[children[c]])
+        return int(self.weights[best])
+
+    def decisions(self):
+        """(entry_key, 승률, 최선 수) — 지금 ev 로 본 모든 결정 노드."""
+        for key, found in self.memo.items():
+            if type(key) is int and not key & 1:
+                yield key >> 1, self.ev[found[0]], self.best_move(found[1])
+
+
+# ============ 풀이 ============
+def solve(max_total=3, tol=1e-7, max_iters=1000, log=print):
+    """{entry_key: (승률, 최선 수)}, 통계. 층 t = 2..max_total 순서로 풀고, 층 안은 가치 반복.
+
+    던지기 직전 국면과, 턴 안에서 지나가는 (국면, 남은 결과) 결정 노드를 모두 담는다.
+    """
+    values = {}   # 던지기 직전 국면의 승률 (아래 층의 턴 끝 값으로 쓴다)
+    entries = {}
+    stats = {'layers': []}
+    t_start = time.perf_counter()
+
+    for total in range(2, max_total + 1):
+        t0 = time.perf_counter()
+        states = layer_states(total)
+        n = len(states)
+        index = {encode(m, t): i for i, (m, t) in enumerate(states)}
+        # ev[i] (i < n) = 1 - V(states[i]): 상대가 턴을 넘겨받는 국면을 넘겨준 쪽 기준으로 본 값
+        ev = array('d', [0.5]) * n
+        consts = {}
+
+        def leaf(mine, theirs):
+            key = encode(theirs, mine)
+            i = index.get(key)
+            if i is not None:
+                return i
+            ref = consts.get(key)
+            if ref is None:
+                ref = consts[key] = graph.const(1.0 - values[key])
+            return ref
+
+        graph = _TurnGraph(leaf, ev)
+        roots = array('l', (graph.throw(m, t, ()) for m, t in states))
+        t_build = time.perf_counter() - t0
+
+        iters, delta = 0, 1.0
+        while delta > tol and iters < max_iters:
+            graph.evaluate()
+            delta = 0.0
+            for i in range(n):
+                v = 1.0 - ev[roots[i]]
+                if abs(v - ev[i]) > delta:
+                    delta = abs(v - ev[i])
+                ev[i] = v
+            iters += 1
+        for key, i in index.items():
+            values[key] = 1.0 - ev[i]
+            entries[key << 8] = (values[key], NO_MOVE)
+        # 수렴한 턴 끝 값으로 한 번 더 계산해서 결정 노드 값과 최선 수를 꺼낸다.
+        # 아래 층 국면의 결정 노드는 아래 층 풀이 때 이미 같은 값으로 들어가 있을 수 있다
+        graph.evaluate()
+        for key, v, move in graph.decisions():
+            entries.setdefault(key, (v, move))
+        info = {'total': total, 'states': n, 'nodes': len(graph.out), 'iterations': iters,
+                'delta': delta, 'build_seconds': t_build, 'seconds': time.perf_counter() - t0}
+        graph = None  # 다음 층을 펼치기 전에 메모와 노드 배열을 놓는다
+        stats['layers'].append(info)
+        if log:
+            log(f"layer {total}: {n} states, {info['nodes']} turn nodes, {iters} iterations, "
+                f"delta {delta:.2e}, build {t_build:.1f}s, total {info['seconds']:.1f}s")
+
+    stats['states'] = len(values)
+    stats['entries'] = len(entries)
+    stats['seconds'] = time.perf_counter() - t_start
+    return entries, stats
+
+
+def _slot_of(key, bits):
+    return ((key * 0x9E3779B97F4A7C15) & EMPTY) >> (64 - bits)
+
+
+def write(path, entries, max_total):
+    """열린 주소 해시 테이블(선형 탐사, 적재율 50% 이하)로 저장한다."""
+    bits = max(4, (2 * len(entries) - 1).bit_length())
+    size = 1 << bits
+    slots = [EMPTY] * size
+    vals = [(0.0, NO_MOVE)] * size
+    mask = size - 1
+    for key, entry in entries.items():
+        s = _slot_of(key, bits)
+        while slots[s] != EMPTY:
+            s = (s + 1) & mask
+        slots[s] = key
+        vals[s] = entry
+
+    buf = bytearray(HEADER.size + size * SLOT.size)
+    HEADER.pack_into(buf, 0, MAGIC, max_total, MAX_PENDING, bits, len(entries))
+    for s in range(size):
+        SLOT.pack_into(buf, HEADER.size + s * SLOT.size, slots[s], *vals[s])
+
+    from yutnori.cache import _atomic_write
+
+    _atomic_write(path, bytes(buf))
+
+
+# ============ 조회 ============
+class Tablebase:
+    """mmap 으로 연 테이블. 조회는 해시 한 번 + 짧은 선형 탐사."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # 잘리거나 다른 파일이면 조회 중에 깨지지 않도록 여기서 ValueError 로 거른다
+        if len(self.mm) < HEADER.size:
+            self.mm.close()
+            raise ValueError(f"truncated tablebase: {path}")
+        magic, self.max_total, self.max_pending, self.bits, self.n_entries = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            self.mm.close()
+            raise ValueError(f"not a yutnori tablebase: {path}")
+        if not 4 <= self.bits < 64 or len(self.mm) != HEADER.size + (SLOT.size << self.bits):
+            self.mm.close()
+            raise ValueError(f"truncated tablebase: {path}")
+        self.mask = (1 << self.bits) - 1
+
+    @classmethod
+    def open_default(cls):
+        """기본 위치에 테이블이 있으면 열고, 없거나 깨졌으면 None."""
+        path = os.environ.get('YUTNORI_TABLEBASE') or default_path()
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def close(self):
+        self.mm.close()
+
+    def _probe(self, mine, theirs, pending):
+        """(승률, 최선 수) 항목. 테이블 밖이면 None."""
+        if unfinished(mine) + unfinished(theirs) > self.max_total:
+            return None
+        key = entry_key(mine, theirs, pending)
+        if key is None:
+            return None
+        s = _slot_of(key, self.bits)
+        while True:
+            k, v, move = SLOT.unpack_from(self.mm, HEADER.size + s * SLOT.size)
+            if k == key:
+                return v, move
+            if k == EMPTY:
+                return None
+            s = (s + 1) & self.mask
+
+    def lookup(self, mine, theirs, pending=()):
+        """차례인 쪽(mine)이 pending 을 들고 있을 때의 승률. 테이블 밖이면 None."""
+        if unfinished(mine) == 0:
+            return 0.0  # 이미 상대가 이겼을 수는 없다 — 방어용
+        entry = self._probe(mine, theirs, pending)
+        return None if entry is None else entry[0]
+
+    def covers(self, game):
+        mine, theirs = sides_of(game)
+        return unfinished(mine) + unfinished(theirs) <= self.max_total
+
+    def win_probability(self, game):
+        """game(FastGame) 의 차례인 플레이어가 이길 확률. 남은 결과가 있으면 그것까지 쓴 기댓값."""
+        mine, theirs = sides_of(game)
+        if unfinished(mine) + unfinished(theirs) > self.max_total:
+            return None
+        pending = _pending_tuple(game)
+        entry = self._probe(mine, theirs, pending)
+        if entry is not None:
+            return entry[0]
+        return self._turn(mine, theirs, pending)[0]
+
+    def best_action(self, game):
+        """남은 결과가 있는 game 에서 둘 FastGame 행동(말 번호 * 8 + 결과), 없으면 None."""
+        mine, theirs = sides_of(game)
+        if unfinished(mine) + unfinished(theirs) > self.max_total:
+            return None
+        pending = _pending_tuple(game)
+        if not pending:
+            return None
+        entry = self._probe(mine, theirs, pending)
+        move = entry[1] if entry is not None else self._turn(mine, theirs, pending)[1]
+        if move == NO_MOVE:
+            return None
+        k = move >> 3
+        code = groups(mine, k)[move & 7]
+        base = game.player * PIECES
+        codes = _codes(game, base)
+        for i in range(base, base + PIECES):
+            if game.grp[i] == i and codes[i - base] == code:
+                return i * 8 + k
+        return None
+
+    def _turn(self, mine, theirs, pending):
+        # 테이블에 없는 긴 남은 결과: 이번 턴만 펼치고, 턴이 끝난 국면은 테이블에서 읽는다
+        def leaf(m, t):
+            v = self.lookup(t, m)
+            return graph.const(0.5 if v is None else 1.0 - v)
+
+        graph = _TurnGraph(leaf)
+        graph.decide(mine, theirs, pending)
+        graph.evaluate()
+        ref, j = graph.memo[graph.memo_key(mine, theirs, pending, 0)]
+        return graph.ev[ref], graph.best_move(j)
+
+
+def _codes(game, base):
+    """플레이어 하나의 말마다 위치 코드. 판 밖에 업힌 채 있는 스택은 OFF_STACKS 코드로."""
+    pos, grp = game.pos, game.grp
+    # 업힌 말은 그룹 대표 말의 위치로 본다 (합쳐진 뒤 방향이 다를 수 있다)
+    codes = [pos[grp[i]] if on_board(pos[i]) else pos[i] for i in range(base, base + PIECES)]
+    stacks = {}
+    for i in range(base, base + PIECES):
+        if pos[i] == OFF:
+            stacks.setdefault(grp[i], []).append(i - base)
+    # 큰 스택부터 OFF_STACKS 앞 코드 (canonical 과 같은 순서)
+    stacks = sorted((members for members in stacks.values() if len(members) > 1), key=len, reverse=True)
+    for code, members in zip(OFF_STACKS, stacks):
+        for j in members:
+            codes[j] = code
+    return codes
+
+
+def _pending_tuple(game):
+    return tuple(k for k in range(6) for _ in range(game.pending[k]))
+
+
+def sides_of(game):
+    """FastGame → (차례인 쪽 위치 코드들, 상대 위치 코드들)."""
+    me, other = game.player * PIECES, (1 - game.player) * PIECES
+    return canonical(_codes(game, me)), canonical(_codes(game, other))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="끝내기 승률 테이블")
+    parser.add_argument('command', choices=['build', 'probe'])
+    parser.add_argument('--max-total', type=int, default=3, help="풀 국면의 남은 말 수 합 상한")
+    parser.add_argument('--out', default=None)
+    args = parser.parse_args()
+    path = args.out or default_path()
+
+    if args.command == 'build':
+        entries, stats = solve(args.max_total)
+        write(path, entries, args.max_total)
+        try:
+            import resource  # POSIX 에만 있다
+
+            peak = f", peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB"
+        except ImportError:
+            peak = ''
+        print(f"{stats['states']} states, {stats['entries']} entries in {stats['seconds']:.1f}s{peak} → {path} "
+              f"({os.path.getsize(path)} bytes)")
+    else:
+        tb = Tablebase(path)
+        solo = (OFF,) + (DONE,) * (PIECES - 1)
+        print(f"{tb.n_entries} entries, max total {tb.max_total}")
+        print(f"1 vs 1, both waiting: {tb.lookup(solo, solo):.4f}")
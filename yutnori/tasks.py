@@ -0,0 +1,113 @@
+"""Tk 메인 루프를 막지 않고 비동기 작업을 돌리는 작은 브리지.
+
+백그라운드 스레드에서 asyncio 이벤트 루프를 돌리고, 끝난 작업은 큐에 넣는다.
+Tk 쪽은 after() 로 큐를 비우면서 콜백을 메인 스레드에서 부른다.
+
+    runner = TaskRunner(root)
+    task = runner.submit(get_advice, on_done=show, deadline=3)
+    task.cancel()
+
+submit 은 코루틴, concurrent.futures.Future, 일반 함수(스레드에서 실행)를 받는다.
+이벤트 루프 쪽 코드가 Tk 에 알릴 것이 있으면 runner.post(콜백, 인자...) 로 큐에 넣는다.
+"""
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import traceback
+
+
+class Task:
+    __slots__ = ('future', 'on_done', 'on_error', 'cancelled')
+
+    def __init__(self, on_done, on_error):
+        self.future = None
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+
+    def cancel(self):
+        """결과가 와도 콜백을 부르지 않는다. 아직 돌고 있으면 코루틴도 취소한다."""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class TaskRunner:
+    def __init__(self, widget, poll_ms=20):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self.loop = asyncio.new_event_loop()
+        self._finished = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self.loop.run_forever, name='yutnori-tasks', daemon=True)
+        self._thread.start()
+        self._closed = False
+        self._after_id = widget.after(poll_ms, self._poll)
+
+    def submit(self, work, on_done=None, on_error=None, deadline=None):
+        """work 를 이벤트 루프에서 돌리고, deadline 초가 지나면 TimeoutError 로 끝낸다."""
+        task = Task(on_done, on_error)
+
+        async def run():
+            if asyncio.iscoroutine(work):
+                awaitable = work
+            elif isinstance(work, concurrent.futures.Future):
+                awaitable = asyncio.wrap_future(work)
+            else:
+                awaitable = asyncio.to_thread(work)
+            return await asyncio.wait_for(awaitable, deadline)
+
+        task.future = asyncio.run_coroutine_threadsafe(run(), self.loop)
+        task.future.add_done_callback(lambda _: self._finished.put(task))
+        return task
+
+    def post(self, callback, *args):
+        """아무 스레드에서나: 다음 _poll 때 Tk 메인 스레드에서 callback(*args)."""
+        self._finished.put((callback, args))
+
+    def _poll(self):
+        # Tk 메인 스레드: 끝난 작업의 콜백만 부르고 바로 돌아간다.
+        # 콜백 하나가 예외를 내도 나머지를 부르고, 다음 _poll 도 반드시 예약한다
+        try:
+            while True:
+                try:
+                    task = self._finished.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(task, tuple):
+                    self._call(task[0], *task[1])
+                    continue
+                if task.cancelled or task.future.cancelled():
+                    continue
+                error = task.future.exception()
+                if error is None:
+                    if task.on_done:
+                        self._call(task.on_done, task.future.result())
+                elif task.on_error:
+                    self._call(task.on_error, error)
+                else:
+                    print(f"Background task failed: {error!r}")
+        finally:
+            if not self._closed:
+                self._after_id = self.widget.after(self.poll_ms, self._poll)
+
+    @staticmethod
+    def _call(callback, *args):
+        try:
+            callback(*args)
+        except Exception:
+            print(f"Task callback {getattr(callback, '__qualname__', callback)!s} failed:")
+            traceback.print_exc()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.widget.after_cancel(self._after_id)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,74 @@
+"""윷 던지기: 윷가락 16가지 조합 조회표와 한꺼번에 던지기.
+
+윷가락 4개(일반 3개 + 표시된 1개)는 4비트 조합 하나로 나타낸다.
+비트 0~2 는 일반 윷가락, 비트 3 은 표시된 윷가락이고 1 이면 평평한 면이다.
+조합마다 결과(THROW16)와 화면에 보일 모양(VISUALS16)을 미리 만들어 두므로
+던지기는 난수 4비트 하나와 표 조회로 끝난다.
+
+    results = throw_batch(1_000_000, rng=42)            # bytearray, 값은 윷 결과 번호
+    results, visuals = throw_batch(3, rng, visuals=True)
+"""
+import random
+
+# 윷 결과 번호: 빽도=0, 도=1, 개=2, 걸=3, 윷=4, 모=5
+YUT_NAMES = ('빽도', '도', '개', '걸', '윷', '모')
+YUT_STEPS = (-1, 1, 2, 3, 4, 5)
+BACKDO, YUT, MO = 0, 4, 5
+
+YUT_SYMBOL = {'flat': '▮', 'round': '▯', 'flat_x': '▮', 'round_x': 'X'}
+
+THROW16 = []
+VISUALS16 = []    # 결과 화면: 빽도면 표시된 윷가락을 X 로
+ANIMATION16 = []  # 굴러가는 중 화면: 윷가락 모양 그대로, 한 줄 문자열
+for bits in range(16):
+    flat = bin(bits).count('1')
+    sticks = [('flat' if bits >> j & 1 else 'round') for j in range(3)]
+    sticks.append('flat_x' if bits & 8 else 'round_x')
+    visuals = [YUT_SYMBOL[s] for s in sticks]
+    ANIMATION16.append(" ".join(visuals))
+    if flat == 1 and bits & 8:
+        THROW16.append(BACKDO)
+        visuals[3] = 'X'
+    else:
+        THROW16.append((MO, 1, 2, 3, YUT)[flat])
+    VISUALS16.append(tuple(visuals))
+
+# 난수 바이트 하나 = 조합 두 개. 아래/위 4비트를 바로 결과 번호로 바꾸는 번역표
+_LOW = bytes(THROW16[b & 15] for b in range(256))
+_HIGH = bytes(THROW16[b >> 4] for b in range(256))
+_LOW_COMBO = bytes(b & 15 for b in range(256))
+_HIGH_COMBO = bytes(b >> 4 for b in range(256))
+
+
+def make_rng(rng=None):
+    """None(새 난수열), 정수/문자열 seed, random.Random 중 하나를 random.Random 으로."""
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+def throw_batch(n, rng=None, visuals=False):
+    """n 번 던진 결과 번호(bytearray). visuals=True 면 조합마다 모양 튜플 리스트도 함께."""
+    rng = make_rng(rng)
+    raw = rng.getrandbits(8 * ((n + 1) // 2) or 8).to_bytes((n + 1) // 2 or 1, 'little')
+    results = bytearray(2 * len(raw))
+    results[0::2] = raw.translate(_LOW)
+    results[1::2] = raw.translate(_HIGH)
+    del results[n:]
+    if not visuals:
+        return results
+    combos = bytearray(2 * len(raw))
+    combos[0::2] = raw.translate(_LOW_COMBO)
+    combos[1::2] = raw.translate(_HIGH_COMBO)
+    return results, [VISUALS16[c] for c in combos[:n]]
+
+
+def throw_one(rng=random):
+    """(결과 이름, 모양 리스트). rng 는 getrandbits 가 있는 무엇이든 (기본: random 모듈)."""
+    combo = rng.getrandbits(4)
+    return YUT_NAMES[THROW16[combo]], list(VISUALS16[combo])
+
+
+def counts(results):
+    """결과 번호 배열 → 결과별 개수 (빽도, 도, 개, 걸, 윷, 모)."""
+    return tuple(results.count(k) for k in range(6))
@@ -0,0 +1,139 @@
+"""정책끼리 대량으로 붙여 보는 멀티프로세스 토너먼트.
+
+    python -m yutnori.tournament --games 1000000 --policies random lead capture stack
+
+모든 정책 쌍을 자리(선/후)를 번갈아 가며 --games 판씩 두게 한다.
+판은 --chunk 단위 작업으로 나뉘고, 작업마다 (seed, 정책 쌍, 작업 번호)로 만든
+독립 난수열을 쓰므로 워커 수나 실행 순서와 상관없이 결과가 같다.
+"""
+import argparse
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from yutnori.fastsim import FastGame
+from yutnori.policies import POLICIES
+
+
+def wilson_interval(wins, games, z=1.96):
+    if not games:
+        return 0.0, 1.0
+    p = wins / games
+    denom = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denom
+    half = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denom
+    return center - half, center + half
+
+
+def _play_chunk(task):
+    """(a, b, 판 수, seed, 작업 번호) → (a 승, b 승, 선 플레이어 승)."""
+    a, b, n_games, seed, chunk = task
+    rng = random.Random(f"{seed}:{a}:{b}:{chunk}")
+    game = FastGame()
+    pa, pb = POLICIES[a], POLICIES[b]
+    a_wins = first_wins = 0
+    for g in range(n_games):
+        a_first = g % 2 == 0
+        winner = game.play((pa, pb) if a_first else (pb, pa), rng)
+        if winner == 0:
+            first_wins += 1
+        if (winner == 0) == a_first:
+            a_wins += 1
+    return a, b, a_wins, n_games - a_wins, first_wins
+
+
+def make_tasks(policies, games, chunk, seed):
+    if len(set(policies)) < 2:
+        raise ValueError("서로 다른 정책이 둘 이상 필요하다")
+    if games < 1 or chunk < 1:
+        raise ValueError("games 와 chunk 는 1 이상이어야 한다")
+    tasks = []
+    for a, b in itertools.combinations(policies, 2):
+        for c, start in enumerate(range(0, games, chunk)):
+            tasks.append((a, b, min(chunk, games - start), seed, c))
+    return tasks
+
+
+def run(policies, games, workers=None, chunk=10000, seed=0):
+    """토너먼트를 돌리고 정책 쌍별 (a 승, b 승)과 선 플레이어 승 수를 모은다."""
+    tasks = make_tasks(policies, games, chunk, seed)
+    pairs = {pair: [0, 0] for pair in itertools.combinations(policies, 2)}
+    first_wins = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for a, b, a_wins, b_wins, first in pool.map(_play_chunk, tasks):
+            pairs[a, b][0] += a_wins
+            pairs[a, b][1] += b_wins
+            first_wins += first
+    return pairs, first_wins
+
+
+def format_report(policies, pairs, first_wins):
+    lines = []
+    totals = {p: [0, 0] for p in policies}
+    for (a, b), (a_wins, b_wins) in pairs.items():
+        totals[a][0] += a_wins
+        totals[a][1] += a_wins + b_wins
+        totals[b][0] += b_wins
+        totals[b][1] += a_wins + b_wins
+
+    lines.append(f"{'policy':<10} {'games':>10} {'win rate':>9}  95% CI")
+    for p in sorted(policies, key=lambda p: -totals[p][0] / max(totals[p][1], 1)):
+        wins, games = totals[p]
+        lo, hi = wilson_interval(wins, games)
+        lines.append(f"{p:<10} {games:>10} {wins / max(games, 1):>9.4f}  [{lo:.4f}, {hi:.4f}]")
+
+    # 쌍별 표: 행 정책이 열 정책을 이긴 비율
+    lines.append("")
+    lines.append(f"{'row vs col':<10} " + " ".join(f"{p:>9}" for p in policies))
+    for a in policies:
+        cells = []
+        for b in policies:
+            if a == b:
+                cells.append(f"{'-':>9}")
+            elif (a, b) in pairs:
+                w, l = pairs[a, b]
+                cells.append(f"{w / max(w + l, 1):>9.4f}")
+            else:
+                l, w = pairs[b, a]
+                cells.append(f"{w / max(w + l, 1):>9.4f}")
+        lines.append(f"{a:<10} " + " ".join(cells))
+
+    total_games = sum(w + l for w, l in pairs.values())
+    lo, hi = wilson_interval(first_wins, total_games)
+    lines.append("")
+    lines.append(f"first player win rate {first_wins / max(total_games, 1):.4f}  [{lo:.4f}, {hi:.4f}]")
+    return "\n".join(lines)
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 한다: {text}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="윷놀이 정책 토너먼트")
+    parser.add_argument('--games', type=_positive_int, default=10000, help="정책 쌍마다 둘 판 수")
+    parser.add_argument('--policies', nargs='+', default=list(POLICIES), choices=list(POLICIES))
+    parser.add_argument('--workers', type=_positive_int, default=os.cpu_count())
+    parser.add_argument('--chunk', type=_positive_int, default=10000, help="작업 하나에 들어가는 판 수")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    args.policies = list(dict.fromkeys(args.policies))
+    if len(args.policies) < 2:
+        parser.error("서로 다른 정책을 둘 이상 주어야 한다")
+
+    t0 = time.perf_counter()
+    pairs, first_wins = run(args.policies, args.games, args.workers, args.chunk, args.seed)
+    dt = time.perf_counter() - t0
+    total = sum(w + l for w, l in pairs.values())
+    print(format_report(args.policies, pairs, first_wins))
+    print(f"\n{total} games in {dt:.2f}s ({total / dt:.0f} games/s, {args.workers} workers)")
+
+
+if __name__ == '__main__':
+    main()